@@ -6,11 +6,19 @@ from .advanced import Grammar as Grammar
 from .advanced import LinearBoundedAutomaton as LinearBoundedAutomaton
 from .advanced import PushdownAutomaton as PushdownAutomaton
 from .advanced import TuringMachine as TuringMachine
+from .checkpoint import Checkpointer as Checkpointer
+from .constants import ANY as ANY
+from .constants import SAME as SAME
+from .deciders import Certificate as Certificate
+from .deciders import Deciders as Deciders
+from .deltas import StepDelta as StepDelta
 from .exception import AddError as AddError
 from .exception import AutomatonError as AutomatonError
 from .exception import AutomatonException as AutomatonException
 from .exception import AutomatonGroup as AutomatonGroup
+from .exception import LimitExceeded as LimitExceeded
 from .exception import ModifyError as ModifyError
+from .exception import NonHalting as NonHalting
 from .exception import ReadError as ReadError
 from .exception import RemoveComponentError as RemoveComponentError
 from .exception import RemoveError as RemoveError
@@ -18,6 +26,10 @@ from .exception import SearchError as SearchError
 from .exception import ValidationError as ValidationError
 from .extended import ExtendedLBA as ExtendedLBA
 from .extended import ExtendedTuringMachine as ExtendedTuringMachine
+from .extended import MultiTapeTuringMachine as MultiTapeTuringMachine
+from .limits import Limits as Limits
+from .status import StepStatus as StepStatus
+from .symbols import SymbolClass as SymbolClass
 
 base_path = Path(os.path.abspath(__file__))
 __version__ = "0.1.0"
@@ -13,17 +13,137 @@ building more complex compilers or language processors.
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
-
-from .constants import CHOMSKY_GRAMMARS
+import asyncio
+import os
+import struct
+import time
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .checkpoint import Checkpointer, load_checkpoint
+from .constants import ANY, CHOMSKY_GRAMMARS, SAME
+from .deciders import Deciders
+from .definition import MachineDefinition, PushdownDefinition
+from .deltas import StepDelta
 from .exception import (
     AddError,
     ModifyError,
+    NonHalting,
     ReadError,
     RemoveComponentError,
     RemoveError,
     ValidationError,
 )
+from .limits import Limits
+from .search import ConfigurationSearch, ParallelSearch, SearchResult
+from .status import StepStatus
+from .symbols import ClassTable, SymbolClass, index_classes
+from .tracing import HotLoopTracer
+
+
+def _run_slice(machine: Automaton, max_steps: int, parent_pid: int) -> tuple:
+    """
+    Run one slice of :meth:`TuringMachine.arun` in an executor.
+
+    In a process executor the machine is a copy, so its configuration is sent back to
+    be restored on the original machine.
+
+    :param machine: The machine, or a copy of it.
+    :type machine: Automaton
+    :param max_steps: Number of steps of the slice.
+    :type max_steps: int
+    :param parent_pid: Process id of the event loop.
+    :type parent_pid: int
+    :return: The steps executed, whether the machine got stuck, and its configuration
+             when running in another process (``None`` otherwise).
+    :rtype: tuple
+    """
+    steps, stuck = machine._run_loop(max_steps)
+    configuration = machine.fork_configuration() if os.getpid() != parent_pid else None
+    return steps, stuck, configuration
+
+
+def _default_transition(index: dict, state: Any, symbol: Any) -> Optional[tuple]:
+    """
+    Look up the rule of ``state`` for a ``symbol`` without a rule of its own: the first
+    symbol-class rule containing ``symbol``, else the default rule of the state. The
+    expansion of a default rule is cached for ``symbol`` in ``index``; class matches are
+    not, so that the index does not grow with the symbols of the classes.
+
+    :param index: Transition index built by :meth:`TuringMachine._transition_index`.
+    :type index: dict
+    :param state: Current state.
+    :type state: Any
+    :param symbol: Symbol read.
+    :type symbol: Any
+    :return: ``(state_to, write_symbol, move_direction)``, or ``None`` if the state has no
+             matching class rule nor default rule.
+    :rtype: tuple | None
+    """
+    classes = index.get((state, SymbolClass))
+    if classes is not None:
+        rule = classes.get(symbol)
+        if rule is not None:
+            if rule[1] is SAME:
+                rule = (rule[0], symbol, rule[2])
+            return rule
+    rule = index.get((state, ANY))
+    if rule is None:
+        return None
+    state_to, write_symbol, move_direction = rule
+    rule = (state_to, symbol if write_symbol is SAME else write_symbol, move_direction)
+    index[(state, symbol)] = rule
+    return rule
+
+
+def _resolve_pushed(pushed: Tuple[Any, ...], top: Any) -> Tuple[Any, ...]:
+    """
+    Replace ``SAME`` by the popped ``top`` in the symbols pushed by a PDA rule.
+
+    :param pushed: Pushed symbols, in push order.
+    :type pushed: Tuple[Any, ...]
+    :param top: The popped stack top.
+    :type top: Any
+    :return: The pushed symbols, unchanged if they do not contain ``SAME``.
+    :rtype: Tuple[Any, ...]
+    """
+    if SAME not in pushed:
+        return pushed
+    return tuple(top if symbol is SAME else symbol for symbol in pushed)
+
+
+def _in_state(state: Any, configuration: tuple) -> bool:
+    """Tell whether a search configuration is in ``state``; picklable acceptance test."""
+    return configuration[0] == state
+
+
+class _BranchIndex(dict):
+    """
+    Mapping ``(state, symbol)`` to the branches of a nondeterministic machine, falling back
+    to the branches of the first matching symbol class, then to the default branches of the
+    state.
+    """
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        branches = dict.get(self, key)
+        if branches is None:
+            classes = dict.get(self, (key[0], SymbolClass))
+            branches = classes.get(key[1]) if classes is not None else None
+            if branches is not None:
+                return [
+                    (state_to, key[1] if write_symbol is SAME else write_symbol, move_direction)
+                    for state_to, write_symbol, move_direction in branches
+                ]
+            defaults = dict.get(self, (key[0], ANY))
+            if defaults is None:
+                return default
+            branches = [
+                (state_to, key[1] if write_symbol is SAME else write_symbol, move_direction)
+                for state_to, write_symbol, move_direction in defaults
+            ]
+            self[key] = branches
+        return branches
 
 
 class Grammar:
@@ -113,6 +233,9 @@ class Automaton:
         name (str): The name of the automaton. This can be used to identify different types of automata.
         grammar (Grammar): An empty Grammar object initialized as part of the automaton. The grammar can
                            be populated later with terminals, non-terminals, and rules.
+        frozen (bool): ``True`` once :meth:`freeze` has been called. A frozen automaton cannot
+                       be modified (its mutators raise ``ModifyError``) and runs on its
+                       trusted execution path.
     """
 
     GRAMMAR: str = ""
@@ -135,8 +258,40 @@ class Automaton:
         else:
             raise KeyError(f"Chomsky hierarchy: key '{chomsky}' not recognized.")
         self.grammar = Grammar(self)
+        self.frozen = False
+
+    def freeze(self) -> None:
+        """
+        Validates the whole automaton once and switches it to its trusted execution path.
+
+        The checks repeated by every step of an unfrozen automaton (alphabet membership,
+        state registration, move validity) are performed here on every rule instead, so that
+        execution can skip them. Any later modification of the automaton raises
+        :class:`~fsm_tools.exception.ModifyError` (see :meth:`_check_mutable`).
+
+        :raises ValidationError: If a rule refers to an unknown symbol, state or move.
+        """
+        self._validate_definition()
+        self.frozen = True
+
+    def _validate_definition(self) -> None:
+        """
+        Checks the consistency of the whole automaton before it is frozen.
+
+        The base automaton has no execution model, so there is nothing to check.
+        """
+
+    def _check_mutable(self) -> None:
+        """
+        Refuses modifications of a frozen automaton.
+
+        :raises ModifyError: If the automaton is frozen.
+        """
+        if self.frozen:
+            raise ModifyError(self.GRAMMAR, "grammar", name=self.name)
 
     def change_classification(self, classification: str):
+        self._check_mutable()
         if classification in CHOMSKY_GRAMMARS.keys():
             self.GRAMMAR = CHOMSKY_GRAMMARS[classification]
             self.TYPE = CHOMSKY_GRAMMARS[classification] - 1
@@ -164,7 +319,9 @@ class Automaton:
 
         :param terminals: One or more terminal symbols to be added.
         :raise AddError: If a symbol is already in the alphabet or states.
+        :raise ModifyError: If the automaton is frozen.
         """
+        self._check_mutable()
         for symbol in terminals:
             if symbol not in self.grammar.alphabet and symbol not in self.grammar.states:
                 self.grammar.alphabet.add(symbol)
@@ -177,7 +334,9 @@ class Automaton:
 
         :param terminals: One or more terminal symbols to be removed.
         :raise RemoveError: If a symbol is not found in the alphabet.
+        :raise ModifyError: If the automaton is frozen.
         """
+        self._check_mutable()
         for symbol in terminals:
             if symbol in self.grammar.alphabet:
                 self.grammar.alphabet.remove(symbol)
@@ -207,6 +366,7 @@ class Automaton:
 
         :raise ReadError: If the alphabet is empty when trying to withdraw terminals.
         """
+        self._check_mutable()
         if len(self.grammar.alphabet) == 0:
             raise ReadError(self.GRAMMAR, "alphabet")
         else:
@@ -231,7 +391,9 @@ class Automaton:
 
         :param non_terminals: One or more non-terminal symbols to be added.
         :raise AddError: If a symbol is already in the states.
+        :raise ModifyError: If the automaton is frozen.
         """
+        self._check_mutable()
         for symbol in non_terminals:
             if symbol not in self.grammar.states:
                 self.grammar.states.add(symbol)
@@ -244,7 +406,9 @@ class Automaton:
 
         :param non_terminals: One or more non-terminal symbols to be removed.
         :raise RemoveError: If a symbol is not found in the states.
+        :raise ModifyError: If the automaton is frozen.
         """
+        self._check_mutable()
         for symbol in non_terminals:
             if symbol in self.grammar.states:
                 self.grammar.states.remove(symbol)
@@ -274,6 +438,7 @@ class Automaton:
 
         :raise ReadError: If the states are empty when trying to withdraw non-terminals.
         """
+        self._check_mutable()
         if len(self.grammar.states) == 0:
             raise ReadError(self.GRAMMAR, "states")
         else:
@@ -297,7 +462,9 @@ class Automaton:
         Adds production rules to the grammar.
 
         :param rules: One or more production rules to be added.
+        :raise ModifyError: If the automaton is frozen.
         """
+        self._check_mutable()
         for rule in rules:
             if rule not in self.grammar.rules:
                 self.grammar.rules.append(rule)
@@ -308,7 +475,9 @@ class Automaton:
 
         :param rules: One or more production rules to be removed.
         :raise RemoveError: If a rule is not found in the grammar's list of rules.
+        :raise ModifyError: If the automaton is frozen.
         """
+        self._check_mutable()
         for rule in rules:
             if rule not in self.grammar.rules:
                 raise RemoveError(self.GRAMMAR, "rules", symbol=rule)
@@ -321,6 +490,7 @@ class Automaton:
 
         :raise RemoveComponentError: If the rules are empty when trying to withdraw rules.
         """
+        self._check_mutable()
         if len(self.grammar.rules) == 0:
             raise RemoveComponentError(self.GRAMMAR, "rules")
         else:
@@ -332,6 +502,7 @@ class Automaton:
 
         This method provides a full reset of the grammar, clearing all its components.
         """
+        self._check_mutable()
         self.grammar.reset()
 
 
@@ -352,6 +523,8 @@ class TuringMachine(Automaton):
         tape (list): The tape (or tape array) that the Turing Machine operates on. Each cell in
                      the tape contains a symbol from the alphabet. The tape is considered
                      infinite in both directions, and its cells are initially filled with the blank symbol.
+                     When a tape backend is selected, the tape is an instance of that backend.
+        tape_backend (type): The class storing the tape instead of a list, or ``None``.
         head (int): The position of the read/write head on the tape. The head moves left or right
                     based on the machine's transition rules.
         register (str): The current state of the Turing Machine. This is used to determine the
@@ -427,6 +600,7 @@ class TuringMachine(Automaton):
         accept: str = "OK",
         reject: str = "nOK",
         chomsky: str = "Recursively Enumerable",
+        tape_backend: Optional[type] = None,
     ):
         """
         Initializes the Turing Machine with a given name and the blank symbol (defaults to "_").
@@ -447,11 +621,19 @@ class TuringMachine(Automaton):
         :type accept: str | "OK"
         :param reject: The reject state to be initialized.
         :type reject: str | "nOK"
+        :param tape_backend: Class storing the tape instead of a list, e.g.
+                             :class:`~fsm_tools.tapes.ZipperTape` (see :mod:`fsm_tools.tapes`).
+                             Backends are bidirectionally infinite and only support 1D tapes.
+        :type tape_backend: type | None
+        :raises ValueError: If a tape backend is requested for a tape of more than one axis.
         """
         super().__init__(name, chomsky=chomsky)
         self._validate_axes(axes)
+        if tape_backend is not None and axes != 1:
+            raise ValueError(f"Tape backends only support 1D tapes. Got axes={axes}.")
         self.axes = axes
-        self.tape = []
+        self.tape_backend = tape_backend
+        self.tape = [] if tape_backend is None else tape_backend(blank_symbol)
         self.head = [0] * axes
         self.moves = {}
         self.register = register
@@ -510,6 +692,8 @@ class TuringMachine(Automaton):
         :type location: list
         :raises IndexError: If the head position is negative.
         """
+        if self.tape_backend is not None:
+            return
         pos = location[0]
         if pos < 0:
             raise IndexError(
@@ -536,21 +720,28 @@ class TuringMachine(Automaton):
         :rtype: None        :raise ReadError: If any symbol in the tape_content is not part of the alphabet.
         """
 
+        classes = [rule[1] for rule in self.grammar.rules if isinstance(rule[1], SymbolClass)]
+
         def validate_content(list_content):
             if isinstance(list_content, list):
                 for sub_content in list_content:
                     validate_content(sub_content)
             else:
-                if list_content not in self.get_terminals():
+                if list_content not in self.get_terminals() and not any(
+                    list_content in symbol_class for symbol_class in classes
+                ):
                     raise ReadError(self.GRAMMAR, "alphabet", symbol=content)
 
         validate_content(content)
-        self.tape = content
-
         if location is None:
             location = [0] * self.axes
-
         self.head = location
+
+        if self.tape_backend is not None:
+            self.tape = self.tape_backend(self.blank, content)
+            return
+
+        self.tape = content
         self._extend_tape(self.head)
 
     def set_register(self, register: str) -> None:
@@ -577,11 +768,14 @@ class TuringMachine(Automaton):
         :return: None
         :rtype: None
         """
+        self._check_mutable()
         self.moves = moves
 
     def read(self) -> Any:
         """Read the symbol at the current position of the head."""
         self._extend_tape(self.head)
+        if self.tape_backend is not None:
+            return self.tape.read(self.head[0])
         current_cell = self.tape
         for index in self.head:
             if index < 0 or index >= len(current_cell):
@@ -593,18 +787,45 @@ class TuringMachine(Automaton):
         """
         Writes a symbol at the current head position on the multidimensional tape.
         The symbol is written based on the head's position across all dimensions.
-        If the symbol is not part of the alphabet, it is added automatically.
+        If the symbol is neither part of the alphabet nor matched by the symbol class of a
+        rule, it is added to the alphabet automatically.
 
         :param symbol: The symbol to write at the current head position.
         :type symbol: any
         """
         # Ensure that the symbol is part of the alphabet
-        if symbol not in self.grammar.alphabet:
+        if not self._in_alphabet(symbol):
             self.add_terminals(symbol)
+        self._write_cell(symbol)
+
+    def _in_alphabet(self, symbol: Any) -> bool:
+        """
+        Tell whether ``symbol`` is in the alphabet or matched by the symbol class read by a
+        rule, which stands for its symbols without enumerating them in the alphabet.
 
+        :param symbol: The symbol to test.
+        :type symbol: Any
+        :return: ``True`` if the machine already knows ``symbol``.
+        :rtype: bool
+        """
+        return symbol in self.grammar.alphabet or any(
+            isinstance(rule[1], SymbolClass) and symbol in rule[1] for rule in self.grammar.rules
+        )
+
+    def _write_cell(self, symbol: Any) -> None:
+        """
+        Write ``symbol`` at the current head position, without checking the alphabet.
+
+        :param symbol: The symbol to write at the current head position.
+        :type symbol: Any
+        """
         # Ensure that the tape is extended to accommodate the current head position.
         self._extend_tape(self.head)
 
+        if self.tape_backend is not None:
+            self.tape.write(self.head[0], symbol)
+            return
+
         # Navigate to the correct position in the tape using the head's position across all dimensions
         current_cell = self.tape
         for i, index in enumerate(self.head):
@@ -669,11 +890,14 @@ class TuringMachine(Automaton):
 
         :param state_from: The current state of the machine.
         :type state_from: str
-        :param symbol: The symbol under the head of the machine.
+        :param symbol: The symbol under the head of the machine, a
+                       :class:`~fsm_tools.symbols.SymbolClass` matching a set of symbols, or
+                       ``ANY`` for the default rule of ``state_from``, applied to the symbols
+                       without a rule of their own.
         :type symbol: any
         :param state_to: The current state of the machine.
         :type state_to: str
-        :param write_symbol: The symbol to write on the tape.
+        :param write_symbol: The symbol to write on the tape, or ``SAME`` to keep the symbol read.
         :type write_symbol: any
         :param move_direction: The direction to move the head, should be one of the valid directions in `self.move`.
         :type move_direction: str
@@ -683,7 +907,11 @@ class TuringMachine(Automaton):
         :raises ValueError: If the symbol is not in the alphabet of the Turing Machine.
         """
         # First, ensure the symbol is in the alphabet of the machine.
-        if symbol not in self.get_terminals():
+        if (
+            symbol is not ANY
+            and not isinstance(symbol, SymbolClass)
+            and symbol not in self.get_terminals()
+        ):
             raise ReadError(self.GRAMMAR, "alphabet", symbol=symbol)
 
         # Ensure that the direction is valid (either 'L' or 'R').
@@ -698,24 +926,1018 @@ class TuringMachine(Automaton):
                 self.add_non_terminals(state)
         self.add_rules(transition_rule)  # Adding the rule to the machine's grammar rules.
 
-    def step(self):
-        """Execute one step of the Turing Machine based on current state and symbol."""
-        current_symbol = self.read()
-        # Iterate over the transition rules in self.grammar.rules
+    def _per_tape(self, value: Any) -> tuple:
+        """
+        Return the per-tape values of a rule component: the machine has a single tape.
+
+        :param value: A symbol or move of a rule.
+        :type value: Any
+        :return: ``(value,)``.
+        :rtype: tuple
+        """
+        return (value,)
+
+    def _validate_definition(self) -> None:
+        """
+        Checks that the register and every rule only use known states, symbols and moves.
+
+        Written symbols must already be in the alphabet, since a frozen machine cannot
+        extend it while running.
+
+        :raises ValidationError: If the register or a rule is inconsistent.
+        """
+        states, alphabet = self.grammar.states, self.grammar.alphabet
+        if self.register not in states:
+            raise ValidationError(
+                self.GRAMMAR, "validation", reason=f"register '{self.register}' is not a state"
+            )
         for rule in self.grammar.rules:
             state_from, symbol, state_to, write_symbol, move_direction = rule
-            if self.register == state_from and current_symbol == symbol:
-                # Perform the transition: write, move, and change state
+            if state_from not in states or state_to not in states:
+                raise ValidationError(
+                    self.GRAMMAR, "validation", reason=f"rule {rule} uses an unknown state"
+                )
+            for used in self._per_tape(symbol) + self._per_tape(write_symbol):
+                if used in alphabet or used is ANY or used is SAME:
+                    continue
+                if not isinstance(used, SymbolClass):
+                    raise ValidationError(
+                        self.GRAMMAR,
+                        "validation",
+                        reason=f"rule {rule} uses unknown symbol {used!r}",
+                    )
+            for direction in self._per_tape(move_direction):
+                if direction not in self.moves:
+                    raise ValidationError(
+                        self.GRAMMAR,
+                        "validation",
+                        reason=f"rule {rule} uses unknown move {direction!r}",
+                    )
+
+    def freeze(self) -> None:
+        """
+        Validates the machine once and switches it to its trusted execution path.
+
+        :meth:`step` and :meth:`run` then look transitions up in an index built here and,
+        for a 1D list tape, access the tape directly without the alphabet, state and move
+        checks of :meth:`read`, :meth:`write` and :meth:`move`. Tape bounds are still
+        enforced.
+
+        :raises ValidationError: If the register or a rule is inconsistent.
+        """
+        super().freeze()
+        self._frozen_index = self._transition_index()
+        self._trusted_tape = self._traceable()
+        if self._trusted_tape:
+            self._frozen_moves = {
+                direction: self._move_delta(direction) for direction in self.moves
+            }
+
+    def _trusted_step(self) -> bool:
+        """
+        Execute one step of a frozen machine.
+
+        :return: ``False`` if no transition matches the current state and symbol.
+        :rtype: bool
+        """
+        if not self._trusted_tape:
+            current_symbol = self.read()
+            rule = self._frozen_index.get((self.register, current_symbol))
+            if rule is None:
+                rule = _default_transition(self._frozen_index, self.register, current_symbol)
+                if rule is None:
+                    return False
+            state_to, write_symbol, move_direction = rule
+            # freeze() validated every rule: the symbol needs no alphabet check.
+            self._write_cell(write_symbol)
+            self.move(move_direction)
+            self.register = state_to
+            return True
+
+        tape, head = self.tape, self.head
+        pos = head[0]
+        if pos < 0 or pos >= len(tape):
+            self._extend_tape(head)
+            if pos < 0:
+                raise IndexError(f"Head position {head} is out of bounds.")
+        rule = self._frozen_index.get((self.register, tape[pos]))
+        if rule is None:
+            rule = _default_transition(self._frozen_index, self.register, tape[pos])
+            if rule is None:
+                return False
+        state_to, write_symbol, move_direction = rule
+        tape[pos] = write_symbol
+        head[0] = pos + self._frozen_moves[move_direction]
+        self.register = state_to
+        return True
+
+    def _run_trusted(self, max_steps: Optional[int]) -> Tuple[int, bool]:
+        """
+        Run loop of a frozen machine with a 1D list tape, see :meth:`_run_loop`.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: The number of steps executed, and whether the machine got stuck.
+        :rtype: Tuple[int, bool]
+        """
+        index, deltas = self._frozen_index, self._frozen_moves
+        halting = (self.validation["accept"], self.validation["reject"])
+        tape, head = self.tape, self.head
+        register, pos, steps = self.register, head[0], 0
+        stuck = False
+        try:
+            while register not in halting and (max_steps is None or steps < max_steps):
+                if pos < 0 or pos >= len(tape):
+                    head[0] = pos
+                    self._extend_tape(head)
+                    if pos < 0:
+                        raise IndexError(f"Head position {head} is out of bounds.")
+                rule = index.get((register, tape[pos]))
+                if rule is None:
+                    rule = _default_transition(index, register, tape[pos])
+                    if rule is None:
+                        stuck = True
+                        break
+                register, write_symbol, move_direction = rule
+                tape[pos] = write_symbol
+                pos += deltas[move_direction]
+                steps += 1
+        finally:
+            head[0] = pos
+            self.register = register
+        return steps, stuck
+
+    def _advance(self) -> bool:
+        """
+        Apply the first rule matching the current state and symbol.
+
+        :return: ``False`` if no transition matches, in which case nothing is changed.
+        :rtype: bool
+        :raises IndexError: If the head is out of the tape.
+        """
+        if self.frozen:
+            return self._trusted_step()
+        return self._apply_rule(self.read())
+
+    def _match_rule(self, current_symbol: Any) -> Optional[tuple]:
+        """
+        Return the first rule of the register reading ``current_symbol`` or, failing that,
+        the first rule of the register whose symbol class contains ``current_symbol``, or
+        else the first default rule (reading ``ANY``) of the register.
+
+        :param current_symbol: The symbol read.
+        :type current_symbol: Any
+        :return: The rule, or ``None`` if no rule applies.
+        :rtype: tuple | None
+        """
+        matched = default = None
+        for rule in self.grammar.rules:
+            if rule[0] == self.register:
+                if rule[1] is ANY:
+                    if default is None:
+                        default = rule
+                elif isinstance(rule[1], SymbolClass):
+                    if matched is None and current_symbol in rule[1]:
+                        matched = rule
+                elif rule[1] == current_symbol:
+                    return rule
+        return matched or default
+
+    def _apply_rule(self, current_symbol: Any) -> bool:
+        """
+        Apply the rule matching the register and ``current_symbol``, see :meth:`_match_rule`.
+
+        :param current_symbol: The symbol read.
+        :type current_symbol: Any
+        :return: ``False`` if no transition matches, in which case nothing is changed.
+        :rtype: bool
+        """
+        rule = self._match_rule(current_symbol)
+        if rule is None:
+            return False
+        _, _, state_to, write_symbol, move_direction = rule
+        # Perform the transition: write, move, and change state
+        self.write(current_symbol if write_symbol is SAME else write_symbol)
+        self.move(move_direction)
+        self.register = state_to
+        if state_to not in self.get_states():
+            self.add_non_terminals(state_to)  # Add the new state to the set of states
+        return True
+
+    def _stuck_error(self) -> Exception:
+        """Build the exception raised by :meth:`step` and :meth:`run` when no rule matches."""
+        return Exception(
+            f"No valid transition for state '{self.register}' and symbol '{self.read()}'."
+        )
+
+    def _status(self) -> StepStatus:
+        """
+        Return the status of the current register.
+
+        :return: ``ACCEPTED``, ``REJECTED`` or ``RUNNING``.
+        :rtype: StepStatus
+        """
+        if self.register == self.validation["accept"]:
+            return StepStatus.ACCEPTED
+        if self.register == self.validation["reject"]:
+            return StepStatus.REJECTED
+        return StepStatus.RUNNING
+
+    def step(self):
+        """Execute one step of the Turing Machine based on current state and symbol."""
+        if not self._advance():
+            raise self._stuck_error()
+
+    def step_status(self) -> StepStatus:
+        """
+        Execute one step and report its outcome instead of raising.
+
+        A machine already in its accept or reject state does not move.
+
+        :return: ``RUNNING`` after a transition to a non-halting state, ``ACCEPTED`` or
+                 ``REJECTED`` once in a halting state, ``STUCK`` if no transition matches
+                 and ``OUT_OF_TAPE`` if the head is out of the tape.
+        :rtype: StepStatus
+        """
+        status = self._status()
+        if status is not StepStatus.RUNNING:
+            return status
+        try:
+            if not self._advance():
+                return StepStatus.STUCK
+        except IndexError:
+            return StepStatus.OUT_OF_TAPE
+        return self._status()
+
+    def _transition_index(self) -> dict:
+        """
+        Index the transition rules by ``(state_from, symbol)``.
+
+        When several rules share the same key, the first one in ``self.grammar.rules``
+        wins, which is the rule :meth:`step` would apply. The symbol-class rules of a state
+        are grouped in a :class:`~fsm_tools.symbols.ClassTable` under
+        ``(state_from, SymbolClass)``, and default rules are indexed under
+        ``(state_from, ANY)``; both are looked up with :func:`_default_transition` when a
+        ``(state, symbol)`` pair has no entry. ``SAME`` is replaced by the symbol read,
+        except in class and default rules.
+
+        :return: Mapping ``(state_from, symbol) -> (state_to, write_symbol, move_direction)``.
+        :rtype: dict
+        """
+        index = {}
+        for state_from, symbol, state_to, write_symbol, move_direction in self.grammar.rules:
+            if write_symbol is SAME and symbol is not ANY and not isinstance(symbol, SymbolClass):
+                write_symbol = symbol
+            index.setdefault((state_from, symbol), (state_to, write_symbol, move_direction))
+        return index_classes(index)
+
+    def _move_delta(self, direction: str) -> int:
+        """
+        Return the head displacement of a move on the 1D tape.
+
+        :param direction: A key of ``self.moves``.
+        :type direction: str
+        :return: Signed displacement of the head.
+        :rtype: int
+        """
+        delta = self.moves[direction]
+        return delta[0] if isinstance(delta, list) else delta
+
+    def _traceable(self) -> bool:
+        """
+        Tell whether hot loops of this machine can be compiled by :mod:`fsm_tools.tracing`.
+
+        Compiled traces access ``self.tape`` as a plain Python list, so they are only
+        available to 1D machines that keep the list-based tape and the tape accessors
+        of ``TuringMachine``.
+
+        :return: ``True`` if the machine supports trace compilation.
+        :rtype: bool
+        """
+        cls = type(self)
+        # The accessors are checked first: a PDA overrides them and has no tape nor axes.
+        return (
+            cls.read is TuringMachine.read
+            and cls.write is TuringMachine.write
+            and cls.move is TuringMachine.move
+            and self.axes == 1
+            and isinstance(self.tape, list)
+        )
+
+    def _run_loop(self, max_steps: Optional[int]) -> Tuple[int, bool]:
+        """
+        Indexed run loop shared by :meth:`run` and :meth:`run_status`.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: The number of steps executed, and whether the machine got stuck.
+        :rtype: Tuple[int, bool]
+        :raises IndexError: If the head is out of the tape.
+        """
+        if self.frozen and self._trusted_tape:
+            return self._run_trusted(max_steps)
+
+        index = self._frozen_index if self.frozen else self._transition_index()
+        halting = (self.validation["accept"], self.validation["reject"])
+        steps = 0
+        while self.register not in halting and (max_steps is None or steps < max_steps):
+            current_symbol = self.read()
+            rule = index.get((self.register, current_symbol))
+            if rule is None:
+                rule = _default_transition(index, self.register, current_symbol)
+                if rule is None:
+                    return steps, True
+            state_to, write_symbol, move_direction = rule
+            self.write(write_symbol)
+            self.move(move_direction)
+            self.register = state_to
+            steps += 1
+        return steps, False
+
+    def _run_decided(self, max_steps: Optional[int], deciders: Deciders) -> Tuple[int, bool]:
+        """
+        Indexed run loop tracking the records of the head for ``deciders``. It stops early
+        once a decider proves that the machine never halts.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :param deciders: The non-halting detectors.
+        :type deciders: Deciders
+        :return: The number of steps executed, and whether the machine got stuck.
+        :rtype: Tuple[int, bool]
+        :raises IndexError: If the head is out of the tape.
+        """
+        index = self._frozen_index if self.frozen else self._transition_index()
+        halting = (self.validation["accept"], self.validation["reject"])
+        head = self.head
+        low, high, swing_low, swing_high = deciders.extent
+        done = deciders.steps
+        steps = 0
+        try:
+            while self.register not in halting and (max_steps is None or steps < max_steps):
+                current_symbol = self.read()
+                rule = index.get((self.register, current_symbol))
+                if rule is None:
+                    rule = _default_transition(index, self.register, current_symbol)
+                    if rule is None:
+                        return steps, True
+                state_to, write_symbol, move_direction = rule
                 self.write(write_symbol)
                 self.move(move_direction)
                 self.register = state_to
-                if state_to not in self.get_states():
-                    self.add_non_terminals(state_to)  # Add the new state to the set of states
-                break  # Exit after finding and executing a valid rule
+                steps += 1
+                position = head[0]
+                if position < swing_low:
+                    swing_low = position
+                if position > swing_high:
+                    swing_high = position
+                if position > high:
+                    high = position
+                    if deciders.record(self, done + steps, 1, swing_low, low, high):
+                        break
+                    swing_low = position
+                elif position < low:
+                    low = position
+                    if deciders.record(self, done + steps, -1, swing_high, low, high):
+                        break
+                    swing_high = position
+        finally:
+            deciders.extent = (low, high, swing_low, swing_high)
+            deciders.steps = done + steps
+        return steps, False
+
+    def _halted(self) -> bool:
+        """
+        Tell whether the machine has nothing left to execute.
+
+        :return: ``True`` once the register is the accept or reject state.
+        :rtype: bool
+        """
+        return self._status() is not StepStatus.RUNNING
+
+    def _tape_cells(self) -> int:
+        """
+        Return the number of tape cells held by the machine, checked by :class:`Limits`.
+
+        :return: The number of cells.
+        :rtype: int
+        """
+        return len(self.tape)
+
+    def _stack_depth(self) -> int:
+        """
+        Return the depth of the stack, checked by :class:`Limits`. A tape has no stack.
+
+        :return: ``0``.
+        :rtype: int
+        """
+        return 0
+
+    def _run_governed(
+        self,
+        max_steps: Optional[int],
+        limits: Optional[Limits] = None,
+        checkpoint: Optional[Checkpointer] = None,
+        deciders: Optional[Deciders] = None,
+    ) -> Tuple[int, bool]:
+        """
+        Run :meth:`_run_loop` in slices, checking the limits and writing the checkpoints
+        between two slices. A last checkpoint is written when the run stops. With
+        ``deciders``, the slices run :meth:`_run_decided` and the run stops when the
+        machine is proved not to halt.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :param limits: The budgets of the run.
+        :type limits: Limits | None
+        :param checkpoint: The checkpoint cadence of the run.
+        :type checkpoint: Checkpointer | None
+        :param deciders: The non-halting detectors of the run.
+        :type deciders: Deciders | None
+        :return: The number of steps executed, and whether the machine got stuck.
+        :rtype: Tuple[int, bool]
+        :raises LimitExceeded: If a limit is exceeded.
+        """
+        deadline = limits.deadline_from(time.monotonic()) if limits is not None else None
+        if checkpoint is not None:
+            checkpoint.start()
+        if deciders is not None:
+            deciders.start(self)
+        steps = 0
+        try:
+            while (max_steps is None or steps < max_steps) and not self._halted():
+                budget = checkpoint.slice_steps(steps) if checkpoint is not None else None
+                if limits is not None:
+                    budget = (
+                        limits.check_every if budget is None else min(budget, limits.check_every)
+                    )
+                    budget = limits.step_budget(self, steps, budget)
+                if max_steps is not None:
+                    budget = max_steps - steps if budget is None else min(budget, max_steps - steps)
+                if deciders is not None:
+                    done, stuck = self._run_decided(budget, deciders)
+                else:
+                    done, stuck = self._run_loop(budget)
+                steps += done
+                if stuck:
+                    return steps, True
+                if deciders is not None and deciders.certificate is not None:
+                    break
+                if limits is not None:
+                    limits.check(self, steps, deadline)
+                if checkpoint is not None:
+                    checkpoint.update(self, steps)
+        finally:
+            if checkpoint is not None:
+                checkpoint.save(self, steps)
+        return steps, False
+
+    def run(
+        self,
+        max_steps: Optional[int] = None,
+        hot_threshold: Optional[int] = None,
+        limits: Optional[Limits] = None,
+        checkpoint: Optional[Checkpointer] = None,
+        deciders: Optional[Deciders] = None,
+    ) -> int:
+        """
+        Run the machine until it enters the accept or reject state.
+
+        Transitions are looked up in an index built once per call, instead of the
+        linear scan of ``self.grammar.rules`` performed by :meth:`step`. The executed
+        transitions are the same as with repeated calls to :meth:`step`. A frozen machine
+        (see :meth:`freeze`) reuses its index and, with a 1D list tape, skips the checks of
+        :meth:`read`, :meth:`write` and :meth:`move`.
+
+        When ``hot_threshold`` is given, the run is profiled: ``(state, symbol)`` pairs
+        executed at least ``hot_threshold`` times anchor a trace of the state cycle that
+        follows, which is compiled into a specialised closure (see
+        :class:`~fsm_tools.tracing.HotLoopTracer`). Machines that do not support trace
+        compilation silently use the indexed loop.
+
+        When ``limits`` are given, the run is checked against them every
+        ``limits.check_every`` steps (see :mod:`fsm_tools.limits`). When a ``checkpoint``
+        is given, the configuration is written to disk periodically and when the run
+        stops (see :mod:`fsm_tools.checkpoint`). When ``deciders`` are given, the run stops
+        as soon as they prove that the machine never halts (see :mod:`fsm_tools.deciders`).
+        In these cases ``hot_threshold`` is ignored.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :param hot_threshold: Number of hits after which a transition is considered hot.
+        :type hot_threshold: int | None
+        :param limits: Budgets of the run.
+        :type limits: Limits | None
+        :param checkpoint: Checkpoint cadence of the run.
+        :type checkpoint: Checkpointer | None
+        :param deciders: Non-halting detectors of the run.
+        :type deciders: Deciders | None
+        :return: The number of steps executed.
+        :rtype: int
+        :raises Exception: If no transition matches the current state and symbol.
+        :raises LimitExceeded: If a limit is exceeded.
+        :raises NonHalting: If the deciders prove that the machine never halts.
+        """
+        if limits is not None or checkpoint is not None or deciders is not None:
+            steps, stuck = self._run_governed(max_steps, limits, checkpoint, deciders)
+        elif hot_threshold is not None and self._traceable():
+            return HotLoopTracer(self, hot_threshold).run(max_steps)
         else:
-            raise Exception(
-                f"No valid transition for state '{self.register}' and symbol '{current_symbol}'."
+            steps, stuck = self._run_loop(max_steps)
+        if stuck:
+            raise self._stuck_error()
+        if deciders is not None and deciders.certificate is not None:
+            raise NonHalting(self.GRAMMAR, deciders.certificate)
+        return steps
+
+    def resume(
+        self,
+        path: str,
+        max_steps: Optional[int] = None,
+        limits: Optional[Limits] = None,
+        checkpoint: Optional[Checkpointer] = None,
+    ) -> int:
+        """
+        Load the checkpoint written by a previous :meth:`run` and continue that run.
+
+        The machine must be built like the one that wrote the checkpoint. Without a
+        ``checkpoint`` argument, the run keeps writing checkpoints to ``path`` with the
+        cadence stored in the file.
+
+        :param path: Path of the checkpoint file.
+        :type path: str
+        :param max_steps: Maximum number of steps of the whole run, including the steps
+                          executed before the checkpoint. ``None`` means no limit.
+        :type max_steps: int | None
+        :param limits: Budgets of the resumed part of the run.
+        :type limits: Limits | None
+        :param checkpoint: Checkpoint cadence of the resumed run.
+        :type checkpoint: Checkpointer | None
+        :return: The number of steps of the whole run.
+        :rtype: int
+        :raises ValueError: If ``path`` is not a checkpoint of this machine.
+        :raises Exception: If no transition matches the current state and symbol.
+        :raises LimitExceeded: If a limit is exceeded.
+        """
+        header = load_checkpoint(self, path)
+        if checkpoint is None:
+            checkpoint = Checkpointer(path, **header["cadence"])
+        checkpoint.offset = header["steps"]
+        if max_steps is not None:
+            max_steps = max(0, max_steps - header["steps"])
+        return header["steps"] + self.run(max_steps, limits=limits, checkpoint=checkpoint)
+
+    def _tape_snapshot(self) -> Tuple[int, list]:
+        """
+        Return the tape as its lowest position and its cells, for checkpoints.
+
+        :return: The lowest position held and the cells from there.
+        :rtype: Tuple[int, list]
+        """
+        if self.tape_backend is not None:
+            return self.tape.start, self.tape.to_list()
+        return 0, list(self.tape)
+
+    def _load_tape_snapshot(self, start: int, cells: list) -> None:
+        """
+        Replace the tape by the cells of a snapshot taken by :meth:`_tape_snapshot`.
+
+        :param start: Position of the first cell.
+        :type start: int
+        :param cells: The cells.
+        :type cells: list
+        """
+        if self.tape_backend is None:
+            self.tape = cells
+            return
+        self.tape = self.tape_backend(self.blank)
+        for position, symbol in enumerate(cells, start):
+            if symbol != self.blank:
+                self.tape.write(position, symbol)
+
+    def _tape_window(self, low: int, high: int) -> list:
+        """
+        Return the cells from ``low`` to ``high`` included, read by :class:`Deciders`.
+
+        :param low: Position of the first cell, already visited.
+        :type low: int
+        :param high: Position of the last cell, already visited.
+        :type high: int
+        :return: The cells.
+        :rtype: list
+        """
+        if self.tape_backend is not None:
+            return [self.tape.read(position) for position in range(low, high + 1)]
+        cells = self.tape[low : high + 1]
+        # The cell under the head is only allocated when it is read.
+        cells.extend([self.blank] * (high + 1 - low - len(cells)))
+        return cells
+
+    def _tape_floor(self) -> Optional[int]:
+        """
+        Return the lowest position of the tape, ``None`` if it is left-infinite.
+
+        :return: ``0``, unless the tape backend is two-way.
+        :rtype: int | None
+        """
+        return None if getattr(self.tape, "two_way", False) else 0
+
+    def _head_position(self) -> Any:
+        """
+        Return the head position in the form used by configurations and step deltas.
+
+        :return: The position on the 1D tape.
+        :rtype: int
+        """
+        return self.head[0]
+
+    def _head_delta(self, before: Any) -> Any:
+        """
+        Return the head displacement since ``before``, a result of :meth:`_head_position`.
+
+        :param before: Earlier head position.
+        :type before: Any
+        :return: The displacement, an ``int`` or a tuple like ``before``.
+        :rtype: Any
+        """
+        after = self._head_position()
+        if isinstance(after, tuple):
+            return tuple(a - b for a, b in zip(after, before))
+        return after - before
+
+    def iter_steps(self, max_steps: Optional[int] = None) -> Iterator[StepDelta]:
+        """
+        Run the machine like :meth:`run`, yielding one :class:`~fsm_tools.deltas.StepDelta`
+        per transition instead of requiring snapshots of the whole configuration.
+
+        The generator ends when the machine halts, gets stuck, leaves the tape or reaches
+        ``max_steps``; its return value (the ``StopIteration`` value, or the result of
+        ``yield from``) is the :class:`~fsm_tools.status.StepStatus` of the run.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: An iterator over the step deltas.
+        :rtype: Iterator[StepDelta]
+        """
+        rules = self.grammar.rules
+        index: dict = {}
+        for rule_id, rule in enumerate(rules):
+            index.setdefault((rule[0], rule[1]), rule_id)
+        index_classes(index)
+        steps = 0
+        while self._status() is StepStatus.RUNNING and (max_steps is None or steps < max_steps):
+            try:
+                current_symbol = self.read()
+            except IndexError:
+                return StepStatus.OUT_OF_TAPE
+            rule_id = index.get((self.register, current_symbol))
+            if rule_id is None and (self.register, SymbolClass) in index:
+                rule_id = index[(self.register, SymbolClass)].get(current_symbol)
+            if rule_id is None:
+                rule_id = index.get((self.register, ANY))
+                if rule_id is None:
+                    return StepStatus.STUCK
+            _, _, state_to, write_symbol, move_direction = rules[rule_id]
+            if write_symbol is SAME:
+                write_symbol = current_symbol
+            position = self._head_position()
+            self.write(write_symbol)
+            self.move(move_direction)
+            self.register = state_to
+            steps += 1
+            yield StepDelta(
+                steps,
+                rule_id,
+                state_to,
+                position,
+                current_symbol,
+                write_symbol,
+                self._head_delta(position),
             )
+        return self._status()
+
+    def run_status(
+        self,
+        max_steps: Optional[int] = None,
+        limits: Optional[Limits] = None,
+        deciders: Optional[Deciders] = None,
+    ) -> StepStatus:
+        """
+        Run the machine like :meth:`run`, and report how it stopped instead of raising.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :param limits: Budgets of the run.
+        :type limits: Limits | None
+        :param deciders: Non-halting detectors of the run. Their ``certificate`` holds the
+                         proof of a ``NON_HALTING`` status.
+        :type deciders: Deciders | None
+        :return: ``ACCEPTED`` or ``REJECTED`` if the machine halted, ``STUCK`` if no
+                 transition matched, ``OUT_OF_TAPE`` if the head left the tape,
+                 ``NON_HALTING`` if the deciders proved that it never halts, and
+                 ``RUNNING`` if ``max_steps`` was reached first.
+        :rtype: StepStatus
+        :raises LimitExceeded: If a limit is exceeded.
+        """
+        try:
+            if limits is not None or deciders is not None:
+                _, stuck = self._run_governed(max_steps, limits, deciders=deciders)
+            else:
+                _, stuck = self._run_loop(max_steps)
+        except IndexError:
+            return StepStatus.OUT_OF_TAPE
+        if deciders is not None and deciders.certificate is not None:
+            return StepStatus.NON_HALTING
+        return StepStatus.STUCK if stuck else self._status()
+
+    async def arun(
+        self,
+        max_steps: Optional[int] = None,
+        slice_steps: int = 1000,
+        executor: Optional[Executor] = None,
+        limits: Optional[Limits] = None,
+    ) -> int:
+        """
+        Run the machine like :meth:`run`, yielding to the event loop every ``slice_steps``
+        steps so that a long run does not block other tasks.
+
+        Each slice runs the indexed loop of :meth:`run` (the check-free loop once the
+        machine is frozen). Cancelling the task raises ``asyncio.CancelledError`` between
+        two slices and leaves the machine in a consistent configuration.
+
+        With an ``executor``, slices run in it instead of the event loop thread. With a
+        process executor, the machine is pickled for every slice and its configuration
+        restored afterwards. On cancellation, the slice in progress completes in the
+        executor, and with a process executor its configuration is discarded.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :param slice_steps: Number of steps executed between two yields to the event loop.
+        :type slice_steps: int
+        :param executor: Executor running the slices, e.g. a ``ThreadPoolExecutor``.
+        :type executor: concurrent.futures.Executor | None
+        :param limits: Budgets of the run, checked between two slices.
+        :type limits: Limits | None
+        :return: The number of steps executed.
+        :rtype: int
+        :raises ValueError: If ``slice_steps`` is less than 1.
+        :raises Exception: If no transition matches the current configuration.
+        :raises LimitExceeded: If a limit is exceeded.
+        """
+        if slice_steps < 1:
+            raise ValueError(f"slice_steps must be at least 1. Got {slice_steps}.")
+        loop = asyncio.get_running_loop()
+        deadline = None
+        if limits is not None:
+            slice_steps = min(slice_steps, limits.check_every)
+            deadline = limits.deadline_from(time.monotonic())
+        steps = 0
+        while max_steps is None or steps < max_steps:
+            budget = slice_steps if max_steps is None else min(slice_steps, max_steps - steps)
+            if limits is not None:
+                if self._halted():
+                    break
+                budget = limits.step_budget(self, steps, budget)
+            if executor is None:
+                done, stuck = self._run_loop(budget)
+            else:
+                done, stuck, configuration = await loop.run_in_executor(
+                    executor, _run_slice, self, budget, os.getpid()
+                )
+                if configuration is not None:
+                    self.restore_configuration(configuration)
+            steps += done
+            if stuck:
+                raise self._stuck_error()
+            if limits is not None:
+                limits.check(self, steps, deadline)
+            if done < budget:
+                break
+            await asyncio.sleep(0)
+        return steps
+
+    def _tape_bound(self) -> Optional[int]:
+        """
+        Return the number of cells of the tape, ``None`` if it is right-infinite.
+
+        :return: ``None``.
+        :rtype: int | None
+        """
+        return None
+
+    def definition(self) -> MachineDefinition:
+        """
+        Validate the machine and return an immutable snapshot of its definition, which
+        runs on its own configurations and can be shared by concurrent runs (see
+        :mod:`fsm_tools.definition`). The current register is the initial state of the
+        runs.
+
+        :return: The definition.
+        :rtype: MachineDefinition
+        :raises ValidationError: If a rule is inconsistent.
+        """
+        self._validate_definition()
+
+        def entry(rule):
+            state_to, write_symbol, move_direction = rule
+            return state_to, write_symbol, self._move_delta(move_direction)
+
+        transitions = {
+            key: value.map(entry) if isinstance(value, ClassTable) else entry(value)
+            for key, value in self._transition_index().items()
+        }
+        return MachineDefinition(
+            self.name,
+            self.blank,
+            self.register,
+            self.validation["accept"],
+            self.validation["reject"],
+            transitions,
+            self._tape_bound(),
+        )
+
+    def fork_configuration(self) -> tuple:
+        """
+        Return a copy of the current configuration, to resume from it later.
+
+        The configuration is ``(register, head, tape)``. The tape is copied, which is O(1)
+        with a :class:`~fsm_tools.tapes.PersistentTape` backend and O(tape length) otherwise,
+        so that the machine can keep running without altering the copy.
+
+        :return: The copied configuration.
+        :rtype: tuple
+        """
+        return self.register, list(self.head), self._copy_tape(self.tape)
+
+    def restore_configuration(self, configuration: tuple) -> None:
+        """
+        Put the machine back in a configuration returned by :meth:`fork_configuration`.
+
+        The tape is copied again, so the same configuration can be restored several times.
+
+        :param configuration: A configuration returned by :meth:`fork_configuration`.
+        :type configuration: tuple
+        """
+        register, head, tape = configuration
+        self.register = register
+        self.head = list(head)
+        self.tape = self._copy_tape(tape)
+
+    def _copy_tape(self, tape: Any) -> Any:
+        """
+        Return an independent copy of ``tape``, forking it when a tape backend is used.
+
+        :param tape: A tape of this machine.
+        :type tape: Any
+        :return: The copy.
+        :rtype: Any
+        """
+        return tape.fork() if self.tape_backend is not None else tape.copy()
+
+    def _configuration(self) -> tuple:
+        """
+        Return the canonical configuration of the machine for configuration-space search.
+
+        The configuration is ``(register, head, tape)`` where ``tape`` is a tuple without
+        its trailing blanks, so that two configurations differing only by the allocated
+        length of the tape are equal.
+
+        :return: The current configuration.
+        :rtype: tuple
+        """
+        end = len(self.tape)
+        while end and self.tape[end - 1] == self.blank:
+            end -= 1
+        return self.register, self.head[0], tuple(self.tape[:end])
+
+    def _head_allowed(self, position: Any) -> bool:
+        """
+        Tell whether the head may read at ``position``.
+
+        :param position: Head position, as stored in a configuration.
+        :type position: Any
+        :return: ``True`` if the position is on the tape.
+        :rtype: bool
+        """
+        return position >= 0
+
+    def _successors(self, configuration: tuple, index: dict) -> list:
+        """
+        Return every configuration reachable from ``configuration`` in one transition.
+
+        Branches whose head leaves the tape die, unless they enter the accept state, since
+        the machine halts there before reading again.
+
+        :param configuration: A configuration built by :meth:`_configuration`.
+        :type configuration: tuple
+        :param index: Mapping ``(state, symbol)`` to the list of ``(state_to, write_symbol,
+                      move_direction)`` branches.
+        :type index: dict
+        :return: The successor configurations.
+        :rtype: list
+        """
+        state, head, tape = configuration
+        accept = self.validation["accept"]
+        if state == accept or state == self.validation["reject"]:
+            return []
+        blank = self.blank
+        size = len(tape)
+        symbol = tape[head] if head < size else blank
+        successors = []
+        for state_to, write_symbol, move_direction in index.get((state, symbol), ()):
+            if head < size:
+                cells = tape[:head] + (write_symbol,) + tape[head + 1 :]
+            elif write_symbol == blank:
+                cells = tape
+            else:
+                cells = tape + (blank,) * (head - size) + (write_symbol,)
+            end = len(cells)
+            while end and cells[end - 1] == blank:
+                end -= 1
+            position = head + self._move_delta(move_direction)
+            if state_to == accept or self._head_allowed(position):
+                successors.append((state_to, position, cells[:end]))
+        return successors
+
+    def _branch_index(self) -> _BranchIndex:
+        """
+        Index every rule of the machine by its ``(state, symbol)`` pair, in rule order.
+
+        :return: Mapping ``(state, symbol)`` to the list of ``(state_to, write_symbol,
+                 move_direction)`` branches, symbol classes and defaults included.
+        :rtype: _BranchIndex
+        """
+        index = _BranchIndex()
+        for state_from, symbol, state_to, write_symbol, move_direction in self.grammar.rules:
+            if write_symbol is SAME and symbol is not ANY and not isinstance(symbol, SymbolClass):
+                write_symbol = symbol
+            index.setdefault((state_from, symbol), []).append(
+                (state_to, write_symbol, move_direction)
+            )
+        return index_classes(index)
+
+    def run_nondeterministic(
+        self,
+        max_steps: Optional[int] = None,
+        max_configurations: Optional[int] = None,
+        strategy: str = "bfs",
+        workers: Optional[int] = None,
+        visited: Optional[Callable[[], Any]] = None,
+    ) -> SearchResult:
+        """
+        Explore every computation branch of the machine from its current configuration.
+
+        Unlike :meth:`run`, every rule matching a ``(state, symbol)`` pair is applied, each
+        one leading to its own branch. Configurations are deduplicated, and the search
+        stops as soon as a branch enters the accept state. The machine itself is not
+        modified: the accepting configuration is available in the returned result.
+
+        With ``workers``, the branches are explored by that many processes (see
+        :class:`~fsm_tools.search.ParallelSearch`) instead of ``strategy``; the machine is
+        pickled once per worker.
+
+        :param max_steps: Maximum length of a branch. ``None`` means no limit.
+        :type max_steps: int | None
+        :param max_configurations: Maximum number of distinct configurations visited.
+                                   ``None`` means no limit.
+        :type max_configurations: int | None
+        :param strategy: ``"bfs"`` (breadth-first) or ``"iddfs"`` (iterative deepening).
+        :type strategy: str
+        :param workers: Number of worker processes of a parallel search. ``None`` searches
+                        in the current process.
+        :type workers: int | None
+        :param visited: Factory of the visited set, such as
+                        :class:`~fsm_tools.visited.BloomFilter` or
+                        :class:`~fsm_tools.visited.DiskSet`. ``None`` keeps an exact
+                        in-memory set.
+        :type visited: Callable | None
+        :return: The outcome of the search. Its ``verdict`` is ``None`` if a budget ran out.
+        :rtype: SearchResult
+        :raises ValueError: If the strategy is unknown, or if the machine uses a tape backend.
+        """
+        if self.tape_backend is not None:
+            raise ValueError("Nondeterministic runs are not supported with a tape backend.")
+        index = self._branch_index()
+        accept = self.validation["accept"]
+        if workers is not None:
+            parallel = ParallelSearch(
+                partial(self._successors, index=index),
+                partial(_in_state, accept),
+                workers=workers,
+                max_steps=max_steps,
+                max_configurations=max_configurations,
+                visited=visited,
+            )
+            return parallel.search(self._configuration())
+        search = ConfigurationSearch(
+            lambda configuration: self._successors(configuration, index),
+            lambda configuration: configuration[0] == accept,
+            strategy=strategy,
+            max_steps=max_steps,
+            max_configurations=max_configurations,
+            visited=visited,
+        )
+        return search.search(self._configuration())
 
 
 class LinearBoundedAutomaton(TuringMachine):
@@ -754,6 +1976,7 @@ class LinearBoundedAutomaton(TuringMachine):
         register: str = "",
         accept: str = "OK",
         reject: str = "nOK",
+        tape_backend: Optional[type] = None,
     ):
         """
         Initializes the Linear Bounded Automaton with a given name, dimensional limits, and blank symbol.
@@ -772,6 +1995,9 @@ class LinearBoundedAutomaton(TuringMachine):
         :type accept: str
         :param reject: The reject state.
         :type reject: str
+        :param tape_backend: Class storing the tape instead of a list (see
+                             :mod:`fsm_tools.tapes`). The tape limit is still enforced.
+        :type tape_backend: type | None
         """
         super().__init__(
             name,
@@ -782,6 +2008,7 @@ class LinearBoundedAutomaton(TuringMachine):
             accept=accept,
             reject=reject,
             chomsky="Context-Sensitive",
+            tape_backend=tape_backend,
         )
         if len(tape_size) == self.axes:
             self.limits = tape_size  # Input size, defining the tape size limit.
@@ -797,10 +2024,13 @@ class LinearBoundedAutomaton(TuringMachine):
         """
 
         for i, pos in enumerate(location):
-            if abs(pos) >= self.limits[i]:
+            # Backends accept negative positions: the bounded tape starts at 0 anyway.
+            if abs(pos) >= self.limits[i] or (pos < 0 and self.tape_backend is not None):
                 raise IndexError(
                     f"Head position {pos} is out of bounds. The tape size is limited to {self.limits[i]}."
                 )
+            if self.tape_backend is not None:
+                continue
 
             # Extend the tape, but ensure it doesn't exceed the input size limit
             while len(self.tape) <= pos:
@@ -825,10 +2055,36 @@ class LinearBoundedAutomaton(TuringMachine):
         super().set_tape(content, location)
         self._extend_tape(self.head)
 
-    def step(self):
+    def _tape_bound(self) -> Optional[int]:
+        """
+        Return the number of cells of the bounded tape.
+
+        :return: The tape limit.
+        :rtype: int
+        """
+        return self.limits[0]
+
+    def _head_allowed(self, position: Any) -> bool:
+        """
+        Tell whether the head may read at ``position`` without leaving the bounded tape.
+
+        :param position: Head position, as stored in a configuration.
+        :type position: Any
+        :return: ``True`` if the position is within the tape limit.
+        :rtype: bool
+        """
+        return 0 <= position < self.limits[0]
+
+    def _advance(self) -> bool:
         """
         Executes one step of the automaton based on the current state and the symbol under the head.
+
+        :return: ``False`` if no transition matches, in which case nothing is changed.
+        :rtype: bool
+        :raises IndexError: If the head is out of the bounded tape.
         """
+        if self.frozen:
+            return self._trusted_step()
         current_symbol = self.read()
         # Check if the head exceeds the tape boundaries
         for i, pos in enumerate(self.head):
@@ -838,21 +2094,165 @@ class LinearBoundedAutomaton(TuringMachine):
                 )
 
         # Apply transition rules
-        for rule in self.grammar.rules:
-            state_from, symbol, state_to, write_symbol, move_direction = rule
-            if self.register == state_from and current_symbol == symbol:
-                # Perform the transition: write, move, and change state
-                self.write(write_symbol)
-                self.move(move_direction)
-                self.register = state_to
-                if state_to not in self.get_states():
-                    self.add_non_terminals(state_to)
-                break
-        else:
-            raise Exception(
-                f"No valid transition for state '{self.register}' and symbol '{current_symbol}'."
+        return self._apply_rule(current_symbol)
+
+    def decide(
+        self,
+        word: Sequence[Any],
+        nondeterministic: Optional[bool] = None,
+        visited: Optional[Callable[[], Any]] = None,
+    ) -> bool:
+        """
+        Decide whether the LBA accepts ``word``, always halting with a verdict.
+
+        A run never leaves the ``limits[0]`` cells of the tape, so it has at most
+        ``|states| * limits[0] * |symbols| ** limits[0]`` configurations: it either halts,
+        or repeats a configuration and loops forever. Both are detected:
+
+        - a deterministic machine, whose ``(state, symbol)`` pairs have at most one rule, is
+          run with Brent's cycle detection, which keeps a single configuration aside;
+        - otherwise, every branch is explored by a breadth-first search of the
+          configuration graph, deduplicated through the ``visited`` backend (see
+          :mod:`fsm_tools.visited`).
+
+        Configurations are encoded as ``bytes``: the state and head codes, then one byte
+        per tape cell. A branch accepts when it enters the accept state, and rejects when
+        it enters the reject state, has no transition, moves its head off the tape or
+        loops. The run starts from the current register, the head on the first symbol of
+        ``word``; the machine itself is not modified.
+
+        :param word: The input word, at most ``limits[0]`` symbols long.
+        :type word: Sequence[Any]
+        :param nondeterministic: ``True`` explores every rule of a pair, ``False`` only the
+                                 first one, like :meth:`run`. ``None`` explores every rule
+                                 only if a pair has several.
+        :type nondeterministic: bool | None
+        :param visited: Factory of the visited set of the nondeterministic search. ``None``
+                        keeps an exact in-memory set; a
+                        :class:`~fsm_tools.visited.BloomFilter` may miss an accepting
+                        branch.
+        :type visited: Callable | None
+        :return: ``True`` if some branch accepts ``word``, ``False`` otherwise.
+        :rtype: bool
+        :raises ValueError: If the tape is not 1D, ``word`` exceeds the tape limit or the
+                            machine uses more than 256 symbols.
+        :raises ReadError: If a symbol of ``word`` is neither in the alphabet nor matched by a
+                           symbol class.
+        """
+        if self.axes != 1:
+            raise ValueError(f"Only 1D automata can be decided. Got axes={self.axes}.")
+        limit = self.limits[0]
+        if len(word) > limit:
+            raise ValueError(f"Input length {len(word)} exceeds the tape limit of {limit}.")
+
+        index = self._branch_index()
+        accept, reject = self.validation["accept"], self.validation["reject"]
+        # Codes 0 and 1 are the accept and reject states.
+        states = {accept: 0, reject: 1}
+        states.setdefault(self.register, len(states))
+        symbols = {self.blank: 0}
+        for state_from, read_symbol, state_to, write_symbol, _ in self.grammar.rules:
+            for state in (state_from, state_to):
+                states.setdefault(state, len(states))
+            for symbol in (read_symbol, write_symbol):
+                if symbol is not ANY and symbol is not SAME and not isinstance(symbol, SymbolClass):
+                    symbols.setdefault(symbol, len(symbols))
+        for symbol in self.grammar.alphabet:
+            symbols.setdefault(symbol, len(symbols))
+        # Symbols matched by a class only reach the tape through the word.
+        classes = [rule[1] for rule in self.grammar.rules if isinstance(rule[1], SymbolClass)]
+        for symbol in word:
+            if symbol not in symbols and any(symbol in symbol_class for symbol_class in classes):
+                symbols[symbol] = len(symbols)
+        if len(symbols) > 256:
+            raise ValueError(f"At most 256 symbols can be decided. Got {len(symbols)}.")
+        try:
+            cells = bytearray(symbols[symbol] for symbol in word)
+        except KeyError as e:
+            raise ReadError(self.GRAMMAR, "alphabet", symbol=e.args[0])
+        cells.extend(bytes(limit - len(cells)))
+
+        # Dense table: the branches of each (state, symbol) pair, as codes.
+        width = len(symbols)
+        table: List[Tuple[Tuple[int, int, int], ...]] = []
+        for state in states:
+            for symbol in symbols:
+                table.append(
+                    tuple(
+                        (states[state_to], symbols[write_symbol], self._move_delta(direction))
+                        for state_to, write_symbol, direction in index.get((state, symbol), ())
+                    )
+                )
+        if nondeterministic is None:
+            nondeterministic = any(len(branches) > 1 for branches in table)
+        if nondeterministic:
+            return self._decide_search(
+                table, width, limit, states[self.register], bytes(cells), visited
             )
 
+        state, head = states[self.register], 0
+        saved_state, saved_head, saved_cells = -1, -1, b""
+        power = steps = 1
+        while state > 1:
+            branches = table[state * width + cells[head]]
+            if not branches:
+                return False
+            state, cells[head], delta = branches[0]
+            head += delta
+            if not 0 <= head < limit:
+                return state == 0
+            # Brent: the configuration saved at each power of two steps is met again
+            # within the next power of two once the run is on its cycle.
+            if state == saved_state and head == saved_head and cells == saved_cells:
+                return False
+            if steps == power:
+                saved_state, saved_head, saved_cells = state, head, bytes(cells)
+                power *= 2
+                steps = 0
+            steps += 1
+        return state == 0
+
+    @staticmethod
+    def _decide_search(
+        table: List[Tuple[Tuple[int, int, int], ...]],
+        width: int,
+        limit: int,
+        start: int,
+        cells: bytes,
+        visited: Optional[Callable[[], Any]],
+    ) -> bool:
+        """
+        Breadth-first search of the configuration graph for :meth:`decide`.
+
+        Configurations are ``bytes``: the state and head codes, then the tape cells. State
+        ``0`` accepts, state ``1`` rejects.
+        """
+        header = struct.Struct("<Ii")
+        offset = header.size
+        written = [bytes((code,)) for code in range(width)]
+        accepting = header.pack(0, 0)[:4]
+
+        def successors(configuration: bytes) -> list:
+            state, head = header.unpack_from(configuration)
+            if state <= 1:
+                return []
+            position = offset + head
+            result = []
+            for state_to, write, delta in table[state * width + configuration[position]]:
+                if state_to == 0 or 0 <= head + delta < limit:
+                    result.append(
+                        header.pack(state_to, head + delta)
+                        + configuration[offset:position]
+                        + written[write]
+                        + configuration[position + 1 :]
+                    )
+            return result
+
+        search = ConfigurationSearch(
+            successors, lambda configuration: configuration.startswith(accepting), visited=visited
+        )
+        return search.search(header.pack(start, 0) + cells).verdict is True
+
 
 class PushdownAutomaton(LinearBoundedAutomaton):
     """
@@ -938,6 +2338,7 @@ class PushdownAutomaton(LinearBoundedAutomaton):
         :param symbol: Symbol to add.
         :raises AddError: If the symbol is already in the stack alphabet.
         """
+        self._check_mutable()
         if symbol in self.stack_alphabet:
             raise AddError(self.GRAMMAR, "stack", symbol=symbol)
         self.stack_alphabet.add(symbol)
@@ -1071,17 +2472,20 @@ class PushdownAutomaton(LinearBoundedAutomaton):
         - ``state_from``: state before the transition.
         - ``input_symbol``: input symbol consumed. ``None`` is reserved for
           epsilon-transitions (v0.3.0) and raises ``NotImplementedError`` here.
-        - ``stack_top``: symbol that must be on top of the stack (will be popped).
+        - ``stack_top``: symbol that must be on top of the stack (will be popped), or
+          ``ANY`` for a rule matching any top. A rule with an exact top always has
+          precedence over an ``ANY`` rule.
         - ``state_to``: state after the transition.
         - ``stack_ops``: list of symbols pushed after popping ``stack_top``.
           ``[]`` = pure pop; ``[X]`` = replace top with X;
           ``[X, Y]`` = pop then push Y, then X (X ends up on top).
+          ``SAME`` pushes back the popped top, e.g. ``[X, SAME]`` pushes X over it.
 
         :param state_from: Source state.
         :type state_from: str
         :param input_symbol: Input symbol consumed by this transition.
         :type input_symbol: Any
-        :param stack_top: Expected top-of-stack symbol (will be popped).
+        :param stack_top: Expected top-of-stack symbol (will be popped), or ``ANY``.
         :type stack_top: Any
         :param state_to: Target state.
         :type state_to: str
@@ -1103,11 +2507,11 @@ class PushdownAutomaton(LinearBoundedAutomaton):
         if input_symbol not in self.get_terminals():
             raise ReadError(self.GRAMMAR, "alphabet", symbol=input_symbol)
 
-        if stack_top not in self.stack_alphabet:
+        if stack_top is not ANY and stack_top not in self.stack_alphabet:
             raise AddError(self.GRAMMAR, "stack", symbol=stack_top)
 
         for sym in stack_ops:
-            if sym not in self.stack_alphabet:
+            if sym is not SAME and sym not in self.stack_alphabet:
                 raise AddError(self.GRAMMAR, "stack", symbol=sym)
 
         for state in (state_from, state_to):
@@ -1139,33 +2543,299 @@ class PushdownAutomaton(LinearBoundedAutomaton):
         :raises ReadError: If the stack is empty when trying to read the top.
         :raises Exception: If no matching transition is found.
         """
-        current_input = self._current_input()
+        if not self._advance():
+            raise self._stuck_error()
+
+    def _stuck_error(self) -> Exception:
+        """
+        Build the exception raised by :meth:`step` when no transition matches.
+
+        :raises RemoveComponentError: If the stack is empty.
+        """
         current_top = self.peek()
+        return Exception(
+            f"No valid transition for state='{self.register}', "
+            f"input='{self._current_input()}', stack_top='{current_top}'."
+        )
 
+    def _run_loop(self, max_steps: Optional[int]) -> Tuple[int, bool]:
+        """
+        Consume the input until its end, used by :meth:`run`, :meth:`run_status` and
+        :meth:`arun`.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: The number of steps executed, and whether the PDA got stuck.
+        :rtype: Tuple[int, bool]
+        """
+        steps = 0
+        while self._current_input() is not None and (max_steps is None or steps < max_steps):
+            if not self._advance():
+                return steps, True
+            steps += 1
+        return steps, False
+
+    def _status(self) -> StepStatus:
+        """
+        Return the status of the run: a PDA accepts by empty stack, once its input is
+        consumed, whatever the name of its state.
+
+        :return: ``RUNNING`` while input is left, then ``ACCEPTED`` if some input was
+                 consumed and only the bottom marker is on the stack, ``REJECTED``
+                 otherwise.
+        :rtype: StepStatus
+        """
+        if self._current_input() is not None:
+            return StepStatus.RUNNING
+        if self.input_pos > 0 and self.stack == [self.bottom_symbol]:
+            return StepStatus.ACCEPTED
+        return StepStatus.REJECTED
+
+    def _halted(self) -> bool:
+        """
+        Tell whether the PDA has nothing left to execute.
+
+        :return: ``True`` once the input is consumed.
+        :rtype: bool
+        """
+        return self._current_input() is None
+
+    def _tape_cells(self) -> int:
+        """
+        Return the number of tape cells held: a PDA has no tape.
+
+        :return: ``0``.
+        :rtype: int
+        """
+        return 0
+
+    def _tape_snapshot(self) -> Tuple[int, list]:
+        """Not applicable to PDA: checkpoints hold a single 1D tape."""
+        raise NotImplementedError("PushdownAutomaton does not use a tape: it has no checkpoint.")
+
+    def _stack_depth(self) -> int:
+        """
+        Return the depth of the stack, checked by :class:`Limits`.
+
+        :return: The number of symbols on the stack, bottom marker included.
+        :rtype: int
+        """
+        return len(self.stack)
+
+    def definition(self) -> PushdownDefinition:  # type: ignore[override]
+        """
+        Validate the PDA and return an immutable snapshot of its definition, which runs
+        on its own configurations and can be shared by concurrent runs (see
+        :mod:`fsm_tools.definition`).
+
+        :return: The definition.
+        :rtype: PushdownDefinition
+        :raises ValidationError: If no start state is defined or a rule is inconsistent.
+        """
+        if self.grammar.start is None:
+            raise ValidationError(self.GRAMMAR, "validation", reason="no start state defined")
+        self._validate_definition()
+        transitions = self._transition_index()
+        return PushdownDefinition(
+            self.name,
+            self.GRAMMAR,
+            self.grammar.start,
+            self.validation["accept"],
+            self.validation["reject"],
+            self.bottom_symbol,
+            self.grammar.alphabet,
+            transitions,
+        )
+
+    def fork_configuration(self) -> tuple:
+        """
+        Return a copy of the current configuration, to resume from it later.
+
+        :return: ``(register, input_pos, stack)``, with a copy of the stack.
+        :rtype: tuple
+        """
+        return self.register, self.input_pos, list(self.stack)
+
+    def restore_configuration(self, configuration: tuple) -> None:
+        """
+        Put the PDA back in a configuration returned by :meth:`fork_configuration`.
+
+        :param configuration: A configuration returned by :meth:`fork_configuration`.
+        :type configuration: tuple
+        """
+        register, input_pos, stack = configuration
+        self.register = register
+        self.input_pos = input_pos
+        self.stack = list(stack)
+
+    def _advance(self) -> bool:
+        """
+        Apply the first transition matching the state, the input symbol and the stack top,
+        or else the first one matching the state and the input symbol for any stack top.
+
+        :return: ``False`` if no transition matches or the stack is empty, in which case
+                 nothing is changed.
+        :rtype: bool
+        """
+        if self.frozen:
+            return self._trusted_step()
+        if not self.stack:
+            return False
+        current_input = self._current_input()
+        current_top = self.stack[-1]
+
+        default = None
         for rule in self.grammar.rules:
             state_from, input_symbol, stack_top, state_to, stack_ops = rule
-            if (
-                self.register == state_from
-                and current_input == input_symbol
-                and current_top == stack_top
-            ):
-                self.pop()
-                for sym in reversed(stack_ops):
-                    self.push(sym)
-                self.input_pos += 1
-                self.register = state_to
-                return
+            if self.register != state_from or current_input != input_symbol:
+                continue
+            if stack_top is ANY:
+                if default is None:
+                    default = rule
+            elif current_top == stack_top:
+                break
+        else:
+            if default is None:
+                return False
+            state_from, input_symbol, stack_top, state_to, stack_ops = default
 
-        raise Exception(
-            f"No valid transition for state='{self.register}', "
-            f"input='{current_input}', stack_top='{current_top}'."
-        )
+        self.pop()
+        for sym in reversed(stack_ops):
+            self.push(current_top if sym is SAME else sym)
+        self.input_pos += 1
+        self.register = state_to
+        return True
+
+    def _validate_definition(self) -> None:
+        """
+        Checks that every rule only uses known states, input symbols and stack symbols.
+
+        :raises ValidationError: If a rule is inconsistent.
+        """
+        states, alphabet = self.grammar.states, self.grammar.alphabet
+        for rule in self.grammar.rules:
+            state_from, input_symbol, stack_top, state_to, stack_ops = rule
+            if state_from not in states or state_to not in states:
+                raise ValidationError(
+                    self.GRAMMAR, "validation", reason=f"rule {rule} uses an unknown state"
+                )
+            if input_symbol not in alphabet:
+                raise ValidationError(
+                    self.GRAMMAR, "validation", reason=f"rule {rule} uses an unknown input symbol"
+                )
+            for sym in [stack_top, *stack_ops]:
+                if sym not in self.stack_alphabet and sym is not ANY and sym is not SAME:
+                    raise ValidationError(
+                        self.GRAMMAR,
+                        "validation",
+                        reason=f"rule {rule} uses unknown stack symbol {sym!r}",
+                    )
+
+    def freeze(self) -> None:
+        """
+        Validates the PDA once and switches :meth:`step` to an indexed, check-free path.
+
+        Transitions are indexed by ``(state, input_symbol, stack_top)`` and their pushed
+        symbols are stored in push order, so a step no longer scans the rules nor
+        re-validates the pushed symbols.
+
+        :raises ValidationError: If a rule is inconsistent.
+        """
+        # Bypass TuringMachine.freeze: the PDA has no tape to index.
+        Automaton.freeze(self)
+        self._frozen_index = self._transition_index()
+
+    def _transition_index(self) -> dict:  # type: ignore[override]
+        """
+        Index the rules by ``(state, input_symbol, stack_top)``, keeping the first rule of
+        each key, with their pushed symbols in push order.
+
+        Rules matching any top are indexed under ``(state, input_symbol, ANY)``. ``SAME``
+        in the pushed symbols of an exact rule is replaced by its stack top.
+
+        :return: ``(state, input_symbol, stack_top) -> (state_to, pushed)``.
+        :rtype: dict
+        """
+        index: dict = {}
+        for state_from, input_symbol, stack_top, state_to, stack_ops in self.grammar.rules:
+            pushed = tuple(reversed(stack_ops))
+            if stack_top is not ANY:
+                pushed = _resolve_pushed(pushed, stack_top)
+            index.setdefault((state_from, input_symbol, stack_top), (state_to, pushed))
+        return index
+
+    def _trusted_step(self) -> bool:
+        """
+        Execute one step of a frozen PDA.
+
+        :return: ``False`` if no transition matches or the stack is empty.
+        :rtype: bool
+        """
+        stack = self.stack
+        if not stack:
+            return False
+        index = self._frozen_index
+        key = (self.register, self._current_input(), stack[-1])
+        rule = index.get(key)
+        if rule is None:
+            rule = index.get(key[:2] + (ANY,))
+            if rule is None:
+                return False
+            rule = index[key] = (rule[0], _resolve_pushed(rule[1], key[2]))
+        state_to, pushed = rule
+        stack.pop()
+        stack.extend(pushed)
+        self.input_pos += 1
+        self.register = state_to
+        return True
+
+    def iter_steps(self, max_steps: Optional[int] = None) -> Iterator[StepDelta]:
+        """
+        Consume the input, yielding one :class:`~fsm_tools.deltas.StepDelta` per transition.
+
+        Each delta records the consumed input symbol, the popped stack top and the pushed
+        symbols. The generator ends at the end of the input, when no transition matches
+        or after ``max_steps`` transitions; its return value is the
+        :class:`~fsm_tools.status.StepStatus` of the run (``STUCK`` if no transition
+        matched).
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: An iterator over the step deltas.
+        :rtype: Iterator[StepDelta]
+        """
+        rules = self.grammar.rules
+        index: dict = {}
+        for rule_id, rule in enumerate(rules):
+            index.setdefault(rule[:3], rule_id)
+        steps = 0
+        while self._current_input() is not None and (max_steps is None or steps < max_steps):
+            if not self.stack:
+                return StepStatus.STUCK
+            current_input, current_top = self._current_input(), self.stack[-1]
+            rule_id = index.get((self.register, current_input, current_top))
+            if rule_id is None:
+                rule_id = index.get((self.register, current_input, ANY))
+                if rule_id is None:
+                    return StepStatus.STUCK
+            state_to, stack_ops = rules[rule_id][3:]
+            pushed = _resolve_pushed(tuple(reversed(stack_ops)), current_top)
+            self.stack.pop()
+            self.stack.extend(pushed)
+            position = self.input_pos
+            self.input_pos += 1
+            self.register = state_to
+            steps += 1
+            yield StepDelta(
+                steps, rule_id, state_to, position, current_input, None, 1, current_top, pushed
+            )
+        return self._status()
 
     # ------------------------------------------------------------------
     # Validation
     # ------------------------------------------------------------------
 
-    def validate(self, word: List[Any]) -> bool:
+    def validate(self, word: List[Any], limits: Optional[Limits] = None) -> bool:
         """
         Determine whether ``word`` is accepted by the PDA.
 
@@ -1177,9 +2847,12 @@ class PushdownAutomaton(LinearBoundedAutomaton):
 
         :param word: Input word to validate.
         :type word: List[Any]
+        :param limits: Budgets of the run, such as the maximum depth of the stack.
+        :type limits: Limits | None
         :raises ValidationError: If the automaton is not configured (no start
             state, no terminals, no transitions).
         :raises ValidationError: If any symbol in ``word`` is not in the input alphabet.
+        :raises LimitExceeded: If a limit is exceeded.
         :return: ``True`` if ``word`` is accepted, ``False`` otherwise.
         :rtype: bool
         """
@@ -1194,10 +2867,13 @@ class PushdownAutomaton(LinearBoundedAutomaton):
         self.set_input(word)
         self.register = self.grammar.start
 
-        try:
-            while self._current_input() is not None:
-                self.step()
-        except Exception:
+        # Rejection is the common case: use the run loop, which reports a stuck PDA
+        # rather than raising like step().
+        if limits is not None:
+            _, stuck = self._run_governed(None, limits)
+        else:
+            _, stuck = self._run_loop(None)
+        if stuck:
             return False
 
         # Reject the empty word: no input consumed means no computation ran.
@@ -1231,3 +2907,14 @@ class PushdownAutomaton(LinearBoundedAutomaton):
     def move(self, direction):  # type: ignore[override]
         """Not applicable to PDA. The input head advances automatically in step()."""
         raise NotImplementedError("PushdownAutomaton does not have a movable tape head.")
+
+    def run_nondeterministic(self, *args, **kwargs):  # type: ignore[override]
+        """Not applicable to PDA: the configuration-space search explores tapes."""
+        raise NotImplementedError(
+            "PushdownAutomaton does not use a tape: it cannot run nondeterministically. "
+            "Use validate() instead."
+        )
+
+    def decide(self, *args, **kwargs):  # type: ignore[override]
+        """Not applicable to PDA. Use :meth:`validate` instead."""
+        raise NotImplementedError("PushdownAutomaton does not use a tape. Use validate() instead.")
@@ -0,0 +1,232 @@
+"""
+Lockstep simulation of one Turing Machine on many input tapes with NumPy.
+
+Running the same machine on thousands of inputs with :meth:`fsm_tools.TuringMachine.run`
+costs one Python loop iteration per step and per input. ``BatchTuringMachine`` holds all
+the configurations as NumPy arrays instead:
+
+- ``states``: shape ``(N,)``, state code of each machine;
+- ``heads``: shape ``(N,)``, head position of each machine;
+- ``tapes``: shape ``(N, L)``, symbol codes of each tape;
+
+and advances every live machine by one transition per iteration, with vectorised lookups
+in the arrays of a :class:`~fsm_tools.compiled.CompiledTable`. Machines that have halted
+are masked out, so the throughput comes from the vector width rather than from the Python
+loop.
+
+NumPy is an optional dependency of **fsm-tools**: install it with
+``pip install fsm-tools[numpy]``.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, List, Optional, Sequence
+
+from .compiled import UNDEFINED, CompiledTable
+from .limits import Limits
+from .status import StepStatus
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+# Status codes of the ``status`` array, shared with the exception-free step methods.
+RUNNING = StepStatus.RUNNING
+ACCEPTED = StepStatus.ACCEPTED
+REJECTED = StepStatus.REJECTED
+STUCK = StepStatus.STUCK
+OUT_OF_TAPE = StepStatus.OUT_OF_TAPE
+
+
+class BatchTuringMachine:
+    """
+    Vectorised simulation of N configurations of the same 1D Turing Machine.
+
+    Attributes:
+        table (CompiledTable): The compiled transition function.
+        states (numpy.ndarray): State code of each configuration, shape ``(N,)``.
+        heads (numpy.ndarray): Head position of each configuration, shape ``(N,)``.
+        tapes (numpy.ndarray): Symbol codes of each tape, shape ``(N, L)``.
+        steps (numpy.ndarray): Number of transitions executed by each configuration.
+        status (numpy.ndarray): ``RUNNING``, ``ACCEPTED``, ``REJECTED``, ``STUCK`` or
+                                ``OUT_OF_TAPE`` for each configuration.
+        GRAMMAR (str): Chomsky hierarchy level of the compiled machine, reported by
+                       ``LimitExceeded``.
+    """
+
+    def __init__(self, machine):
+        """
+        Compiles the machine for batch execution.
+
+        The initial state of every configuration is the current register of ``machine``.
+
+        :param machine: A 1D ``TuringMachine``, or an already compiled table.
+        :type machine: TuringMachine | CompiledTable
+        :raises ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError(
+                "BatchTuringMachine requires NumPy. Install it with 'pip install fsm-tools[numpy]'."
+            )
+        table = (
+            machine if isinstance(machine, CompiledTable) else CompiledTable.from_machine(machine)
+        )
+        self.table = table
+        self.GRAMMAR = getattr(machine, "GRAMMAR", "Recursively Enumerable")
+        self._next_state = np.frombuffer(table.next_state, dtype=np.intc).copy()
+        self._write = np.frombuffer(table.write, dtype=np.intc).copy()
+        self._move = np.frombuffer(table.move, dtype=np.intc).copy()
+        self._tape_dtype = np.uint8 if table.n_symbols <= 256 else np.int32
+        self.states = np.zeros(0, dtype=np.int32)
+        self.heads = np.zeros(0, dtype=np.int64)
+        self.tapes = np.zeros((0, 1), dtype=self._tape_dtype)
+        self.steps = np.zeros(0, dtype=np.int64)
+        self.status = np.zeros(0, dtype=np.int8)
+
+    def load(self, tapes: Sequence[Sequence[Any]], width: Optional[int] = None) -> None:
+        """
+        Load the input tapes and reset every configuration to the initial state.
+
+        Heads start at position 0. Tapes are padded with blanks to a common width, which
+        grows automatically when a head moves beyond it.
+
+        :param tapes: The input tapes, as sequences of symbols.
+        :type tapes: Sequence[Sequence[Any]]
+        :param width: Initial width of the tapes. Defaults to the longest input plus one.
+        :type width: int | None
+        :raises ReadError: If a symbol is not in the alphabet of the machine.
+        """
+        encoded = [self.table.encode(tape) for tape in tapes]
+        longest = max((len(codes) for codes in encoded), default=0)
+        width = max(width or 0, longest + 1)
+        self.tapes = np.zeros((len(encoded), width), dtype=self._tape_dtype)
+        for row, codes in enumerate(encoded):
+            self.tapes[row, : len(codes)] = codes
+        count = len(encoded)
+        self.states = np.full(count, self.table.start, dtype=np.int32)
+        self.heads = np.zeros(count, dtype=np.int64)
+        self.steps = np.zeros(count, dtype=np.int64)
+        self.status = np.zeros(count, dtype=np.int8)
+        self._update_status(np.arange(count))
+
+    def _update_status(self, rows) -> None:
+        """Mark the configurations of ``rows`` that reached a halting state."""
+        states = self.states[rows]
+        self.status[rows[states == self.table.accept]] = ACCEPTED
+        self.status[rows[states == self.table.reject]] = REJECTED
+
+    def _grow(self, needed: int) -> None:
+        """Widen every tape with blanks so that position ``needed - 1`` exists."""
+        width = self.tapes.shape[1]
+        while width < needed:
+            width *= 2
+        grown = np.zeros((self.tapes.shape[0], width), dtype=self.tapes.dtype)
+        grown[:, : self.tapes.shape[1]] = self.tapes
+        self.tapes = grown
+
+    def step(self) -> int:
+        """
+        Advance every running configuration by one transition.
+
+        :return: The number of configurations that were running before the step.
+        :rtype: int
+        """
+        rows = np.flatnonzero(self.status == RUNNING)
+        running = int(rows.size)
+        if running == 0:
+            return 0
+
+        heads = self.heads[rows]
+        keys = self.states[rows] * self.table.n_symbols + self.tapes[rows, heads]
+        targets = self._next_state[keys]
+
+        stuck = targets == UNDEFINED
+        if stuck.any():
+            self.status[rows[stuck]] = STUCK
+            live = ~stuck
+            rows, heads, keys, targets = rows[live], heads[live], keys[live], targets[live]
+
+        self.tapes[rows, heads] = self._write[keys]
+        heads = heads + self._move[keys]
+        self.heads[rows] = heads
+        self.states[rows] = targets
+        self.steps[rows] += 1
+
+        if rows.size:
+            off_tape = heads < 0
+            if off_tape.any():
+                self.status[rows[off_tape]] = OUT_OF_TAPE
+            highest = int(heads.max())
+            if highest >= self.tapes.shape[1]:
+                self._grow(highest + 1)
+        self._update_status(rows)
+        return running
+
+    def _tape_cells(self) -> int:
+        """Return the width of the tapes, the cells held per configuration."""
+        return int(self.tapes.shape[1])
+
+    def _stack_depth(self) -> int:
+        """Return ``0``: a Turing Machine has no stack."""
+        return 0
+
+    def run(self, max_steps: Optional[int] = None, limits: Optional[Limits] = None) -> int:
+        """
+        Advance the configurations in lockstep until they all halt.
+
+        With ``limits``, the number of lockstep iterations is bounded by
+        ``limits.max_steps``, and ``limits.max_cells`` bounds the width of the tapes.
+
+        :param max_steps: Maximum number of lockstep iterations. ``None`` means no limit.
+        :type max_steps: int | None
+        :param limits: Budgets of the run, checked every ``limits.check_every`` iterations.
+        :type limits: Limits | None
+        :return: The number of lockstep iterations executed.
+        :rtype: int
+        :raises LimitExceeded: If a limit is exceeded.
+        """
+        deadline = limits.deadline_from(time.monotonic()) if limits is not None else None
+        iterations = 0
+        while max_steps is None or iterations < max_steps:
+            if limits is not None:
+                if not (self.status == RUNNING).any():
+                    break
+                limits.step_budget(self, iterations, 1)
+            if not self.step():
+                break
+            iterations += 1
+            if limits is not None and iterations % limits.check_every == 0:
+                limits.check(self, iterations, deadline)
+        return iterations
+
+    @property
+    def accepted(self):
+        """Boolean mask of the configurations that entered the accept state."""
+        return self.status == ACCEPTED
+
+    def tape(self, row: int) -> List[Any]:
+        """
+        Decode the tape of one configuration, without its trailing blanks.
+
+        :param row: Index of the configuration.
+        :type row: int
+        :return: The tape symbols.
+        :rtype: list
+        """
+        codes = self.tapes[row]
+        used = np.flatnonzero(codes)
+        end = int(used[-1]) + 1 if used.size else 0
+        return self.table.decode(codes[:end].tolist())
+
+    def register(self, row: int) -> Any:
+        """
+        Decode the current state of one configuration.
+
+        :param row: Index of the configuration.
+        :type row: int
+        :return: The state.
+        :rtype: Any
+        """
+        return self.table.states[int(self.states[row])]
@@ -0,0 +1,223 @@
+"""
+Checkpoints of long Turing Machine runs.
+
+The configuration of a running machine only lives in memory (``register``, ``head`` and
+``tape``). A :class:`Checkpointer` given to :meth:`~fsm_tools.TuringMachine.run` writes
+it to disk every ``every_steps`` steps and/or every ``every_seconds`` seconds, and once
+more when the run stops. :meth:`~fsm_tools.TuringMachine.resume` loads the last
+checkpoint into a machine with the same definition and continues the run::
+
+    tm.run(checkpoint=Checkpointer("run.ckpt", every_seconds=60))
+    # ... after a crash, on a freshly built machine:
+    tm.resume("run.ckpt")
+
+A checkpoint file holds:
+
+- the magic bytes ``FSMCKPT1`` and the length of the header (4 bytes, big-endian);
+- a JSON header: machine name, register, head, step count, checkpoint cadence, lowest
+  tape position and the symbol table of the tape;
+- the tape cells encoded with the symbol table (1 byte per cell up to 256 distinct
+  symbols, 4 bytes otherwise), compressed with ``zlib``.
+
+States and tape symbols must therefore be JSON scalars (``str``, ``int``, ...). Files are
+written to a temporary file in the same directory, flushed to disk and renamed over the
+previous checkpoint, so a crash during a write leaves the previous checkpoint intact.
+
+Checkpoints are supported by machines with a single 1D tape: ``TuringMachine`` and
+``LinearBoundedAutomaton``, with a list tape or a tape backend.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import tempfile
+import time
+import zlib
+from array import array
+from typing import Any, Optional
+
+MAGIC = b"FSMCKPT1"
+"""Leading bytes of a checkpoint file."""
+
+
+def save_checkpoint(machine: Any, path: str, steps: int = 0, cadence: Optional[dict] = None):
+    """
+    Write the configuration of ``machine`` to ``path`` atomically.
+
+    :param machine: A 1D ``TuringMachine`` or ``LinearBoundedAutomaton``.
+    :type machine: TuringMachine
+    :param path: Path of the checkpoint file.
+    :type path: str
+    :param steps: Number of steps executed by the run so far.
+    :type steps: int
+    :param cadence: Checkpoint cadence stored for :meth:`~fsm_tools.TuringMachine.resume`.
+    :type cadence: dict | None
+    :raises NotImplementedError: If the machine does not have a single 1D tape.
+    :raises TypeError: If a state or a symbol is not a JSON scalar.
+    """
+    start, cells = machine._tape_snapshot()
+    symbols = list(dict.fromkeys(cells))
+    codes = {symbol: code for code, symbol in enumerate(symbols)}
+    encoded = array("B" if len(symbols) <= 256 else "I", [codes[symbol] for symbol in cells])
+    header = json.dumps(
+        {
+            "name": machine.name,
+            "register": machine.register,
+            "head": list(machine.head),
+            "steps": steps,
+            "cadence": cadence or {},
+            "start": start,
+            "symbols": symbols,
+            "itemsize": encoded.itemsize,
+        }
+    ).encode()
+    body = zlib.compress(encoded.tobytes())
+
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(prefix=".ckpt-", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(MAGIC + struct.pack(">I", len(header)) + header + body)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load_checkpoint(machine: Any, path: str) -> dict:
+    """
+    Load the configuration stored in ``path`` into ``machine``.
+
+    The definition of the machine (alphabet, rules) is not stored: ``machine`` must be
+    built like the one that wrote the checkpoint.
+
+    :param machine: A 1D ``TuringMachine`` or ``LinearBoundedAutomaton``.
+    :type machine: TuringMachine
+    :param path: Path of the checkpoint file.
+    :type path: str
+    :return: The header of the checkpoint, with the ``steps`` and ``cadence`` of the run.
+    :rtype: dict
+    :raises ValueError: If the file is not a checkpoint, or was written by another machine.
+    """
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"'{path}' is not a checkpoint file.")
+    offset = len(MAGIC) + 4
+    (length,) = struct.unpack(">I", data[len(MAGIC) : offset])
+    header = json.loads(data[offset : offset + length])
+    if header["name"] != machine.name:
+        raise ValueError(
+            f"Checkpoint '{path}' was written by machine '{header['name']}', "
+            f"not '{machine.name}'."
+        )
+    encoded = array("B" if header["itemsize"] == 1 else "I")
+    encoded.frombytes(zlib.decompress(data[offset + length :]))
+    symbols = header["symbols"]
+    machine._load_tape_snapshot(header["start"], [symbols[code] for code in encoded])
+    machine.head = list(header["head"])
+    machine.register = header["register"]
+    return header
+
+
+class Checkpointer:
+    """
+    Periodic checkpoints of a run, given to :meth:`~fsm_tools.TuringMachine.run`.
+
+    Attributes:
+        path (str): Path of the checkpoint file.
+        every_steps (int | None): Number of steps between two checkpoints.
+        every_seconds (float | None): Number of seconds between two checkpoints.
+        check_every (int): Number of steps between two clock reads when only
+                           ``every_seconds`` is set.
+        offset (int): Steps executed before the run, counted in the checkpoints. Set by
+                      :meth:`~fsm_tools.TuringMachine.resume`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        every_steps: Optional[int] = None,
+        every_seconds: Optional[float] = None,
+        check_every: int = 1024,
+    ):
+        """
+        Initializes the checkpoint cadence. Without ``every_steps`` nor ``every_seconds``,
+        a single checkpoint is written when the run stops.
+
+        :raises ValueError: If ``every_steps`` or ``check_every`` is less than 1.
+        """
+        if every_steps is not None and every_steps < 1:
+            raise ValueError(f"every_steps must be at least 1. Got {every_steps}.")
+        if check_every < 1:
+            raise ValueError(f"check_every must be at least 1. Got {check_every}.")
+        self.path = path
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.check_every = check_every
+        self.offset = 0
+        self._saved_at = 0
+        self._saved_time = time.monotonic()
+
+    def cadence(self) -> dict:
+        """
+        Return the cadence stored in the checkpoints.
+
+        :return: ``every_steps``, ``every_seconds`` and ``check_every``.
+        :rtype: dict
+        """
+        return {
+            "every_steps": self.every_steps,
+            "every_seconds": self.every_seconds,
+            "check_every": self.check_every,
+        }
+
+    def start(self) -> None:
+        """Reset the cadence at the start of a run."""
+        self._saved_at = 0
+        self._saved_time = time.monotonic()
+
+    def slice_steps(self, steps: int) -> int:
+        """
+        Return the number of steps to execute before the next call to :meth:`update`.
+
+        :param steps: Steps executed by the run so far.
+        :type steps: int
+        :return: The length of the next slice.
+        :rtype: int
+        """
+        if self.every_steps is None:
+            return self.check_every
+        return max(1, self._saved_at + self.every_steps - steps)
+
+    def update(self, machine: Any, steps: int) -> None:
+        """
+        Write a checkpoint if one is due after ``steps`` steps.
+
+        :param machine: The running machine.
+        :type machine: TuringMachine
+        :param steps: Steps executed by the run so far.
+        :type steps: int
+        """
+        due = self.every_steps is not None and steps - self._saved_at >= self.every_steps
+        if not due and self.every_seconds is not None:
+            due = time.monotonic() - self._saved_time >= self.every_seconds
+        if due:
+            self.save(machine, steps)
+
+    def save(self, machine: Any, steps: int) -> None:
+        """
+        Write a checkpoint of ``machine`` after ``steps`` steps of the run.
+
+        :param machine: The running machine.
+        :type machine: TuringMachine
+        :param steps: Steps executed by the run so far.
+        :type steps: int
+        """
+        save_checkpoint(machine, self.path, self.offset + steps, self.cadence())
+        self._saved_at = steps
+        self._saved_time = time.monotonic()
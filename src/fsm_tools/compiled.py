@@ -0,0 +1,337 @@
+"""
+Integer-coded transition tables for 1D Turing Machines.
+
+The rules of a ``TuringMachine`` are stored as tuples of arbitrary (hashable) symbols and
+states in ``grammar.rules``. Execution engines working on arrays need a dense
+representation instead: every state and every symbol is given an integer *code*, and the
+transition function becomes three flat arrays indexed by
+``state_code * n_symbols + symbol_code``:
+
+- ``next_state``: code of the target state, or ``UNDEFINED`` when no rule applies;
+- ``write``: code of the symbol written on the tape;
+- ``move``: signed displacement of the head.
+
+The blank symbol always has code ``0``, so a zero-filled tape is a blank tape.
+
+A table can be published in a :mod:`multiprocessing.shared_memory` segment with
+:meth:`CompiledTable.share`. Worker processes attach to it by name with
+:meth:`CompiledTable.attach`: the three arrays are views of the segment instead of copies,
+so starting a worker does not depend on the number of rules, and the arrays exist once in
+memory whatever the number of workers::
+
+    segment = table.share()
+    with ProcessPoolExecutor(initializer=init_worker, initargs=(segment.name,)) as pool:
+        ...
+    segment.close()
+    segment.unlink()
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+from array import array
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .constants import ANY, SAME
+from .exception import ReadError
+from .symbols import SymbolClass
+
+UNDEFINED = -1
+"""Value of ``next_state`` for the ``(state, symbol)`` pairs without a transition."""
+
+SHARED_MAGIC = b"FSMTABLE"
+"""Leading bytes of a shared memory segment holding a ``CompiledTable``."""
+
+_SHARED_HEADER = struct.Struct("<8sQQ")
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment, without handing its lifetime to this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:  # Python < 3.13: the segment is also registered by this process.
+        return shared_memory.SharedMemory(name=name)
+
+
+class CompiledTable:
+    """
+    Dense integer-coded transition function of a 1D Turing Machine.
+
+    Attributes:
+        states (list): States of the machine; the position of a state is its code.
+        symbols (list): Tape symbols of the machine; the position of a symbol is its code.
+                        The blank symbol has code 0.
+        next_state (array): Code of the target state for each ``(state, symbol)`` pair.
+        write (array): Code of the symbol to write for each ``(state, symbol)`` pair.
+        move (array): Head displacement for each ``(state, symbol)`` pair.
+        start (int): Code of the initial state.
+        accept (int): Code of the accept state.
+        reject (int): Code of the reject state.
+        grammar (str): Chomsky classification of the compiled machine.
+    """
+
+    def __init__(
+        self,
+        states: List[Any],
+        symbols: List[Any],
+        next_state: array,
+        write: array,
+        move: array,
+        start: int,
+        accept: int,
+        reject: int,
+        grammar: str = "Recursively Enumerable",
+    ):
+        """
+        Initializes the table from already encoded arrays.
+
+        :param states: States of the machine, in code order.
+        :type states: list
+        :param symbols: Tape symbols of the machine, in code order, blank first.
+        :type symbols: list
+        :param next_state: Flat array of target state codes.
+        :type next_state: array
+        :param write: Flat array of written symbol codes.
+        :type write: array
+        :param move: Flat array of head displacements.
+        :type move: array
+        :param start: Code of the initial state.
+        :type start: int
+        :param accept: Code of the accept state.
+        :type accept: int
+        :param reject: Code of the reject state.
+        :type reject: int
+        :param grammar: Chomsky classification of the compiled machine, used in errors.
+        :type grammar: str
+        :raises ValueError: If the arrays do not have ``len(states) * len(symbols)`` entries.
+        """
+        size = len(states) * len(symbols)
+        for name, values in (("next_state", next_state), ("write", write), ("move", move)):
+            if len(values) != size:
+                raise ValueError(f"Array '{name}' must contain {size} entries. Got {len(values)}.")
+        self.states = states
+        self.symbols = symbols
+        self.next_state = next_state
+        self.write = write
+        self.move = move
+        self.start = start
+        self.accept = accept
+        self.reject = reject
+        self.grammar = grammar
+        self.state_codes: Dict[Any, int] = {state: code for code, state in enumerate(states)}
+        self.symbol_codes: Dict[Any, int] = {symbol: code for code, symbol in enumerate(symbols)}
+        self._segment: Optional[shared_memory.SharedMemory] = None
+        self._views: List[memoryview] = []
+
+    @property
+    def n_states(self) -> int:
+        """Number of states in the table."""
+        return len(self.states)
+
+    @property
+    def n_symbols(self) -> int:
+        """Number of tape symbols in the table."""
+        return len(self.symbols)
+
+    @classmethod
+    def from_machine(cls, machine) -> CompiledTable:
+        """
+        Compile the rules of a 1D Turing Machine.
+
+        States and symbols are numbered in order of first appearance: the current register
+        and the blank symbol first, then the rules, then the remaining states and symbols.
+        When several rules share the same ``(state, symbol)`` pair, the first one wins, as
+        in :meth:`fsm_tools.TuringMachine.step`. Symbol-class rules, then default rules
+        (reading ``ANY``), are expanded over the symbols of the table their state has no
+        rule for: a table only codes the symbols named by the rules and the alphabet.
+
+        :param machine: The machine to compile.
+        :type machine: TuringMachine
+        :return: The compiled table.
+        :rtype: CompiledTable
+        :raises ValueError: If the machine does not have a 1D tape.
+        """
+        if machine.axes != 1:
+            raise ValueError(f"Only 1D machines can be compiled. Got axes={machine.axes}.")
+
+        states: Dict[Any, int] = {}
+        symbols: Dict[Any, int] = {}
+        for state in (machine.register, machine.validation["accept"], machine.validation["reject"]):
+            states.setdefault(state, len(states))
+        symbols.setdefault(machine.blank, 0)
+        for state_from, symbol, state_to, write_symbol, _ in machine.grammar.rules:
+            for state in (state_from, state_to):
+                states.setdefault(state, len(states))
+            for sym in (symbol, write_symbol):
+                if sym is not ANY and sym is not SAME and not isinstance(sym, SymbolClass):
+                    symbols.setdefault(sym, len(symbols))
+        for state in machine.grammar.states:
+            states.setdefault(state, len(states))
+        for sym in machine.grammar.alphabet:
+            symbols.setdefault(sym, len(symbols))
+
+        width = len(symbols)
+        size = len(states) * width
+        next_state = array("i", [UNDEFINED]) * size
+        write = array("i", [0]) * size
+        move = array("i", [0]) * size
+        defined = set()
+        classes, defaults = [], []
+        for rule in machine.grammar.rules:
+            state_from, symbol, state_to, write_symbol, direction = rule
+            if isinstance(symbol, SymbolClass):
+                classes.append(rule)
+                continue
+            if symbol is ANY:
+                defaults.append(rule)
+                continue
+            key = states[state_from] * width + symbols[symbol]
+            if key in defined:
+                continue
+            defined.add(key)
+            next_state[key] = states[state_to]
+            write[key] = symbols[symbol if write_symbol is SAME else write_symbol]
+            move[key] = machine._move_delta(direction)
+        # Class rules, then default rules, fill the entries of their state left undefined
+        # by the exact rules.
+        symbol_list = list(symbols)
+        for state_from, symbol, state_to, write_symbol, direction in classes + defaults:
+            for code in range(width):
+                key = states[state_from] * width + code
+                if key in defined or (symbol is not ANY and symbol_list[code] not in symbol):
+                    continue
+                defined.add(key)
+                next_state[key] = states[state_to]
+                write[key] = code if write_symbol is SAME else symbols[write_symbol]
+                move[key] = machine._move_delta(direction)
+
+        return cls(
+            list(states),
+            list(symbols),
+            next_state,
+            write,
+            move,
+            start=states[machine.register],
+            accept=states[machine.validation["accept"]],
+            reject=states[machine.validation["reject"]],
+            grammar=machine.GRAMMAR,
+        )
+
+    def share(self, name: Optional[str] = None) -> shared_memory.SharedMemory:
+        """
+        Publish the table in a new shared memory segment.
+
+        The segment holds a header, the pickled states and symbols, then the three arrays
+        as 32-bit integers. The calling process owns the segment: it must ``close()`` and
+        ``unlink()`` it once the workers are done.
+
+        :param name: Name of the segment. ``None`` lets the system choose a unique name.
+        :type name: str | None
+        :return: The segment, whose ``name`` is given to :meth:`attach`.
+        :rtype: multiprocessing.shared_memory.SharedMemory
+        """
+        metadata = pickle.dumps(
+            (self.states, self.symbols, self.start, self.accept, self.reject, self.grammar)
+        )
+        size = len(self.next_state)
+        offset = _SHARED_HEADER.size + len(metadata)
+        offset += -offset % 4
+        segment = shared_memory.SharedMemory(name=name, create=True, size=offset + 12 * size)
+        buffer = segment.buf
+        _SHARED_HEADER.pack_into(buffer, 0, SHARED_MAGIC, len(metadata), size)
+        buffer[_SHARED_HEADER.size : _SHARED_HEADER.size + len(metadata)] = metadata
+        for values in (self.next_state, self.write, self.move):
+            buffer[offset : offset + 4 * size] = array("i", values).tobytes()
+            offset += 4 * size
+        return segment
+
+    @classmethod
+    def attach(cls, name: str) -> CompiledTable:
+        """
+        Attach to a table published by :meth:`share`, without copying its arrays.
+
+        Only the states and symbols are unpickled. Call :meth:`close` before the owner
+        unlinks the segment.
+
+        :param name: Name of the segment.
+        :type name: str
+        :return: A table whose arrays are views of the segment.
+        :rtype: CompiledTable
+        :raises ValueError: If the segment does not hold a compiled table.
+        """
+        segment = _open_segment(name)
+        buffer = segment.buf
+        magic, length, size = _SHARED_HEADER.unpack_from(buffer, 0)
+        if magic != SHARED_MAGIC:
+            segment.close()
+            raise ValueError(f"Shared memory segment '{name}' does not hold a compiled table.")
+        states, symbols, start, accept, reject, grammar = pickle.loads(
+            buffer[_SHARED_HEADER.size : _SHARED_HEADER.size + length]
+        )
+        offset = _SHARED_HEADER.size + length
+        offset += -offset % 4
+        views = [buffer[offset + 4 * size * k : offset + 4 * size * (k + 1)] for k in range(3)]
+        arrays = [view.cast("i") for view in views]
+        table = cls(states, symbols, *arrays, start, accept, reject, grammar)
+        table._segment = segment
+        table._views = arrays + views
+        return table
+
+    def close(self) -> None:
+        """Detach a table obtained with :meth:`attach` from its segment."""
+        if self._segment is None:
+            return
+        self.next_state = array("i")
+        self.write = array("i")
+        self.move = array("i")
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._segment.close()
+        self._segment = None
+
+    def encode(self, word: Sequence[Any]) -> List[int]:
+        """
+        Encode a sequence of tape symbols.
+
+        :param word: Symbols to encode.
+        :type word: Sequence
+        :return: The symbol codes.
+        :rtype: list
+        :raises ReadError: If a symbol is not known to the table.
+        """
+        codes = self.symbol_codes
+        try:
+            return [codes[symbol] for symbol in word]
+        except KeyError as e:
+            raise ReadError(self.grammar, "alphabet", symbol=e.args[0])
+
+    def decode(self, codes: Sequence[int]) -> List[Any]:
+        """
+        Decode a sequence of symbol codes.
+
+        :param codes: Codes to decode.
+        :type codes: Sequence
+        :return: The tape symbols.
+        :rtype: list
+        """
+        symbols = self.symbols
+        return [symbols[code] for code in codes]
+
+    def lookup(self, state: int, symbol: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Look up the transition for a ``(state, symbol)`` pair of codes.
+
+        :param state: State code.
+        :type state: int
+        :param symbol: Symbol code.
+        :type symbol: int
+        :return: ``(next_state, write, move)`` codes, or ``None`` if no transition applies.
+        :rtype: tuple | None
+        """
+        key = state * len(self.symbols) + symbol
+        if self.next_state[key] == UNDEFINED:
+            return None
+        return self.next_state[key], self.write[key], self.move[key]
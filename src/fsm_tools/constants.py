@@ -75,6 +75,7 @@ ACTIONS = {
     "withdraw": 19,
     "write": 7,
     "move": 8,
+    "exceed": 20,
 }
 """
 ACTIONS is a dictionary that maps common operations or actions to unique integer values,
@@ -92,7 +93,36 @@ The mapping is as follows:
     - "validate": Value 5 - Represents the action of checking correctness or conformity.
     - "search": Value 6 - Represents the action of locating specific elements or data.
     - "withdraw": Value 19 - Represents the action of retracting or taking back elements.
+    - "exceed": Value 20 - Represents a run stopped for exceeding one of its limits.
 
 These integer values ensure consistency in referencing actions across different modules
 or systems, enabling streamlined processing and error management.
 """
+
+
+class _Marker:
+    """Singleton marker used in transition rules, distinct from every tape symbol."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __reduce__(self) -> str:
+        # Unpickled as the module global of the same name: the marker stays a singleton.
+        return self.name
+
+
+ANY = _Marker("ANY")
+"""
+Wildcard symbol of a transition rule. A rule reading ``ANY`` is the *default* rule of its
+state: it applies to every symbol for which the state has no rule of its own. In a
+``PushdownAutomaton``, ``ANY`` as stack top matches any top of the stack.
+"""
+
+SAME = _Marker("SAME")
+"""
+Written symbol of a transition rule standing for the symbol read. In the pushed symbols of
+a ``PushdownAutomaton`` rule, it stands for the popped top of the stack.
+"""
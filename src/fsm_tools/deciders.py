@@ -0,0 +1,522 @@
+"""
+Non-halting deciders for Turing Machine runs.
+
+Screening many machines with a step budget wastes the whole budget on every machine that
+never halts. Exact cycle detection only catches machines returning to a configuration
+already seen, not those whose head drifts forever or whose tape keeps growing. A
+:class:`Deciders` object given to :meth:`~fsm_tools.TuringMachine.run` or
+:meth:`~fsm_tools.TuringMachine.run_status` watches the *records* of the run, the steps
+at which the head reaches a cell never visited before on the right or left edge of the
+tape, and recognises two patterns:
+
+- **translated cyclers**: two records on the same edge in the same state, such that the
+  cells the machine read between them are, at the second record, a translated copy of
+  the same cells at the first record. The machine repeats the same computation, shifted,
+  forever;
+- **bouncers**: the head sweeps back and forth over a region growing by the same word
+  at every sweep. At two records of the same edge and state, the tape reads
+  ``A u^n B`` and ``A u^(n+1) B``. The decider then proves, by a symbolic simulation
+  crossing the ``u^n`` block with one macro step per sweep, that ``A u^n B`` leads to
+  ``A u^(n+1) B`` for every ``n``.
+
+A detection stops the run with a :class:`Certificate`: ``run()`` raises
+:class:`~fsm_tools.exception.NonHalting` and ``run_status()`` returns ``StepStatus.NON_HALTING``. Detections
+are sound: a certificate is only issued when the pattern is proved, and machines the
+deciders cannot prove simply run on. The deciders do not apply to bounded tapes, and
+only detect drifts towards negative positions on two-way tape backends.
+
+Some machines never halt without any regular pattern in their runs, but because their
+halting configurations cannot be reached at all. :func:`backward_depth` reasons
+backwards from the rules alone: starting from the halting configurations (a halting
+state, or a state and symbol without rule), it enumerates the partial configurations
+(a state and the few cells the step needs) that lead to them in one step, then to those,
+level by level. If every branch dies before ``max_depth``, no run longer than the depth
+reached ever halts, whatever the tape. :func:`decide_backward` completes the proof for
+the current configuration of a machine by running a copy of it for that many steps::
+
+    certificate = decide_backward(tm)
+    if certificate is not None:
+        ...  # drop the machine without simulating it
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .constants import ANY
+from .status import StepStatus
+
+TRANSLATED_CYCLER = "translated_cycler"
+"""Kind of the certificate of a translated cycler."""
+
+BOUNCER = "bouncer"
+"""Kind of the certificate of a bouncer."""
+
+BACKWARD = "backward"
+"""Kind of the certificate of a backward reasoning proof."""
+
+
+class Certificate:
+    """
+    Proof that a run never halts.
+
+    Attributes:
+        kind (str): ``TRANSLATED_CYCLER``, ``BOUNCER`` or ``BACKWARD``.
+        state (Any): State of the machine at both records.
+        side (int): ``1`` for records on the right edge of the tape, ``-1`` on the left.
+        start (int): Step of the first record.
+        end (int): Step of the second record, when the run stopped.
+        shift (int): Displacement of the tape edge between the two records.
+        tape (tuple): For a translated cycler, the cells read between the records, as
+                      they were at the first record. For a bouncer, the ``(A, u, B)``
+                      words of the tape ``A u^n B`` at the first record.
+
+    A ``BACKWARD`` certificate has no records: ``state`` is the state of the checked
+    configuration, ``side`` and ``shift`` are ``0``, ``end`` is the number of steps run
+    without halting, after which no run halts, and ``tape`` holds the halting
+    ``(state, symbol)`` pairs refuted, with ``ANY`` as the symbol of the halting states.
+    """
+
+    def __init__(
+        self, kind: str, state: Any, side: int, start: int, end: int, shift: int, tape: tuple
+    ):
+        self.kind = kind
+        self.state = state
+        self.side = side
+        self.start = start
+        self.end = end
+        self.shift = shift
+        self.tape = tape
+
+    @property
+    def period(self) -> int:
+        """Number of steps between the two records."""
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return (
+            f"Certificate(kind={self.kind!r}, state={self.state!r}, side={self.side}, "
+            f"steps={self.start}..{self.end}, shift={self.shift})"
+        )
+
+
+class _Record:
+    """A record of the run, with the cells behind the head."""
+
+    __slots__ = ("step", "state", "position", "excursion", "start", "cells")
+
+    def __init__(self, step, state, position, excursion, start, cells):
+        self.step = step
+        self.state = state
+        self.position = position
+        self.excursion = excursion
+        self.start = start
+        self.cells = cells
+
+
+class Deciders:
+    """
+    Non-halting detectors watching the records of a run.
+
+    Attributes:
+        translated_cyclers (bool): Detect translated cyclers.
+        bouncers (bool): Detect bouncers.
+        history (int): Number of records kept per edge for the translated cyclers.
+        window (int): Number of cells behind the head kept with each record, bounding the
+                      width of the translated cyclers detected.
+        max_verify_steps (int): Maximum number of symbolic steps of a bouncer proof.
+        certificate (Certificate | None): The proof found by the last run, if any.
+    """
+
+    def __init__(
+        self,
+        translated_cyclers: bool = True,
+        bouncers: bool = True,
+        history: int = 32,
+        window: int = 128,
+        max_verify_steps: int = 100_000,
+    ):
+        """
+        Initializes the detectors.
+
+        :raises ValueError: If ``history`` is less than 2 or ``window`` less than 1.
+        """
+        if history < 2:
+            raise ValueError(f"history must be at least 2. Got {history}.")
+        if window < 1:
+            raise ValueError(f"window must be at least 1. Got {window}.")
+        self.translated_cyclers = translated_cyclers
+        self.bouncers = bouncers
+        self.history = history
+        self.window = window
+        self.max_verify_steps = max_verify_steps
+        self.certificate: Optional[Certificate] = None
+        self.steps = 0
+        self.extent: Tuple[int, int, int, int] = (0, 0, 0, 0)
+
+    def start(self, machine: Any) -> None:
+        """
+        Reset the records at the start of a run of ``machine``.
+
+        :param machine: A 1D ``TuringMachine``.
+        :type machine: TuringMachine
+        :raises NotImplementedError: If the machine does not have a single 1D tape.
+        """
+        self.certificate = None
+        self.steps = 0
+        start, cells = machine._tape_snapshot()
+        position = machine.head[0]
+        low, high = min(start, position), max(start + len(cells) - 1, position)
+        # Visited region, then the lowest (highest) position since the last right (left)
+        # record.
+        self.extent = (low, high, position, position)
+        self._records = {1: deque(maxlen=self.history), -1: deque(maxlen=self.history)}
+        self._sweeps: dict = {}
+        self._floor = machine._tape_floor()
+        self._enabled = machine._tape_bound() is None
+        self._definition = None
+        if self.bouncers and all(abs(machine._move_delta(move)) <= 1 for move in machine.moves):
+            self._definition = machine.definition()
+
+    def record(
+        self, machine: Any, steps: int, side: int, excursion: int, low: int, high: int
+    ) -> bool:
+        """
+        Examine a record of the run: the head of ``machine`` just reached a new edge.
+
+        :param machine: The running machine.
+        :type machine: TuringMachine
+        :param steps: Steps executed by the run so far.
+        :type steps: int
+        :param side: ``1`` for a record on the right edge, ``-1`` on the left edge.
+        :type side: int
+        :param excursion: Farthest position from the edge reached by the head since the
+                          previous record on the same edge.
+        :type excursion: int
+        :param low: Lowest position visited.
+        :type low: int
+        :param high: Highest position visited.
+        :type high: int
+        :return: ``True`` if the run never halts; :attr:`certificate` holds the proof.
+        :rtype: bool
+        """
+        if not self._enabled or (side < 0 and self._floor is not None):
+            return False
+        position, state = machine.head[0], machine.register
+        if self.translated_cyclers:
+            if side > 0:
+                start = max(position - self.window + 1, low)
+                cells = machine._tape_window(start, position)
+            else:
+                start = position
+                cells = machine._tape_window(position, min(position + self.window - 1, high))
+            record = _Record(steps, state, position, excursion, start, cells)
+            self.certificate = self._match_translated(side, record, machine.blank)
+            self._records[side].append(record)
+        if self.certificate is None and self._definition is not None:
+            if (excursion - low if side > 0 else high - excursion) * 2 <= high - low:
+                self.certificate = self._match_bouncer(machine, steps, side, low, high)
+        return self.certificate is not None
+
+    def _match_translated(self, side: int, last: _Record, blank: Any) -> Optional[Certificate]:
+        """Look for an earlier record that ``last`` repeats, translated."""
+        bound = last.excursion
+        for first in reversed(self._records[side]):
+            if first.state == last.state:
+                # Cells read since ``first``: from ``bound`` to the head, at most ``width``
+                # cells behind the head at ``first``.
+                width = (first.position - bound) * side
+                if width < self.window:
+                    cells = _behind(first, side, width, blank)
+                    if cells == _behind(last, side, width, blank):
+                        return Certificate(
+                            TRANSLATED_CYCLER,
+                            last.state,
+                            side,
+                            first.step,
+                            last.step,
+                            last.position - first.position,
+                            tuple(cells[::-side]),
+                        )
+            bound = min(bound, first.excursion) if side > 0 else max(bound, first.excursion)
+        return None
+
+    def _match_bouncer(
+        self, machine: Any, steps: int, side: int, low: int, high: int
+    ) -> Optional[Certificate]:
+        """Guess ``A u^n B`` from the last sweeps ending in the current state, and prove it."""
+        state = machine.register
+        sweeps = self._sweeps.setdefault((side, state), deque(maxlen=3))
+        sweeps.append((steps, low, high, machine._tape_window(low, high)))
+        if len(sweeps) < 3:
+            return None
+        (_, low0, high0, cells0), (step1, low1, high1, cells1), (_, low2, high2, cells2) = sweeps
+        growth = len(cells2) - len(cells1)
+        if growth <= 0 or growth != len(cells1) - len(cells0):
+            return None
+        if (low1, low2) != (low0, low0) if side > 0 else (high1, high2) != (high0, high0):
+            return None
+        before, after = (cells1, cells2) if side > 0 else (cells1[::-1], cells2[::-1])
+        room = None if self._floor is None or side < 0 else low1 - self._floor
+        for prefix, repeater, suffix in _decompositions(before, after):
+            if self._prove_bouncer(state, side, prefix, repeater, suffix, room, steps - step1):
+                if side < 0:
+                    prefix, repeater, suffix = suffix[::-1], repeater[::-1], prefix[::-1]
+                return Certificate(
+                    BOUNCER,
+                    state,
+                    side,
+                    step1,
+                    steps,
+                    growth * side,
+                    (tuple(prefix), tuple(repeater), tuple(suffix)),
+                )
+        return None
+
+    def _prove_bouncer(
+        self,
+        state: Any,
+        side: int,
+        prefix: List[Any],
+        repeater: List[Any],
+        suffix: List[Any],
+        room: Optional[int],
+        period: int,
+    ) -> bool:
+        """
+        Prove that ``prefix repeater^n suffix``, head on the last cell in ``state``, reaches
+        ``prefix repeater^(n+1) suffix`` in the same state, for every ``n``.
+
+        The tape is simulated as a concrete left part, a block ``block^n`` and a concrete
+        right part, oriented so that the records are on the right (``side`` mirrors the
+        moves). The head crosses the block with a macro step: entering one copy of the block
+        in state ``p``, it must leave it by the other side in state ``p``, so it crosses the
+        ``n`` copies alike.
+        """
+        definition = self._definition
+        halting = (definition.accept, definition.reject)
+        blank = definition.blank
+        budget = min(self.max_verify_steps, 2 * period + 64)
+        left, block, right = list(prefix), list(repeater), list(suffix)
+        target = _canonical(prefix + repeater, repeater, suffix)
+        in_right, index, current, lead = True, len(right) - 1, state, 0
+
+        def lookup(state_from, symbol):
+            rule = definition.lookup(state_from, symbol)
+            if rule is None or rule[0] in halting:
+                return None
+            return rule[0], rule[1], rule[2] * side
+
+        def cross(direction):
+            nonlocal budget, current
+            cells = list(block)
+            position = 0 if direction > 0 else len(cells) - 1
+            entered = current
+            while budget > 0:
+                budget -= 1
+                rule = lookup(current, cells[position])
+                if rule is None:
+                    return False
+                current, cells[position] = rule[0], rule[1]
+                position += rule[2]
+                if not 0 <= position < len(cells):
+                    if (position < 0) == (direction > 0) or current != entered:
+                        return False
+                    block[:] = cells
+                    return True
+            return False
+
+        while budget > 0:
+            budget -= 1
+            cells = right if in_right else left
+            rule = lookup(current, cells[index])
+            if rule is None:
+                return False
+            current, cells[index] = rule[0], rule[1]
+            index += rule[2]
+            if in_right and index == len(right):
+                right.append(blank)
+                if current == state and all(cell == blank for cell in left[:lead]):
+                    if _canonical(left[lead:], block, right) == target:
+                        return True
+            elif in_right and index < 0:
+                if not cross(-1):
+                    return False
+                in_right, index = False, len(left) - 1
+            if not in_right and index == len(left):
+                if not cross(1):
+                    return False
+                in_right, index = True, 0
+            if not in_right and index < 0:
+                if room is not None and lead >= room:
+                    return False
+                left.insert(0, blank)
+                lead, index = lead + 1, 0
+        return False
+
+
+def backward_depth(
+    machine: Any, max_depth: int = 30, max_configurations: int = 10_000
+) -> Optional[int]:
+    """
+    Reason backwards from the halting configurations of a 1D Turing Machine, over the
+    tapes written with its alphabet and blank.
+
+    A partial configuration is a state and the cells known around the head. Level ``0``
+    holds the halting ones: each halting state with no known cell, and each state with
+    the symbol it has no rule for. Level ``k + 1`` holds the predecessors of level ``k``:
+    for every rule entering the state of a partial configuration, the configuration one
+    step earlier, unless the cell the rule wrote contradicts a known cell.
+
+    If level ``k`` is empty, every halting run halts within its first ``k - 1`` steps,
+    from any configuration of a two-way infinite tape. Leaving a one-way or bounded tape
+    is not a halting configuration of this analysis.
+
+    :param machine: The machine, whose rules and alphabet are read.
+    :type machine: TuringMachine
+    :param max_depth: Number of levels explored before giving up.
+    :type max_depth: int
+    :param max_configurations: Number of partial configurations explored before giving up.
+    :type max_configurations: int
+    :return: The first empty level ``k``, or ``None`` if a branch is still alive at
+             ``max_depth`` or the budget of configurations is exhausted.
+    :rtype: int | None
+    :raises ValidationError: If a rule of the machine is inconsistent.
+    """
+    return _backward(machine, max_depth, max_configurations)[0]
+
+
+def decide_backward(
+    machine: Any, max_depth: int = 30, max_configurations: int = 10_000
+) -> Optional[Certificate]:
+    """
+    Prove that ``machine`` never halts from its current configuration by backward
+    reasoning (see :func:`backward_depth`).
+
+    If every backward branch dies at level ``k``, a copy of the configuration runs for
+    ``k`` steps: a run that has not halted by then never halts. The machine itself is left
+    in its current configuration.
+
+    The proof needs a tape backend that is infinite in both directions, where the head
+    never leaves the tape, and a tape holding only symbols of the alphabet.
+
+    :param machine: A 1D ``TuringMachine``.
+    :type machine: TuringMachine
+    :param max_depth: Number of backward levels explored before giving up.
+    :type max_depth: int
+    :param max_configurations: Number of partial configurations explored before giving up.
+    :type max_configurations: int
+    :return: A ``BACKWARD`` certificate, or ``None`` if the machine is not proved to run
+             forever.
+    :rtype: Certificate | None
+    :raises NotImplementedError: If the machine does not have a single 1D tape.
+    """
+    if machine._tape_floor() is not None or machine._tape_bound() is not None:
+        return None
+    _, cells = machine._tape_snapshot()
+    symbols = set(machine.get_terminals()) | {machine.blank}
+    if any(cell not in symbols for cell in cells):
+        return None
+    steps, halting = _backward(machine, max_depth, max_configurations)
+    if steps is None:
+        return None
+    configuration = machine.fork_configuration()
+    try:
+        status = machine.run_status(steps)
+    finally:
+        machine.restore_configuration(configuration)
+    if status is not StepStatus.RUNNING:
+        return None
+    refuted = tuple((state, cells[0][1] if cells else ANY) for state, cells in halting)
+    return Certificate(BACKWARD, machine.register, 0, 0, steps, 0, refuted)
+
+
+def _backward(
+    machine: Any, max_depth: int, max_configurations: int
+) -> Tuple[Optional[int], List[tuple]]:
+    """Return the result of :func:`backward_depth` and the halting partial configurations."""
+    definition = machine.definition()
+    halting = [(state, ()) for state in (definition.accept, definition.reject) if state is not None]
+    symbols = set(machine.get_terminals()) | {definition.blank}
+    states = set(machine.grammar.states) | {definition.start}
+    states.update(key[0] for key in definition.transitions)
+    states.difference_update((definition.accept, definition.reject))
+    entering: Dict[Any, List[Tuple[Any, Any, Any, int]]] = {}
+    for state in states:
+        for symbol in symbols:
+            rule = definition.lookup(state, symbol)
+            if rule is None:
+                halting.append((state, ((0, symbol),)))
+            else:
+                entering.setdefault(rule[0], []).append((state, symbol, rule[1], rule[2]))
+    level = set(halting)
+    budget = max_configurations - len(level)
+    for depth in range(max_depth + 1):
+        if not level:
+            return depth, halting
+        if depth == max_depth:
+            break
+        previous_level: set = set()
+        for state, cells in level:
+            if len(previous_level) > budget:
+                return None, halting
+            known = dict(cells)
+            for previous, read, written, delta in entering.get(state, ()):
+                # One step earlier, the head was on the cell at offset -delta, which held
+                # the symbol read and now holds the symbol written.
+                if known.get(-delta, written) != written:
+                    continue
+                shifted = {offset + delta: cell for offset, cell in cells if offset != -delta}
+                shifted[0] = read
+                previous_level.add((previous, tuple(sorted(shifted.items()))))
+        budget -= len(previous_level)
+        level = previous_level
+    return None, halting
+
+
+def _behind(record: _Record, side: int, width: int, blank: Any) -> List[Any]:
+    """Return the cells of ``record`` from the head to ``width`` cells behind it."""
+    cells = []
+    for offset in range(width + 1):
+        index = record.position - side * offset - record.start
+        cells.append(record.cells[index] if 0 <= index < len(record.cells) else blank)
+    return cells
+
+
+def _decompositions(before: Sequence[Any], after: Sequence[Any]):
+    """
+    Yield the ``(A, u, B)`` such that ``before == A u^n B`` and ``after == A u^(n+1) B``,
+    ``B`` not empty, for the insertion points of ``after`` into ``before``.
+    """
+    before, after = list(before), list(after)
+    growth = len(after) - len(before)
+    common_prefix = 0
+    while common_prefix < len(before) and before[common_prefix] == after[common_prefix]:
+        common_prefix += 1
+    common_suffix = 0
+    while common_suffix < len(before) and before[-1 - common_suffix] == after[-1 - common_suffix]:
+        common_suffix += 1
+    last = min(common_prefix, len(before) - 1)
+    first = max(len(before) - common_suffix, last - growth, 0)
+    for point in range(last, first - 1, -1):
+        repeater = after[point : point + growth]
+        prefix, suffix = before[:point], before[point:]
+        while len(prefix) >= growth and prefix[-growth:] == repeater:
+            prefix = prefix[:-growth]
+        while len(suffix) > growth and suffix[:growth] == repeater:
+            suffix = suffix[growth:]
+        yield prefix, repeater, suffix
+
+
+def _canonical(prefix: List[Any], repeater: List[Any], suffix: List[Any]) -> tuple:
+    """
+    Normalise ``prefix repeater^n suffix`` by moving the block as far left as possible,
+    so that two tapes equal for every ``n`` have the same normal form.
+    """
+    prefix, repeater, suffix = list(prefix), list(repeater), list(suffix)
+    while prefix and prefix[-1] == repeater[-1]:
+        cell = prefix.pop()
+        repeater = [cell] + repeater[:-1]
+        suffix.insert(0, cell)
+    return tuple(prefix), tuple(repeater), tuple(suffix)
@@ -0,0 +1,389 @@
+"""
+Immutable machine definitions, shared by concurrent runs.
+
+Every method of :class:`~fsm_tools.TuringMachine` and its subclasses executes on the
+configuration stored in the machine itself (``register``, ``head``, ``tape``, ``stack``,
+``input_pos``), so one machine object cannot serve two runs at the same time. The
+``definition()`` method of a machine returns a snapshot of its definition instead:
+
+- :class:`MachineDefinition` for 1D Turing Machines and Linear Bounded Automata;
+- :class:`PushdownDefinition` for Pushdown Automata.
+
+A definition holds the initial state, the halting states and the indexed transitions,
+and is never modified after its creation. Each run gets its own lightweight
+configuration object (:class:`Configuration`, :class:`PushdownConfiguration`), created by
+the definition and advanced by :meth:`~MachineDefinition.run`. Any number of threads can
+therefore run the same definition at once, without copies nor locks::
+
+    definition = tm.definition()
+    with ThreadPoolExecutor() as pool:
+        verdicts = list(pool.map(definition.accepts, words))
+
+Later changes to the machine do not affect a definition already taken.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+from .constants import ANY, SAME
+from .exception import ReadError
+from .status import StepStatus
+from .symbols import SymbolClass
+
+
+class Configuration:
+    """
+    Configuration of one run of a :class:`MachineDefinition`.
+
+    Attributes:
+        register (Any): Current state.
+        head (int): Head position.
+        tape (list): Tape cells, from position 0. Owned by the configuration.
+        steps (int): Number of transitions executed.
+    """
+
+    __slots__ = ("register", "head", "tape", "steps")
+
+    def __init__(self, register: Any, tape: List[Any], head: int = 0, steps: int = 0):
+        self.register = register
+        self.tape = tape
+        self.head = head
+        self.steps = steps
+
+    def __repr__(self) -> str:
+        return (
+            f"Configuration(register={self.register!r}, head={self.head}, "
+            f"steps={self.steps}, cells={len(self.tape)})"
+        )
+
+
+class PushdownConfiguration:
+    """
+    Configuration of one run of a :class:`PushdownDefinition`.
+
+    Attributes:
+        register (Any): Current state.
+        word (tuple): The input word.
+        position (int): Index of the next input symbol.
+        stack (list): The stack, top last. Owned by the configuration.
+        steps (int): Number of transitions executed.
+    """
+
+    __slots__ = ("register", "word", "position", "stack", "steps")
+
+    def __init__(self, register: Any, word: Tuple[Any, ...], stack: List[Any]):
+        self.register = register
+        self.word = word
+        self.position = 0
+        self.stack = stack
+        self.steps = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"PushdownConfiguration(register={self.register!r}, position={self.position}, "
+            f"stack={self.stack!r})"
+        )
+
+
+class _Immutable:
+    """Base class of the definitions: attributes are set once, by ``__init__``."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def _set(self, **attributes: Any) -> None:
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+
+class MachineDefinition(_Immutable):
+    """
+    Immutable definition of a 1D Turing Machine or Linear Bounded Automaton.
+
+    Attributes:
+        name (str): Name of the machine.
+        blank (Any): The blank symbol.
+        start (Any): Initial state of the runs.
+        accept (Any): The accept state.
+        reject (Any): The reject state.
+        bound (int | None): Number of cells of a bounded tape, ``None`` if right-infinite.
+        transitions (Mapping): ``(state, symbol) -> (state_to, write_symbol, head_delta)``,
+                               the first matching rule of the machine. The symbol-class
+                               rules of a state are in a
+                               :class:`~fsm_tools.symbols.ClassTable` under
+                               ``(state, SymbolClass)``, its default rule under
+                               ``(state, ANY)``.
+    """
+
+    __slots__ = ("name", "blank", "start", "accept", "reject", "bound", "transitions")
+
+    def __init__(
+        self,
+        name: str,
+        blank: Any,
+        start: Any,
+        accept: Any,
+        reject: Any,
+        transitions: Mapping[Tuple[Any, Any], Tuple[Any, Any, int]],
+        bound: Optional[int] = None,
+    ):
+        self._set(
+            name=name,
+            blank=blank,
+            start=start,
+            accept=accept,
+            reject=reject,
+            bound=bound,
+            transitions=MappingProxyType(dict(transitions)),
+        )
+
+    def configuration(
+        self, content: Iterable[Any] = (), head: int = 0, register: Any = None
+    ) -> Configuration:
+        """
+        Create the configuration of a new run, with its own copy of ``content``.
+
+        :param content: Initial tape content, from position 0.
+        :type content: Iterable[Any]
+        :param head: Initial head position.
+        :type head: int
+        :param register: Initial state. Defaults to :attr:`start`.
+        :type register: Any
+        :return: The configuration.
+        :rtype: Configuration
+        :raises ValueError: If the content exceeds a bounded tape.
+        """
+        tape = list(content)
+        if self.bound is not None and len(tape) > self.bound:
+            raise ValueError(f"Input length {len(tape)} exceeds the tape limit of {self.bound}.")
+        return Configuration(self.start if register is None else register, tape, head)
+
+    def run(self, configuration: Configuration, max_steps: Optional[int] = None) -> StepStatus:
+        """
+        Advance ``configuration`` until it halts, gets stuck, leaves the tape or executes
+        ``max_steps`` transitions. Only ``configuration`` is modified.
+
+        :param configuration: The configuration of the run.
+        :type configuration: Configuration
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: ``ACCEPTED``, ``REJECTED``, ``STUCK``, ``OUT_OF_TAPE``, or ``RUNNING`` if
+                 ``max_steps`` was reached first.
+        :rtype: StepStatus
+        """
+        transitions, blank, bound = self.transitions, self.blank, self.bound
+        accept, reject = self.accept, self.reject
+        tape = configuration.tape
+        position, state = configuration.head, configuration.register
+        steps = 0
+        try:
+            while state != accept and state != reject:
+                if max_steps is not None and steps >= max_steps:
+                    return StepStatus.RUNNING
+                if position < 0 or (bound is not None and position >= bound):
+                    return StepStatus.OUT_OF_TAPE
+                if position >= len(tape):
+                    tape.extend([blank] * (position + 1 - len(tape)))
+                rule = transitions.get((state, tape[position]))
+                if rule is None:
+                    rule = self.lookup(state, tape[position])
+                    if rule is None:
+                        return StepStatus.STUCK
+                state, tape[position], delta = rule
+                position += delta
+                steps += 1
+        finally:
+            configuration.head, configuration.register = position, state
+            configuration.steps += steps
+        return StepStatus.ACCEPTED if state == accept else StepStatus.REJECTED
+
+    def lookup(self, state: Any, symbol: Any) -> Optional[Tuple[Any, Any, int]]:
+        """
+        Return the rule applied in ``state`` on ``symbol``: the exact rule, else the first
+        symbol-class rule containing ``symbol``, else the default rule of the state.
+
+        :param state: The state.
+        :type state: Any
+        :param symbol: The symbol read.
+        :type symbol: Any
+        :return: ``(state_to, write_symbol, head_delta)`` with ``SAME`` replaced by
+                 ``symbol``, or ``None`` if no rule applies.
+        :rtype: Tuple[Any, Any, int] | None
+        """
+        transitions = self.transitions
+        rule = transitions.get((state, symbol))
+        if rule is not None:
+            return rule
+        classes = transitions.get((state, SymbolClass))
+        if classes is not None:
+            rule = classes.get(symbol)
+        if rule is None:
+            rule = transitions.get((state, ANY))
+            if rule is None:
+                return None
+        if rule[1] is SAME:
+            rule = (rule[0], symbol, rule[2])
+        return rule
+
+    def step(self, configuration: Configuration) -> StepStatus:
+        """
+        Execute one transition on ``configuration``, like
+        :meth:`~fsm_tools.TuringMachine.step_status`.
+
+        :param configuration: The configuration of the run.
+        :type configuration: Configuration
+        :return: The status after the transition.
+        :rtype: StepStatus
+        """
+        return self.run(configuration, 1)
+
+    def accepts(self, content: Iterable[Any], max_steps: Optional[int] = None) -> bool:
+        """
+        Tell whether a run on ``content`` reaches the accept state.
+
+        :param content: Initial tape content.
+        :type content: Iterable[Any]
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: ``True`` if the run accepts within ``max_steps`` steps.
+        :rtype: bool
+        """
+        return self.run(self.configuration(content), max_steps) is StepStatus.ACCEPTED
+
+    def __repr__(self) -> str:
+        return f"MachineDefinition(name={self.name!r}, transitions={len(self.transitions)})"
+
+
+class PushdownDefinition(_Immutable):
+    """
+    Immutable definition of a Pushdown Automaton.
+
+    Attributes:
+        name (str): Name of the automaton.
+        grammar (str): Chomsky grammar of the automaton, used by the error messages.
+        start (Any): Initial state of the runs.
+        accept (Any): The accept state.
+        reject (Any): The reject state.
+        bottom (Any): The bottom-of-stack marker.
+        alphabet (frozenset): The input alphabet.
+        transitions (Mapping): ``(state, input_symbol, stack_top) -> (state_to, pushed)``,
+                               with ``pushed`` in push order. Rules for any stack top are
+                               under ``(state, input_symbol, ANY)``.
+    """
+
+    __slots__ = (
+        "name",
+        "grammar",
+        "start",
+        "accept",
+        "reject",
+        "bottom",
+        "alphabet",
+        "transitions",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        grammar: str,
+        start: Any,
+        accept: Any,
+        reject: Any,
+        bottom: Any,
+        alphabet: Iterable[Any],
+        transitions: Mapping[Tuple[Any, Any, Any], Tuple[Any, Tuple[Any, ...]]],
+    ):
+        self._set(
+            name=name,
+            grammar=grammar,
+            start=start,
+            accept=accept,
+            reject=reject,
+            bottom=bottom,
+            alphabet=frozenset(alphabet),
+            transitions=MappingProxyType(dict(transitions)),
+        )
+
+    def configuration(self, word: Iterable[Any]) -> PushdownConfiguration:
+        """
+        Create the configuration of a new run on ``word``, with the bottom marker alone on
+        the stack.
+
+        :param word: The input word.
+        :type word: Iterable[Any]
+        :return: The configuration.
+        :rtype: PushdownConfiguration
+        :raises ReadError: If a symbol is not in the input alphabet.
+        """
+        word = tuple(word)
+        for symbol in word:
+            if symbol not in self.alphabet:
+                raise ReadError(self.grammar, "alphabet", symbol=symbol)
+        return PushdownConfiguration(self.start, word, [self.bottom])
+
+    def run(
+        self, configuration: PushdownConfiguration, max_steps: Optional[int] = None
+    ) -> StepStatus:
+        """
+        Consume the input of ``configuration`` until its end, like
+        :meth:`~fsm_tools.PushdownAutomaton.run_status`. Only ``configuration`` is modified.
+
+        :param configuration: The configuration of the run.
+        :type configuration: PushdownConfiguration
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: ``STUCK`` if no transition matched or the stack is empty, ``RUNNING``
+                 while input is left, then ``ACCEPTED`` by empty stack, or ``REJECTED``.
+        :rtype: StepStatus
+        """
+        transitions, word, stack = self.transitions, configuration.word, configuration.stack
+        position, state = configuration.position, configuration.register
+        end = len(word) if max_steps is None else min(len(word), position + max_steps)
+        start = position
+        try:
+            while position < end:
+                if not stack:
+                    return StepStatus.STUCK
+                top = stack[-1]
+                rule = transitions.get((state, word[position], top))
+                if rule is None:
+                    rule = transitions.get((state, word[position], ANY))
+                    if rule is None:
+                        return StepStatus.STUCK
+                state, pushed = rule
+                stack.pop()
+                if SAME in pushed:
+                    pushed = tuple(top if symbol is SAME else symbol for symbol in pushed)
+                stack.extend(pushed)
+                position += 1
+        finally:
+            configuration.position, configuration.register = position, state
+            configuration.steps += position - start
+        if position < len(word):
+            return StepStatus.RUNNING
+        if position > 0 and stack == [self.bottom]:
+            return StepStatus.ACCEPTED
+        return StepStatus.REJECTED
+
+    def validate(self, word: Iterable[Any]) -> bool:
+        """
+        Determine whether ``word`` is accepted by empty stack, like
+        :meth:`~fsm_tools.PushdownAutomaton.validate`.
+
+        :param word: Input word to validate.
+        :type word: Iterable[Any]
+        :return: ``True`` if ``word`` is accepted, ``False`` otherwise.
+        :rtype: bool
+        :raises ReadError: If a symbol is not in the input alphabet.
+        """
+        configuration = self.configuration(word)
+        if self.run(configuration) is StepStatus.STUCK:
+            return False
+        return configuration.position > 0 and configuration.stack == [self.bottom]
+
+    def __repr__(self) -> str:
+        return f"PushdownDefinition(name={self.name!r}, transitions={len(self.transitions)})"
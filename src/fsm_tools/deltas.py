@@ -0,0 +1,50 @@
+"""
+Compact per-step records streamed by ``iter_steps()``.
+
+Snapshotting ``tape``, ``head`` and ``register`` after every call to ``step()`` costs
+O(tape length) per step. ``iter_steps()`` instead yields one :class:`StepDelta` per
+transition, holding only what the transition changed, so that a full trace takes
+O(steps) memory and can be streamed to a file or another pipeline stage.
+
+For a tape machine, a consumer replays a delta on a copy of the configuration with::
+
+    tape[delta.position] = delta.written
+    head = delta.position + delta.move       # element-wise for tuple positions
+    register = delta.state
+
+For a ``PushdownAutomaton``, ``popped`` is removed from the top of the stack, then
+``pushed`` is appended (its last symbol ends on top), and ``position`` is the index of the
+consumed input symbol.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Tuple
+
+
+class StepDelta(NamedTuple):
+    """
+    Changes made by one transition.
+
+    Attributes:
+        step (int): Number of the transition in the run, starting at 1.
+        rule (int): Index of the applied rule in ``grammar.rules``.
+        state (Any): Register after the transition.
+        position (Any): Head position before the transition: an ``int`` for a 1D tape or
+                        the input of a PDA, a tuple for n-D or multi-tape machines.
+        read (Any): Symbol(s) read under the head, or the consumed input symbol.
+        written (Any): Symbol(s) written at ``position``. ``None`` for a PDA.
+        move (Any): Head displacement, with the same shape as ``position``.
+        popped (Any): Symbol popped from the stack of a PDA, ``None`` otherwise.
+        pushed (tuple): Symbols pushed on the stack of a PDA, in push order.
+    """
+
+    step: int
+    rule: int
+    state: Any
+    position: Any
+    read: Any
+    written: Any
+    move: Any
+    popped: Any = None
+    pushed: Tuple[Any, ...] = ()
@@ -0,0 +1,223 @@
+"""
+Exhaustive enumeration of n-state, m-symbol machines in tree normal form.
+
+Enumerating every transition table is astronomically redundant: most tables define
+transitions that are never used, and tables that only differ by the names of their states,
+the names of their non-blank symbols, or the direction of every move, run alike. The
+enumeration of :func:`enumerate_tnf` only builds the tables in *tree normal form* (TNF):
+
+- every table starts with no transition, and runs on a blank tape from state ``A``;
+- when the run reaches a ``(state, symbol)`` pair without a transition, the table branches:
+  one child halts there, and the others define the pair with every transition allowed by
+  the symmetries below, then resume the run;
+- a transition goes to a state already used, or to the first unused state only; it writes
+  a symbol already written, or the first unused symbol only;
+- the first transition moves right, and does not stay in ``A`` (which would run right on
+  blanks forever).
+
+Each machine yielded is a leaf of this tree, in standard notation (see
+:mod:`fsm_tools.notation`), in depth-first order:
+
+- a *halting* leaf defines the pair reached as the halting transition ``1RZ``; its other
+  pairs, never reached, are ``---``;
+- an *undecided* leaf ran for ``max_steps`` steps without reaching an undefined pair.
+
+Tables defining every pair without a halting transition never halt, and are not yielded.
+Every machine that halts within ``max_steps`` steps has the same step count as one halting
+leaf; every other machine runs like a halting leaf of a larger budget or an undecided
+leaf. :func:`sweep` runs the enumeration in a process pool::
+
+    for machine, status, steps in sweep(4, max_steps=10**4, workers=8):
+        if status is StepStatus.RUNNING:
+            undecided.write(machine + "\\n")
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from typing import Iterator, List, Optional, Tuple
+
+from .notation import STATE_NAMES, _map_chunks, parse_standard
+from .status import StepStatus
+
+HALT = "1RZ"
+"""Halting transition of the halting leaves."""
+
+_Rule = Optional[Tuple[int, int, int]]
+
+
+def _format(rules: List[_Rule], width: int, halt: Optional[int] = None) -> str:
+    """Write partial rules ``(write, move, target)`` in standard notation."""
+
+    def cell(key, rule):
+        if key == halt:
+            return HALT
+        if rule is None:
+            return "---"
+        write, move, target = rule
+        return f"{write}{'R' if move > 0 else 'L'}{STATE_NAMES[target]}"
+
+    cells = [cell(key, rule) for key, rule in enumerate(rules)]
+    return "_".join("".join(cells[start : start + width]) for start in range(0, len(cells), width))
+
+
+def _rules(text: str) -> List[_Rule]:
+    """Read the partial rules of a standard notation without halting transitions."""
+    table = parse_standard(text)
+    return [
+        None if target < 0 else (table.write[key], table.move[key], target)
+        for key, target in enumerate(table.next_state)
+    ][: (table.n_states - 2) * table.n_symbols]
+
+
+def _leaves(
+    n_states: int,
+    n_symbols: int,
+    max_steps: int,
+    rules: Optional[List[_Rule]] = None,
+    split: Optional[int] = None,
+) -> Iterator[Tuple[str, Optional[StepStatus], int]]:
+    """
+    Walk the TNF tree from ``rules`` (the root when ``None``), depth first.
+
+    Yield ``(machine, status, steps)`` for each leaf, and ``(machine, None, 0)`` for each
+    node defining ``split`` pairs, whose subtree is not walked.
+    """
+    width = n_symbols
+    if rules is None:
+        rules = [None] * (n_states * width)
+    defined = sum(rule is not None for rule in rules)
+    top_state = max([0] + [rule[2] for rule in rules if rule is not None])
+    top_symbol = max([0] + [rule[0] for rule in rules if rule is not None])
+    stack = [(rules, defined, top_state, top_symbol, 0, bytearray(64), 32, 0)]
+    while stack:
+        rules, defined, top_state, top_symbol, state, cells, head, steps = stack.pop()
+        if split is not None and defined >= split:
+            yield _format(rules, width), None, 0
+            continue
+        key = state * width + cells[head]
+        while steps < max_steps and rules[key] is not None:
+            cells[head], move, state = rules[key]
+            head += move
+            steps += 1
+            if head < 0:
+                grown = len(cells)
+                cells[:0] = bytearray(grown)
+                head += grown
+            elif head >= len(cells):
+                cells.extend(bytearray(len(cells)))
+            key = state * width + cells[head]
+        if steps == max_steps:
+            yield _format(rules, width), StepStatus.RUNNING, steps
+            continue
+        yield _format(rules, width, halt=key), StepStatus.ACCEPTED, steps + 1
+        if defined == len(rules) - 1:
+            continue
+        children = []
+        for write in range(min(top_symbol + 2, width)):
+            for move in (1,) if steps == 0 else (-1, 1):
+                for target in range(1 if steps == 0 else 0, min(top_state + 2, n_states)):
+                    child = rules.copy()
+                    child[key] = (write, move, target)
+                    children.append(
+                        (
+                            child,
+                            defined + 1,
+                            max(top_state, target),
+                            max(top_symbol, write),
+                            state,
+                            cells.copy(),
+                            head,
+                            steps,
+                        )
+                    )
+        stack.extend(reversed(children))
+
+
+def enumerate_tnf(n_states: int, n_symbols: int = 2, max_steps: int = 1000) -> Iterator[str]:
+    """
+    Enumerate the machines in tree normal form, in standard notation.
+
+    :param n_states: Number of states, at most 26.
+    :type n_states: int
+    :param n_symbols: Number of symbols, blank included, from 2 to 10.
+    :type n_symbols: int
+    :param max_steps: Steps after which a run without undefined pairs is an undecided leaf.
+    :type max_steps: int
+    :return: The halting and undecided leaves, depth first.
+    :rtype: Iterator[str]
+    :raises ValueError: If ``n_states`` or ``n_symbols`` is out of range.
+    """
+    _check(n_states, n_symbols)
+    return (machine for machine, _, _ in _leaves(n_states, n_symbols, max_steps))
+
+
+def _check(n_states: int, n_symbols: int) -> None:
+    if not 1 <= n_states <= len(STATE_NAMES) or not 2 <= n_symbols <= 10:
+        raise ValueError(
+            f"n_states must be in [1, 26] and n_symbols in [2, 10]. Got {n_states}, {n_symbols}."
+        )
+
+
+def _expand_chunk(
+    arguments: Tuple[List[Tuple[str, Optional[StepStatus], int]], int, int, int],
+) -> List[Tuple[str, StepStatus, int]]:
+    """Walk the subtrees of a chunk of nodes (picklable worker of :func:`sweep`)."""
+    nodes, n_states, n_symbols, max_steps = arguments
+    results = []
+    for machine, status, steps in nodes:
+        if status is None:
+            results.extend(_leaves(n_states, n_symbols, max_steps, _rules(machine)))
+        else:
+            results.append((machine, status, steps))
+    return results
+
+
+def sweep(
+    n_states: int,
+    n_symbols: int = 2,
+    max_steps: int = 1000,
+    workers: Optional[int] = None,
+    split: int = 4,
+    chunk_size: int = 16,
+    mp_context: Optional[multiprocessing.context.BaseContext] = None,
+) -> Iterator[Tuple[str, StepStatus, int]]:
+    """
+    Enumerate and run the machines in tree normal form, in a process pool.
+
+    The calling process walks the top of the tree, down to the nodes defining ``split``
+    pairs, and the workers walk their subtrees, so the leaves are never run twice. Leaves
+    are yielded in the order of :func:`enumerate_tnf`, with at most ``workers`` chunks of
+    nodes in progress at once.
+
+    :param n_states: Number of states, at most 26.
+    :type n_states: int
+    :param n_symbols: Number of symbols, blank included, from 2 to 10.
+    :type n_symbols: int
+    :param max_steps: Steps after which a run without undefined pairs is an undecided leaf.
+    :type max_steps: int
+    :param workers: Number of worker processes. ``None`` runs in the calling process.
+    :type workers: int | None
+    :param split: Number of defined pairs of the nodes handed to the workers.
+    :type split: int
+    :param chunk_size: Number of nodes handed to a worker at once.
+    :type chunk_size: int
+    :param mp_context: Multiprocessing context of the pool. Defaults to the default context.
+    :type mp_context: multiprocessing.context.BaseContext | None
+    :return: ``(machine, status, steps)`` for each leaf: ``ACCEPTED`` and the step count,
+             halting transition included, for a halting leaf; ``RUNNING`` and
+             ``max_steps`` for an undecided leaf.
+    :rtype: Iterator[Tuple[str, StepStatus, int]]
+    :raises ValueError: If ``n_states``, ``n_symbols``, ``chunk_size`` or ``workers`` is
+                        out of range.
+    """
+    _check(n_states, n_symbols)
+    nodes = _leaves(n_states, n_symbols, max_steps, split=split)
+    return _map_chunks(
+        _expand_chunk,
+        nodes,
+        (n_states, n_symbols, max_steps),
+        workers,
+        chunk_size,
+        mp_context,
+    )
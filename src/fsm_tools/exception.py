@@ -95,15 +95,24 @@ class AutomatonException(Exception):
 
 
 class AutomatonError(AutomatonException):
-    event = {}
+    """
+    Exception carrying a detailed error message built from the ``event`` keywords.
+
+    ``error_class`` is the built-in exception type recorded in the group of the error.
+    The event is stored on the instance, so that errors raised concurrently by several
+    threads never share their details.
+    """
+
+    error_class: type = Exception
 
     def __init__(
         self, grammar: str, component: str, action: str, locale: str = None, **event
     ) -> None:
+        self.event: dict = {}
         super().__init__(grammar, component, action, locale)
         self.domains.append("errors")
         if event:
-            self.event["format"] = event
+            self.event = {"cls": self.error_class, "format": event}
         self.message = self.generate_message(self.locale)
 
     def generate_message(self, locale: str) -> str:
@@ -131,61 +140,96 @@ class AutomatonError(AutomatonException):
 class ReadError(AutomatonError):
     """Error raised for reading actions (01, AttributeError)."""
 
+    error_class = AttributeError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = AttributeError
         super().__init__(grammar_level, component, "read", locale, **event)
 
 
 class AddError(AutomatonError):
     """Error raised for addition actions (02, ValueError)."""
 
+    error_class = ValueError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = ValueError
         super().__init__(grammar_level, component, "add", locale, **event)
 
 
 class RemoveError(AutomatonError):
     """Error raised for removal actions (03, KeyError)."""
 
+    error_class = KeyError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = KeyError
         super().__init__(grammar_level, component, "remove", locale, **event)
 
 
 class ModifyError(AutomatonError):
     """Error raised for modification actions (04, ValueError)."""
 
+    error_class = ValueError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = ValueError
         super().__init__(grammar_level, component, "modify", locale, **event)
 
 
 class ValidationError(AutomatonError):
     """Error raised for validation actions (05, AssertionError)."""
 
+    error_class = AssertionError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = AssertionError
         super().__init__(grammar_level, component, "validate", locale, **event)
 
 
 class SearchError(AutomatonError):
     """Error raised for search actions (06, KeyError)."""
 
+    error_class = KeyError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = KeyError
         super().__init__(grammar_level, component, "search", locale, **event)
 
 
 class RemoveComponentError(AutomatonError):
     """Error raised for component withdrawal actions (19, RuntimeError)."""
 
+    error_class = RuntimeError
+
     def __init__(self, grammar_level, component, locale=None, **event):
-        if event:
-            self.event["cls"] = RuntimeError
         super().__init__(grammar_level, component, "withdraw", locale, **event)
+
+
+class LimitExceeded(AutomatonError):
+    """
+    Error raised when a run exceeds one of its limits (20, RuntimeError).
+
+    Attributes:
+        limit (str): ``"steps"``, ``"cells"``, ``"stack"``, ``"deadline"`` or ``"cancel"``.
+        steps (int): Number of steps executed when the limit was detected.
+    """
+
+    error_class = RuntimeError
+
+    def __init__(self, grammar_level, limit, steps, locale=None):
+        self.limit = limit
+        self.steps = steps
+        super().__init__(grammar_level, "validation", "exceed", locale, limit=limit, steps=steps)
+
+
+class NonHalting(AutomatonError):
+    """
+    Error raised by :meth:`~fsm_tools.TuringMachine.run` when a decider proves that the
+    machine never halts (05, RuntimeError).
+
+    Attributes:
+        certificate (Certificate): The proof.
+    """
+
+    error_class = RuntimeError
+
+    def __init__(self, grammar_level, certificate, locale=None):
+        self.certificate = certificate
+        super().__init__(
+            grammar_level, "moves", "validate", locale, kind=certificate.kind, step=certificate.end
+        )
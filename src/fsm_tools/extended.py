@@ -14,13 +14,17 @@ This is a direct illustration of the Church-Turing thesis.
 Hierarchy::
 
     TuringMachine (advanced.py — 1D, formal)
-    └── ExtendedTuringMachine   (n-D, dict-based infinite tape)
-        └── ExtendedLBA         (n-D, dict-based bounded tape)
+    ├── ExtendedTuringMachine   (n-D, dict-based infinite tape)
+    │   └── ExtendedLBA         (n-D, dict-based bounded tape)
+    └── MultiTapeTuringMachine  (k independent 1D tapes and heads)
+
+``MultiTapeTuringMachine`` follows the same principle: k tapes recognise the same
+languages as one, but many algorithms need asymptotically fewer steps with them.
 """
 
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Optional, Sequence, Tuple
 
 from .advanced import TuringMachine
 from .exception import ReadError
@@ -49,6 +53,9 @@ class ExtendedTuringMachine(TuringMachine):
     :type name: str
     :param axes: Number of tape dimensions. Must be >= 1. Defaults to 1.
     :type axes: int
+    :param tape_backend: Class storing a 1D tape instead of the dict, e.g.
+        :class:`~fsm_tools.tapes.ZipperTape`. Requires ``axes=1``.
+    :type tape_backend: type | None
     """
 
     def _validate_axes(self, axes: int) -> None:
@@ -72,6 +79,7 @@ class ExtendedTuringMachine(TuringMachine):
         accept: str = "OK",
         reject: str = "nOK",
         chomsky: str = "Recursively Enumerable",
+        tape_backend: Optional[type] = None,
     ):
         super().__init__(
             name,
@@ -82,10 +90,12 @@ class ExtendedTuringMachine(TuringMachine):
             accept=accept,
             reject=reject,
             chomsky=chomsky,
+            tape_backend=tape_backend,
         )
         # Replace the list-based tape with a dict-based infinite tape.
         # Keys are tuples of head coordinates; values are tape symbols.
-        self.tape = {}
+        if tape_backend is None:
+            self.tape = {}
 
     def _extend_tape(self, location: list) -> None:
         """
@@ -107,19 +117,34 @@ class ExtendedTuringMachine(TuringMachine):
         :return: Symbol at the current head position.
         :rtype: Any
         """
+        if self.tape_backend is not None:
+            return self.tape.read(self.head[0])
         return self.tape.get(tuple(self.head), self.blank)
 
     def write(self, symbol: Any) -> None:
         """
         Write a symbol at the current head position.
 
-        If the symbol is not in the alphabet it is added automatically.
+        If the symbol is neither in the alphabet nor matched by the symbol class of a rule,
+        it is added to the alphabet automatically.
 
         :param symbol: Symbol to write.
         :type symbol: Any
         """
-        if symbol not in self.grammar.alphabet:
+        if not self._in_alphabet(symbol):
             self.add_terminals(symbol)
+        self._write_cell(symbol)
+
+    def _write_cell(self, symbol: Any) -> None:
+        """
+        Write a symbol at the current head position, without checking the alphabet.
+
+        :param symbol: Symbol to write.
+        :type symbol: Any
+        """
+        if self.tape_backend is not None:
+            self.tape.write(self.head[0], symbol)
+            return
         self.tape[tuple(self.head)] = symbol
 
     def set_tape(self, content: List[Any], location: List[int] = None) -> None:
@@ -146,9 +171,98 @@ class ExtendedTuringMachine(TuringMachine):
                     raise ReadError(self.GRAMMAR, "alphabet", symbol=data)
                 self.tape[tuple(coords)] = data
 
+        self.head = location if location is not None else [0] * self.axes
+        if self.tape_backend is not None:
+            for symbol in content:
+                if symbol not in self.get_terminals():
+                    raise ReadError(self.GRAMMAR, "alphabet", symbol=symbol)
+            self.tape = self.tape_backend(self.blank, content)
+            return
         self.tape = {}
         validate_and_load(content, [])
-        self.head = location if location is not None else [0] * self.axes
+
+    def _tape_snapshot(self) -> Tuple[int, list]:
+        """Not supported: checkpoints hold a single 1D tape."""
+        raise NotImplementedError("Checkpoints support machines with a single 1D tape only.")
+
+    def definition(self):
+        """Not supported: definitions run a single 1D tape."""
+        raise NotImplementedError("Definitions support machines with a single 1D tape only.")
+
+    def _head_position(self) -> Any:
+        """
+        Return the head position in the form used by configurations and step deltas.
+
+        :return: The head coordinates.
+        :rtype: tuple
+        """
+        return tuple(self.head)
+
+    def _move_vector(self, direction: str) -> List[int]:
+        """
+        Return the head displacement of a move, one value per dimension.
+
+        :param direction: A key of ``self.moves``.
+        :type direction: str
+        :return: Displacement of the head along each axis.
+        :rtype: List[int]
+        """
+        delta = self.moves[direction]
+        return list(delta) if isinstance(delta, list) else [delta]
+
+    def _head_allowed(self, position: Any) -> bool:
+        """
+        Tell whether the head may read at ``position``: always, the tape is unbounded.
+
+        :param position: Head position, as stored in a configuration.
+        :type position: Any
+        :return: ``True``.
+        :rtype: bool
+        """
+        return True
+
+    def _configuration(self) -> tuple:
+        """
+        Return the canonical configuration of the machine for configuration-space search.
+
+        The configuration is ``(register, head, cells)`` where ``head`` is a tuple and
+        ``cells`` is the frozen set of the non-blank ``(position, symbol)`` items.
+
+        :return: The current configuration.
+        :rtype: tuple
+        """
+        cells = frozenset(item for item in self.tape.items() if item[1] != self.blank)
+        return self.register, tuple(self.head), cells
+
+    def _successors(self, configuration: tuple, index: dict) -> list:
+        """
+        Return every configuration reachable from ``configuration`` in one transition.
+
+        :param configuration: A configuration built by :meth:`_configuration`.
+        :type configuration: tuple
+        :param index: Mapping ``(state, symbol)`` to the list of ``(state_to, write_symbol,
+                      move_direction)`` branches.
+        :type index: dict
+        :return: The successor configurations.
+        :rtype: list
+        """
+        state, head, cells = configuration
+        accept = self.validation["accept"]
+        if state == accept or state == self.validation["reject"]:
+            return []
+        tape = dict(cells)
+        symbol = tape.get(head, self.blank)
+        successors = []
+        for state_to, write_symbol, move_direction in index.get((state, symbol), ()):
+            written = dict(tape)
+            if write_symbol == self.blank:
+                written.pop(head, None)
+            else:
+                written[head] = write_symbol
+            position = tuple(p + d for p, d in zip(head, self._move_vector(move_direction)))
+            if state_to == accept or self._head_allowed(position):
+                successors.append((state_to, position, frozenset(written.items())))
+        return successors
 
 
 class ExtendedLBA(ExtendedTuringMachine):
@@ -217,6 +331,17 @@ class ExtendedLBA(ExtendedTuringMachine):
                     f"limit of {self.limits[i]}."
                 )
 
+    def _head_allowed(self, position: Any) -> bool:
+        """
+        Tell whether the head may read at ``position`` without leaving the bounded tape.
+
+        :param position: Head position, as stored in a configuration.
+        :type position: Any
+        :return: ``True`` if the position is within the limit of every dimension.
+        :rtype: bool
+        """
+        return all(abs(pos) < limit for pos, limit in zip(position, self.limits))
+
     def read(self) -> Any:
         """
         Read the symbol at the current head position, enforcing tape bounds.
@@ -237,10 +362,21 @@ class ExtendedLBA(ExtendedTuringMachine):
         :raises IndexError: If the head is out of bounds.
         """
         self._extend_tape(self.head)
-        if symbol not in self.grammar.alphabet:
+        if not self._in_alphabet(symbol):
             self.add_terminals(symbol)
         self.tape[tuple(self.head)] = symbol
 
+    def _write_cell(self, symbol: Any) -> None:
+        """
+        Write a symbol at the current head position, without checking the alphabet.
+
+        :param symbol: Symbol to write.
+        :type symbol: Any
+        :raises IndexError: If the head is out of bounds.
+        """
+        self._extend_tape(self.head)
+        self.tape[tuple(self.head)] = symbol
+
     def set_tape(self, content: List[Any], location: List[int] = None) -> None:
         """
         Initialise the tape from a (possibly nested) list of symbols,
@@ -272,3 +408,311 @@ class ExtendedLBA(ExtendedTuringMachine):
         self.tape = {}
         validate_and_load(content, [])
         self.head = location if location is not None else [0] * self.axes
+
+
+class MultiTapeTuringMachine(TuringMachine):
+    """
+    A Turing Machine with ``n_tapes`` independent right-infinite 1D tapes, one head each.
+
+    A transition reads the tuple of the symbols under the heads, writes a tuple of
+    symbols and moves every head independently::
+
+        tm.add_transition("q0", ("a", "_"), "q0", ("a", "a"), ("F1", "F1"))
+
+    Rules are stored in ``self.grammar.rules`` like those of ``TuringMachine``, with
+    tuples in place of single symbols and moves, so :meth:`step`, :meth:`run` (one
+    indexed lookup per step) and :meth:`run_nondeterministic` are inherited. A step is
+    one transition, as for a single-tape machine, so step counts of both models can be
+    compared directly.
+
+    Grammar classification: ``chomsky="Recursively Enumerable"`` (Type 0). Any k-tape
+    machine can be simulated by a single-tape one, with a quadratic slowdown.
+
+    :param name: Name of the automaton.
+    :type name: str
+    :param n_tapes: Number of tapes. Must be >= 1. Defaults to 2.
+    :type n_tapes: int
+    :param movement: Moves available to each head. Defaults to ``F1`` (right), ``B1``
+        (left) and ``S`` (stay).
+    :type movement: dict | None
+
+    Attributes:
+        n_tapes (int): Number of tapes.
+        tape (List[list]): One list of symbols per tape.
+        head (List[int]): Position of the head of each tape.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        n_tapes: int = 2,
+        blank_symbol: str = "_",
+        movement: dict = None,
+        register: str = "",
+        accept: str = "OK",
+        reject: str = "nOK",
+        chomsky: str = "Recursively Enumerable",
+    ):
+        if n_tapes < 1:
+            raise ValueError(f"MultiTapeTuringMachine requires at least 1 tape. Got {n_tapes}.")
+        super().__init__(
+            name,
+            blank_symbol=blank_symbol,
+            movement=movement if movement is not None else {"F1": [1], "B1": [-1], "S": [0]},
+            register=register,
+            accept=accept,
+            reject=reject,
+            chomsky=chomsky,
+        )
+        self.n_tapes = n_tapes
+        self.tape = [[] for _ in range(n_tapes)]
+        self.head = [0] * n_tapes
+
+    def _check_arity(self, values: Sequence[Any], name: str) -> Tuple[Any, ...]:
+        """
+        Check that ``values`` holds one entry per tape.
+
+        :param values: Symbols or moves, one per tape.
+        :type values: Sequence[Any]
+        :param name: Name of the argument, for the error message.
+        :type name: str
+        :return: ``values`` as a tuple.
+        :rtype: tuple
+        :raises ValueError: If the number of entries differs from ``n_tapes``.
+        """
+        if isinstance(values, str) or len(values) != self.n_tapes:
+            raise ValueError(f"'{name}' must contain {self.n_tapes} values, one per tape.")
+        return tuple(values)
+
+    def add_transition(
+        self,
+        state_from: str,
+        symbol: Sequence[Any],
+        state_to: str,
+        write_symbol: Sequence[Any],
+        move_direction: Sequence[str],
+    ):
+        """
+        Adds a transition rule acting on every tape at once.
+
+        :param state_from: The current state of the machine.
+        :type state_from: str
+        :param symbol: The symbols under the heads, one per tape.
+        :type symbol: Sequence[Any]
+        :param state_to: The next state of the machine.
+        :type state_to: str
+        :param write_symbol: The symbols to write, one per tape.
+        :type write_symbol: Sequence[Any]
+        :param move_direction: The moves of the heads, one key of ``self.moves`` per tape.
+        :type move_direction: Sequence[str]
+        :raises ReadError: If a read symbol is not in the alphabet.
+        :raises ValueError: If a tuple does not have one value per tape, or a move is invalid.
+        """
+        symbol = self._check_arity(symbol, "symbol")
+        write_symbol = self._check_arity(write_symbol, "write_symbol")
+        move_direction = self._check_arity(move_direction, "move_direction")
+        for read_symbol in symbol:
+            if read_symbol not in self.get_terminals():
+                raise ReadError(self.GRAMMAR, "alphabet", symbol=read_symbol)
+        for direction in move_direction:
+            if direction not in self.moves:
+                raise ValueError(f"Invalid move direction '{direction}'. Must be {self.moves}.")
+
+        for state in (state_from, state_to):
+            if state not in self.get_states():
+                self.add_non_terminals(state)
+        self.add_rules((state_from, symbol, state_to, write_symbol, move_direction))
+
+    def _per_tape(self, value: Any) -> tuple:
+        """
+        Return the per-tape values of a rule component, which is already a tuple.
+
+        :param value: The symbols or moves of a rule.
+        :type value: Any
+        :return: ``value``.
+        :rtype: tuple
+        """
+        return value
+
+    def _extend_tape(self, location: list) -> None:
+        """
+        Extends each tape to the right to accommodate the position of its head.
+
+        :param location: Position of the head of each tape.
+        :type location: list
+        :raises IndexError: If a head position is negative.
+        """
+        for number, (cells, pos) in enumerate(zip(self.tape, location)):
+            if pos < 0:
+                raise IndexError(
+                    f"Head position {pos} of tape {number} is out of bounds: "
+                    f"tapes start at position 0."
+                )
+            while len(cells) <= pos:
+                cells.append(self.blank)
+
+    def set_tape(self, content: List[Any], location: List[int] = None) -> None:
+        """
+        Load the input word on the first tape and blank the other ones.
+
+        :param content: Symbols to load onto the first tape.
+        :type content: List[Any]
+        :param location: Starting position of each head. Defaults to the origin.
+        :type location: List[int] | None
+        :raises ReadError: If any symbol is not in the alphabet.
+        """
+        for symbol in content:
+            if symbol not in self.get_terminals():
+                raise ReadError(self.GRAMMAR, "alphabet", symbol=symbol)
+        self.head = list(location) if location is not None else [0] * self.n_tapes
+        self.tape = [list(content)] + [[] for _ in range(self.n_tapes - 1)]
+        self._extend_tape(self.head)
+
+    def read(self) -> Tuple[Any, ...]:
+        """
+        Read the symbols under the heads.
+
+        :return: One symbol per tape.
+        :rtype: tuple
+        """
+        self._extend_tape(self.head)
+        return tuple(cells[pos] for cells, pos in zip(self.tape, self.head))
+
+    def write(self, symbol: Sequence[Any]) -> None:
+        """
+        Write one symbol under each head. Unknown symbols are added to the alphabet.
+
+        :param symbol: One symbol per tape.
+        :type symbol: Sequence[Any]
+        """
+        for written in symbol:
+            if written not in self.grammar.alphabet:
+                self.add_terminals(written)
+        self._write_cell(symbol)
+
+    def _write_cell(self, symbol: Sequence[Any]) -> None:
+        """
+        Write one symbol under each head, without checking the alphabet.
+
+        :param symbol: One symbol per tape.
+        :type symbol: Sequence[Any]
+        """
+        self._extend_tape(self.head)
+        for cells, pos, written in zip(self.tape, self.head, symbol):
+            cells[pos] = written
+
+    def move(self, direction: Sequence[str]) -> None:
+        """
+        Move every head in its own direction.
+
+        :param direction: One key of ``self.moves`` per tape.
+        :type direction: Sequence[str]
+        :raises ValueError: If a direction is not in ``self.moves``.
+        """
+        for number, step in enumerate(direction):
+            if step not in self.moves:
+                raise ValueError(
+                    f"Invalid direction '{step}'. Must be one of {list(self.moves.keys())}."
+                )
+            self.head[number] += self._move_delta(step)
+
+    def _copy_tape(self, tape: Any) -> Any:
+        """
+        Return an independent copy of every tape.
+
+        :param tape: The tapes of this machine.
+        :type tape: List[list]
+        :return: The copy.
+        :rtype: List[list]
+        """
+        return [cells.copy() for cells in tape]
+
+    def _tape_snapshot(self) -> Tuple[int, list]:
+        """Not supported: checkpoints hold a single 1D tape."""
+        raise NotImplementedError("Checkpoints support machines with a single 1D tape only.")
+
+    def definition(self):
+        """Not supported: definitions run a single 1D tape."""
+        raise NotImplementedError("Definitions support machines with a single 1D tape only.")
+
+    def _tape_cells(self) -> int:
+        """
+        Return the number of cells held by all the tapes, checked by ``Limits``.
+
+        :return: The number of cells.
+        :rtype: int
+        """
+        return sum(len(cells) for cells in self.tape)
+
+    def _head_position(self) -> Any:
+        """
+        Return the head positions in the form used by configurations and step deltas.
+
+        :return: The position of the head of each tape.
+        :rtype: tuple
+        """
+        return tuple(self.head)
+
+    def _head_allowed(self, position: Any) -> bool:
+        """
+        Tell whether every head may read at ``position``.
+
+        :param position: Head positions, as stored in a configuration.
+        :type position: Any
+        :return: ``True`` if no head is left of its tape.
+        :rtype: bool
+        """
+        return all(pos >= 0 for pos in position)
+
+    def _configuration(self) -> tuple:
+        """
+        Return the canonical configuration of the machine for configuration-space search.
+
+        The configuration is ``(register, heads, tapes)`` where ``tapes`` holds one tuple
+        per tape, without its trailing blanks.
+
+        :return: The current configuration.
+        :rtype: tuple
+        """
+        tapes = []
+        for cells in self.tape:
+            end = len(cells)
+            while end and cells[end - 1] == self.blank:
+                end -= 1
+            tapes.append(tuple(cells[:end]))
+        return self.register, tuple(self.head), tuple(tapes)
+
+    def _successors(self, configuration: tuple, index: dict) -> list:
+        """
+        Return every configuration reachable from ``configuration`` in one transition.
+
+        :param configuration: A configuration built by :meth:`_configuration`.
+        :type configuration: tuple
+        :param index: Mapping ``(state, symbols)`` to the list of ``(state_to,
+                      write_symbols, move_directions)`` branches.
+        :type index: dict
+        :return: The successor configurations.
+        :rtype: list
+        """
+        state, heads, tapes = configuration
+        accept = self.validation["accept"]
+        if state == accept or state == self.validation["reject"]:
+            return []
+        blank = self.blank
+        symbol = tuple(
+            cells[pos] if pos < len(cells) else blank for cells, pos in zip(tapes, heads)
+        )
+        successors = []
+        for state_to, write_symbol, move_direction in index.get((state, symbol), ()):
+            written = []
+            for cells, pos, new in zip(tapes, heads, write_symbol):
+                cells = cells + (blank,) * (pos + 1 - len(cells))
+                cells = cells[:pos] + (new,) + cells[pos + 1 :]
+                end = len(cells)
+                while end and cells[end - 1] == blank:
+                    end -= 1
+                written.append(cells[:end])
+            position = tuple(p + self._move_delta(d) for p, d in zip(heads, move_direction))
+            if state_to == accept or self._head_allowed(position):
+                successors.append((state_to, position, tuple(written)))
+        return successors
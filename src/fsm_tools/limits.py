@@ -0,0 +1,124 @@
+"""
+Resource governor for machine runs.
+
+A run is only bounded by its ``max_steps`` argument: a Turing Machine can grow its tape
+and a Pushdown Automaton its stack until the process runs out of memory. A
+:class:`Limits` object, given to ``run()``, ``run_status()``, ``arun()``, ``validate()``
+or :meth:`~fsm_tools.batch.BatchTuringMachine.run`, bounds:
+
+- the number of steps;
+- the number of tape cells held by the machine;
+- the depth of the stack;
+- the wall-clock time (relative ``timeout`` or absolute ``deadline``);
+- and lets another thread or task stop the run through a cancel token.
+
+To keep the hot loop untouched, the run is split in slices of ``check_every`` steps and
+the limits are checked between two slices. The step budget is exact; the other limits
+are detected at most ``check_every`` steps late. A limit exceeded raises
+:class:`LimitExceeded`, leaving the machine in the configuration it reached.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Optional
+
+from .exception import LimitExceeded
+
+
+class Limits:
+    """
+    Budgets of a run.
+
+    Attributes:
+        max_steps (int | None): Maximum number of steps before the machine halts.
+        max_cells (int | None): Maximum number of tape cells held by the machine.
+        max_stack (int | None): Maximum depth of the stack.
+        timeout (float | None): Maximum duration of a run, in seconds.
+        deadline (float | None): Absolute ``time.monotonic()`` value ending any run.
+        cancel (Any): Cancel token: any object with an ``is_set()`` method, such as a
+                      ``threading.Event``. The run stops once it is set.
+        check_every (int): Number of steps between two checks.
+    """
+
+    def __init__(
+        self,
+        max_steps: Optional[int] = None,
+        max_cells: Optional[int] = None,
+        max_stack: Optional[int] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        cancel: Any = None,
+        check_every: int = 1024,
+    ):
+        """
+        Initializes the budgets. ``None`` means no limit.
+
+        :raises ValueError: If ``check_every`` is less than 1.
+        """
+        if check_every < 1:
+            raise ValueError(f"check_every must be at least 1. Got {check_every}.")
+        self.max_steps = max_steps
+        self.max_cells = max_cells
+        self.max_stack = max_stack
+        self.timeout = timeout
+        self.deadline = deadline
+        self.cancel = cancel
+        self.check_every = check_every
+
+    def deadline_from(self, start: float) -> Optional[float]:
+        """
+        Return the deadline of a run started at ``start``.
+
+        :param start: ``time.monotonic()`` value at the start of the run.
+        :type start: float
+        :return: The earliest of ``deadline`` and ``start + timeout``, or ``None``.
+        :rtype: float | None
+        """
+        deadline = self.deadline
+        if self.timeout is not None:
+            end = start + self.timeout
+            deadline = end if deadline is None else min(deadline, end)
+        return deadline
+
+    def step_budget(self, machine: Any, steps: int, slice_steps: int) -> int:
+        """
+        Return the length of the next slice of a run that executed ``steps`` steps.
+
+        :param machine: The running machine, providing ``GRAMMAR``.
+        :type machine: Any
+        :param steps: Steps executed so far.
+        :type steps: int
+        :param slice_steps: Desired length of the slice.
+        :type slice_steps: int
+        :return: ``slice_steps``, shortened to stay within ``max_steps``.
+        :rtype: int
+        :raises LimitExceeded: If the step budget is spent.
+        """
+        if self.max_steps is None:
+            return slice_steps
+        if steps >= self.max_steps:
+            raise LimitExceeded(machine.GRAMMAR, "steps", steps)
+        return min(slice_steps, self.max_steps - steps)
+
+    def check(self, machine: Any, steps: int, deadline: Optional[float]) -> None:
+        """
+        Check the cancel token, the deadline and the memory held by ``machine``.
+
+        :param machine: The running machine, providing ``GRAMMAR``, ``_tape_cells()`` and
+                        ``_stack_depth()``.
+        :type machine: Any
+        :param steps: Steps executed so far.
+        :type steps: int
+        :param deadline: Deadline returned by :meth:`deadline_from`.
+        :type deadline: float | None
+        :raises LimitExceeded: If a limit is exceeded.
+        """
+        if self.cancel is not None and self.cancel.is_set():
+            raise LimitExceeded(machine.GRAMMAR, "cancel", steps)
+        if deadline is not None and time.monotonic() >= deadline:
+            raise LimitExceeded(machine.GRAMMAR, "deadline", steps)
+        if self.max_cells is not None and machine._tape_cells() > self.max_cells:
+            raise LimitExceeded(machine.GRAMMAR, "cells", steps)
+        if self.max_stack is not None and machine._stack_depth() > self.max_stack:
+            raise LimitExceeded(machine.GRAMMAR, "stack", steps)
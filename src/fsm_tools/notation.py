@@ -0,0 +1,369 @@
+"""
+Standard text notation of busy-beaver machines, and a streaming runner for corpora.
+
+Machine corpora are exchanged in a compact text format: one group of transitions per
+state, states ``A``, ``B``, ... separated by ``_``, one transition of three characters per
+symbol ``0``, ``1``, ... of the group. A transition is the symbol written, the direction
+(``L`` or ``R``) and the target state; ``---`` leaves the pair without a transition::
+
+    1RB1LB_1LA0LC_1RZ1LD_1RD0RA
+
+The run starts in state ``A`` on a blank two-way tape, the blank being ``0``. A target
+state that is not one of the groups (usually ``Z`` or ``H``) halts the machine.
+
+:func:`parse_standard` builds a :class:`~fsm_tools.compiled.CompiledTable` directly from
+the text, without going through ``add_transition()``: the halting targets are coded as the
+accept state ``OK``. :func:`run_table` runs a table on a blank tape in a tight loop, and
+:func:`run_file` streams a corpus, one machine per line, writing the verdict of each
+machine as soon as its chunk is done::
+
+    run_file("machines.txt", "verdicts.tsv", max_steps=10**6, workers=8)
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import string
+from array import array
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .advanced import TuringMachine
+from .compiled import UNDEFINED, CompiledTable
+from .status import StepStatus
+from .tapes import ZipperTape
+
+STATE_NAMES = string.ascii_uppercase
+"""Names of the states of the notation, in code order."""
+
+ACCEPT = "OK"
+"""State reached by the halting transitions of a parsed table."""
+
+REJECT = "nOK"
+"""Reject state of a parsed table, never reached."""
+
+_MOVES = {"L": -1, "R": 1}
+_DIRECTIONS = {-1: "L", 1: "R"}
+
+
+def parse_standard(text: str) -> CompiledTable:
+    """
+    Build the compiled table of a machine given in standard notation.
+
+    States are ``A``, ``B``, ... in code order, followed by ``OK`` and ``nOK``; symbols
+    are the digits ``0``, ``1``, ... in code order.
+
+    :param text: The machine, e.g. ``"1RB1LB_1LA1RZ"``.
+    :type text: str
+    :return: The compiled table, starting in state ``A``.
+    :rtype: CompiledTable
+    :raises ValueError: If ``text`` is not a valid machine.
+    """
+    groups = text.strip().split("_")
+    n_states = len(groups)
+    width, extra = divmod(len(groups[0]), 3)
+    if extra or not 2 <= width <= 10 or n_states > len(STATE_NAMES):
+        raise ValueError(f"Invalid machine '{text}'.")
+    states = list(STATE_NAMES[:n_states]) + [ACCEPT, REJECT]
+    size = len(states) * width
+    next_state = array("i", [UNDEFINED]) * size
+    write = array("i", [0]) * size
+    move = array("i", [0]) * size
+    key = 0
+    for group in groups:
+        if len(group) != 3 * width:
+            raise ValueError(f"Invalid machine '{text}': groups must have the same length.")
+        for offset in range(0, 3 * width, 3):
+            symbol, direction, target = group[offset : offset + 3]
+            if symbol != "-" or direction != "-" or target != "-":
+                code = ord(symbol) - 48
+                state = STATE_NAMES.find(target)
+                if not 0 <= code < width or direction not in _MOVES or state < 0:
+                    raise ValueError(
+                        f"Invalid machine '{text}': bad transition '{group[offset:offset + 3]}'."
+                    )
+                next_state[key] = state if state < n_states else n_states
+                write[key] = code
+                move[key] = _MOVES[direction]
+            key += 1
+    return CompiledTable(
+        states,
+        [str(code) for code in range(width)],
+        next_state,
+        write,
+        move,
+        start=0,
+        accept=n_states,
+        reject=n_states + 1,
+    )
+
+
+def format_standard(table: CompiledTable, halt: str = "Z") -> str:
+    """
+    Write a compiled table in standard notation, the inverse of :func:`parse_standard`.
+
+    Symbols are written as their codes. The states of the table, except the accept and
+    reject states, are written as ``A``, ``B``, ... in code order, starting state first;
+    transitions to the accept or reject state are written to ``halt``.
+
+    :param table: A table whose moves are all ``-1`` or ``+1``, with at most 10 symbols.
+    :type table: CompiledTable
+    :param halt: Name of the halting state.
+    :type halt: str
+    :return: The machine in standard notation.
+    :rtype: str
+    :raises ValueError: If the table cannot be written in standard notation.
+    """
+    width = table.n_symbols
+    halting = {table.accept, table.reject}
+    order = [table.start] + [
+        code for code in range(table.n_states) if code != table.start and code not in halting
+    ]
+    if width > 10 or len(order) > len(STATE_NAMES):
+        raise ValueError(f"Table too large for standard notation: {len(order)}x{width}.")
+    names = {code: STATE_NAMES[index] for index, code in enumerate(order)}
+    groups = []
+    for state in order:
+        group = []
+        for key in range(state * width, (state + 1) * width):
+            target = table.next_state[key]
+            if target == UNDEFINED:
+                group.append("---")
+                continue
+            if table.move[key] not in _DIRECTIONS:
+                raise ValueError(f"Move {table.move[key]} cannot be written in standard notation.")
+            group.append(
+                f"{table.write[key]}{_DIRECTIONS[table.move[key]]}{names.get(target, halt)}"
+            )
+        groups.append("".join(group))
+    return "_".join(groups)
+
+
+def to_machine(text: str, tape_backend: Optional[type] = ZipperTape) -> TuringMachine:
+    """
+    Build a :class:`~fsm_tools.TuringMachine` from standard notation, e.g. to hand a
+    machine to the non-halting deciders (:mod:`fsm_tools.deciders`).
+
+    The machine is named after ``text``, starts in state ``A`` on a blank tape, the blank
+    being ``"0"``, and moves with ``L`` and ``R``. Halting targets go to ``OK``.
+
+    :param text: The machine in standard notation.
+    :type text: str
+    :param tape_backend: Tape backend of the machine. The default two-way tape matches
+                         :func:`run_table`; ``None`` uses a right-infinite list.
+    :type tape_backend: type | None
+    :return: The machine.
+    :rtype: TuringMachine
+    :raises ValueError: If ``text`` is not a valid machine.
+    """
+    table = parse_standard(text)
+    tm = TuringMachine(
+        text,
+        movement={"L": [-1], "R": [1]},
+        register="A",
+        blank_symbol="0",
+        tape_backend=tape_backend,
+    )
+    tm.add_terminals(*table.symbols[1:])
+    states = table.states
+    for key, target in enumerate(table.next_state):
+        if target != UNDEFINED:
+            state, symbol = divmod(key, table.n_symbols)
+            tm.add_transition(
+                states[state],
+                table.symbols[symbol],
+                states[target],
+                table.symbols[table.write[key]],
+                _DIRECTIONS[table.move[key]],
+            )
+    return tm
+
+
+def run_table(table: CompiledTable, max_steps: int) -> Tuple[StepStatus, int]:
+    """
+    Run a table on a blank two-way tape.
+
+    A transition to the accept (or reject) state counts as a step; a run stuck on a pair
+    without a transition counts the steps performed before it.
+
+    :param table: The table to run.
+    :type table: CompiledTable
+    :param max_steps: Maximum number of steps.
+    :type max_steps: int
+    :return: The status of the run, ``RUNNING`` if it did not halt within ``max_steps``
+             steps, and the number of steps performed.
+    :rtype: Tuple[StepStatus, int]
+    """
+    next_state, write, move = table.next_state, table.write, table.move
+    width = table.n_symbols
+    accept, reject = table.accept, table.reject
+    blank = (lambda size: bytearray(size)) if width <= 256 else (lambda size: [0] * size)
+    cells = blank(64)
+    head = 32
+    state = table.start
+    steps = 0
+    while steps < max_steps:
+        key = state * width + cells[head]
+        state = next_state[key]
+        if state == UNDEFINED:
+            return StepStatus.STUCK, steps
+        cells[head] = write[key]
+        head += move[key]
+        steps += 1
+        if state == accept:
+            return StepStatus.ACCEPTED, steps
+        if state == reject:
+            return StepStatus.REJECTED, steps
+        if head < 0:
+            grown = len(cells)
+            cells[:0] = blank(grown)
+            head += grown
+        elif head >= len(cells):
+            cells.extend(blank(len(cells)))
+    return StepStatus.RUNNING, steps
+
+
+def _run_chunk(arguments: Tuple[List[str], int]) -> List[Tuple[str, StepStatus, int]]:
+    """Run the machines of a chunk (picklable worker of :func:`run_many`)."""
+    machines, max_steps = arguments
+    return [(machine, *run_table(parse_standard(machine), max_steps)) for machine in machines]
+
+
+def run_many(
+    machines: Iterable[str],
+    max_steps: int,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    mp_context: Optional[multiprocessing.context.BaseContext] = None,
+) -> Iterator[Tuple[str, StepStatus, int]]:
+    """
+    Run machines given in standard notation, lazily and in order.
+
+    The machines are read by chunks of ``chunk_size``; with ``workers``, up to
+    ``workers`` chunks run at once in a process pool. At most ``workers`` chunks are held
+    in memory, whatever the number of machines.
+
+    :param machines: Machines in standard notation.
+    :type machines: Iterable[str]
+    :param max_steps: Maximum number of steps of each run.
+    :type max_steps: int
+    :param workers: Number of worker processes. ``None`` runs in the calling process.
+    :type workers: int | None
+    :param chunk_size: Number of machines handed to a worker at once.
+    :type chunk_size: int
+    :param mp_context: Multiprocessing context of the pool. Defaults to the default context.
+    :type mp_context: multiprocessing.context.BaseContext | None
+    :return: ``(machine, status, steps)`` for each machine, as :func:`run_table`.
+    :rtype: Iterator[Tuple[str, StepStatus, int]]
+    :raises ValueError: If ``chunk_size`` or ``workers`` is less than 1, or a machine is
+                        invalid.
+    """
+    return _map_chunks(_run_chunk, machines, (max_steps,), workers, chunk_size, mp_context)
+
+
+def _map_chunks(
+    function: Callable[..., List[Any]],
+    items: Iterable[Any],
+    arguments: Tuple[Any, ...],
+    workers: Optional[int],
+    chunk_size: int,
+    mp_context: Optional[multiprocessing.context.BaseContext],
+) -> Iterator[Any]:
+    """
+    Yield the results of ``function((chunk, *arguments))`` for consecutive chunks of
+    ``items``, in order, holding at most ``workers`` chunks at once.
+    """
+    if chunk_size < 1 or (workers is not None and workers < 1):
+        raise ValueError(f"chunk_size and workers must be at least 1. Got {chunk_size}, {workers}.")
+    items = iter(items)
+    if workers is None:
+        while chunk := list(islice(items, chunk_size)):
+            yield from function((chunk, *arguments))
+        return
+    with (mp_context or multiprocessing.get_context()).Pool(workers) as pool:
+        while True:
+            chunks = [list(islice(items, chunk_size)) for _ in range(workers)]
+            chunks = [(chunk, *arguments) for chunk in chunks if chunk]
+            if not chunks:
+                return
+            for results in pool.imap(function, chunks):
+                yield from results
+
+
+def _read_machines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the first field of each line, skipping blank lines and ``#`` comments."""
+    for line in lines:
+        fields = line.split(None, 1)
+        if fields and not fields[0].startswith("#"):
+            yield fields[0]
+
+
+def run_file(
+    source: Union[str, IO[str]],
+    destination: Union[str, IO[str]],
+    max_steps: int,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> int:
+    """
+    Run a corpus of machines and write the verdict of each one, streaming both files.
+
+    ``source`` holds a machine in standard notation per line; anything after the machine
+    on a line, blank lines and lines starting with ``#`` are ignored. For each machine, a
+    line ``machine<TAB>STATUS<TAB>steps`` is written to ``destination``, in the order of
+    ``source``, where ``STATUS`` is the name of a :class:`~fsm_tools.status.StepStatus`:
+    ``ACCEPTED`` for a halting machine, ``STUCK`` for a machine reaching a ``---``
+    transition, ``RUNNING`` for a machine still running after ``max_steps`` steps.
+
+    :param source: Path or text file of the corpus.
+    :type source: str | IO[str]
+    :param destination: Path or text file of the verdicts.
+    :type destination: str | IO[str]
+    :param max_steps: Maximum number of steps of each run.
+    :type max_steps: int
+    :param workers: Number of worker processes. ``None`` runs in the calling process.
+    :type workers: int | None
+    :param chunk_size: Number of machines handed to a worker at once.
+    :type chunk_size: int
+    :return: The number of machines run.
+    :rtype: int
+    :raises ValueError: If a machine of the corpus is invalid.
+    """
+    opened = []
+    try:
+        if isinstance(source, str):
+            source = open(source, encoding="utf-8")
+            opened.append(source)
+        if isinstance(destination, str):
+            destination = open(destination, "w", encoding="utf-8")
+            opened.append(destination)
+        count = 0
+        for machine, status, steps in run_many(
+            _read_machines(source), max_steps, workers, chunk_size
+        ):
+            destination.write(f"{machine}\t{status.name}\t{steps}\n")
+            count += 1
+        return count
+    finally:
+        for file in opened:
+            file.close()
+
+
+if __name__ == "__main__":  # pragma: no cover - command line
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a corpus of machines in standard notation.")
+    parser.add_argument("source")
+    parser.add_argument("destination")
+    parser.add_argument("--max-steps", type=int, default=10**6)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    total = run_file(
+        arguments.source,
+        arguments.destination,
+        arguments.max_steps,
+        arguments.workers,
+        arguments.chunk_size,
+    )
+    print(f"{total} machines")
@@ -0,0 +1,592 @@
+"""
+Configuration-space search for nondeterministic automata.
+
+``TuringMachine.add_transition`` accepts several rules for the same ``(state, symbol)``
+pair, but :meth:`~fsm_tools.TuringMachine.step` and :meth:`~fsm_tools.TuringMachine.run`
+only ever apply the first one. This module explores *all* the successor configurations
+instead. A configuration is any hashable value describing the complete state of a machine
+(register, head, tape contents); the automaton provides:
+
+- the initial configuration;
+- a successor function returning every configuration reachable in one transition;
+- an acceptance predicate.
+
+Configurations are deduplicated by their hash, so a configuration reached through two
+different branches is only expanded once. Two strategies are available:
+
+- ``"bfs"``: breadth-first search, which finds a shortest accepting computation;
+- ``"iddfs"``: iterative deepening depth-first search, which keeps only the current
+  branch and the configurations of the current iteration in memory.
+
+The search stops as soon as any branch accepts, and respects a depth budget
+(``max_steps``) and a memory budget (``max_configurations``). The visited configurations
+are kept in an exact in-memory set, or in the backend built by the ``visited`` factory
+(see :mod:`fsm_tools.visited`).
+
+:class:`ParallelSearch` explores large configuration spaces with several worker
+processes. Each configuration is owned by one worker, chosen by a stable hash of the
+configuration: the owner alone keeps the visited set of its shard and deduplicates the
+configurations sent to it. Owned configurations wait in the local queue of their owner.
+When a worker runs out of work, busy workers hand it the oldest half of their queue
+through a shared pool, so that an unlucky hash partition does not leave cores idle. The
+first accepting configuration found stops every worker.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import queue
+import zlib
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+STRATEGIES = ("bfs", "iddfs")
+"""Names of the available search strategies."""
+
+
+class SearchResult:
+    """
+    Outcome of a configuration-space search.
+
+    Attributes:
+        accepted (bool): ``True`` if an accepting configuration was reached.
+        complete (bool): ``True`` if the search explored every reachable configuration, so
+                         that a non-accepted word is rejected for sure.
+        configuration (Any): The accepting configuration, or ``None``.
+        depth (int): Number of transitions leading to the accepting configuration, or the
+                     depth reached by the search.
+        configurations (int): Number of distinct configurations visited.
+        false_positive_rate (float): Estimated false-positive rate of a probabilistic
+                                     visited set at the end of the search, ``0.0`` for an
+                                     exact one. A rejection holds up to this rate.
+    """
+
+    def __init__(
+        self,
+        accepted: bool,
+        complete: bool,
+        configuration: Any = None,
+        depth: int = 0,
+        configurations: int = 0,
+        false_positive_rate: float = 0.0,
+    ):
+        self.accepted = accepted
+        self.complete = complete
+        self.configuration = configuration
+        self.depth = depth
+        self.configurations = configurations
+        self.false_positive_rate = false_positive_rate
+
+    @property
+    def verdict(self) -> Optional[bool]:
+        """``True`` if accepted, ``False`` if rejected, ``None`` if a budget ran out."""
+        if self.accepted:
+            return True
+        return False if self.complete else None
+
+    def __bool__(self) -> bool:
+        return self.accepted
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchResult(verdict={self.verdict}, depth={self.depth}, "
+            f"configurations={self.configurations})"
+        )
+
+
+class ConfigurationSearch:
+    """
+    Explores the configuration graph of a nondeterministic automaton.
+
+    Attributes:
+        successors (Callable): Returns the configurations reachable in one transition.
+        accepting (Callable): Tells whether a configuration is accepting.
+        strategy (str): ``"bfs"`` or ``"iddfs"``.
+        max_steps (int | None): Maximum length of a computation branch.
+        max_configurations (int | None): Maximum number of distinct configurations kept.
+        visited (Callable | None): Factory of the visited set. ``None`` keeps an exact
+                                   in-memory set.
+    """
+
+    def __init__(
+        self,
+        successors: Callable[[Any], Iterable[Any]],
+        accepting: Callable[[Any], bool],
+        strategy: str = "bfs",
+        max_steps: Optional[int] = None,
+        max_configurations: Optional[int] = None,
+        visited: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initializes the search.
+
+        :param successors: Function returning the successor configurations.
+        :type successors: Callable
+        :param accepting: Function telling whether a configuration is accepting.
+        :type accepting: Callable
+        :param strategy: Search strategy, one of ``STRATEGIES``.
+        :type strategy: str
+        :param max_steps: Maximum length of a branch. ``None`` means no limit.
+        :type max_steps: int | None
+        :param max_configurations: Maximum number of visited configurations. ``None`` means
+                                   no limit.
+        :type max_configurations: int | None
+        :param visited: Factory, called without arguments, of the visited set of a search.
+                        With ``"iddfs"``, it is called for each iteration, and holds
+                        ``(configuration, remaining depth)`` pairs.
+        :type visited: Callable | None
+        :raises ValueError: If the strategy is unknown.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown search strategy '{strategy}'. Must be one of {STRATEGIES}.")
+        self.successors = successors
+        self.accepting = accepting
+        self.strategy = strategy
+        self.max_steps = max_steps
+        self.max_configurations = max_configurations
+        self.visited = visited
+
+    def search(self, initial: Any) -> SearchResult:
+        """
+        Search for an accepting configuration reachable from ``initial``.
+
+        :param initial: The initial configuration.
+        :type initial: Any
+        :return: The outcome of the search.
+        :rtype: SearchResult
+        """
+        if self.accepting(initial):
+            return SearchResult(True, True, initial, 0, 1)
+        if self.strategy == "bfs":
+            return self._breadth_first(initial)
+        return self._iterative_deepening(initial)
+
+    def _breadth_first(self, initial: Any) -> SearchResult:
+        """Breadth-first search with a global visited set."""
+        visited = set() if self.visited is None else self.visited()
+        try:
+            result = self._breadth_first_in(initial, visited)
+            result.false_positive_rate = getattr(visited, "false_positive_rate", 0.0)
+            return result
+        finally:
+            _close(visited)
+
+    def _breadth_first_in(self, initial: Any, visited: Any) -> SearchResult:
+        """Breadth-first search recording the visited configurations in ``visited``."""
+        max_steps, max_configurations = self.max_steps, self.max_configurations
+        successors, accepting = self.successors, self.accepting
+        visited.add(initial)
+        frontier = deque([initial])
+        depth = 0
+        while frontier:
+            if max_steps is not None and depth >= max_steps:
+                return SearchResult(False, False, None, depth, len(visited))
+            depth += 1
+            for _ in range(len(frontier)):
+                configuration = frontier.popleft()
+                for successor in successors(configuration):
+                    if successor in visited:
+                        continue
+                    if max_configurations is not None and len(visited) >= max_configurations:
+                        return SearchResult(False, False, None, depth, len(visited))
+                    visited.add(successor)
+                    if accepting(successor):
+                        return SearchResult(True, True, successor, depth, len(visited))
+                    frontier.append(successor)
+        return SearchResult(False, True, None, depth, len(visited))
+
+    def _iterative_deepening(self, initial: Any) -> SearchResult:
+        """Depth-first searches with an increasing depth limit."""
+        limit = 1
+        while True:
+            seen = _BestRemaining() if self.visited is None else _RemainingPairs(self.visited())
+            try:
+                result = self._depth_limited(initial, limit, seen)
+                if result is not None:
+                    result.false_positive_rate = seen.false_positive_rate
+                    return result
+            finally:
+                _close(seen)
+            limit += 1
+
+    def _depth_limited(self, initial: Any, limit: int, seen: Any) -> Optional[SearchResult]:
+        """
+        One depth-first search of the iterative deepening, up to ``limit`` transitions.
+
+        :return: The outcome, or ``None`` if the next iteration must search deeper.
+        """
+        max_steps, max_configurations = self.max_steps, self.max_configurations
+        successors, accepting = self.successors, self.accepting
+        seen.mark(initial, limit)
+        stack: List[Tuple[Any, int]] = [(initial, limit)]
+        truncated = False
+        while stack:
+            configuration, budget = stack.pop()
+            if budget == 0:
+                truncated = True
+                continue
+            for successor in successors(configuration):
+                if seen.pruned(successor, budget - 1):
+                    continue
+                if seen.is_new(successor):
+                    if max_configurations is not None and len(seen) >= max_configurations:
+                        return SearchResult(False, False, None, limit, len(seen))
+                seen.mark(successor, budget - 1)
+                if accepting(successor):
+                    return SearchResult(True, True, successor, limit - budget + 1, len(seen))
+                stack.append((successor, budget - 1))
+        if not truncated:
+            return SearchResult(False, True, None, limit, len(seen))
+        if max_steps is not None and limit >= max_steps:
+            return SearchResult(False, False, None, limit, len(seen))
+        return None
+
+
+class _BestRemaining(Dict[Any, int]):
+    """
+    Best remaining depth with which each configuration was expanded in an iteration of the
+    iterative deepening: a configuration reached again with less remaining depth is pruned.
+    """
+
+    false_positive_rate = 0.0
+
+    def pruned(self, configuration: Any, left: int) -> bool:
+        known = self.get(configuration)
+        return known is not None and known >= left
+
+    def is_new(self, configuration: Any) -> bool:
+        return configuration not in self
+
+    def mark(self, configuration: Any, left: int) -> None:
+        self[configuration] = left
+
+
+class _RemainingPairs:
+    """
+    Visited backend of an iteration of the iterative deepening, holding
+    ``(configuration, remaining depth)`` pairs: only an exact repeat is pruned.
+    """
+
+    def __init__(self, backend: Any):
+        self.backend = backend
+
+    @property
+    def false_positive_rate(self) -> float:
+        return getattr(self.backend, "false_positive_rate", 0.0)
+
+    def pruned(self, configuration: Any, left: int) -> bool:
+        return (configuration, left) in self.backend
+
+    def is_new(self, configuration: Any) -> bool:
+        return True
+
+    def mark(self, configuration: Any, left: int) -> None:
+        self.backend.add((configuration, left))
+
+    def close(self) -> None:
+        _close(self.backend)
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+
+def _close(visited: Any) -> None:
+    """Close a visited backend that holds resources."""
+    close = getattr(visited, "close", None)
+    if close is not None:
+        close()
+
+
+class ParallelSearch:
+    """
+    Explores the configuration graph of a nondeterministic automaton with worker processes.
+
+    The workers expand configurations in roughly breadth-first order, but not level by
+    level: the accepting configuration found is not necessarily the closest one. The
+    successor and acceptance functions, and the configurations, are sent to the workers,
+    and must therefore be picklable.
+
+    Attributes:
+        successors (Callable): Returns the configurations reachable in one transition.
+        accepting (Callable): Tells whether a configuration is accepting.
+        workers (int): Number of worker processes.
+        max_steps (int | None): Maximum length of a computation branch.
+        max_configurations (int | None): Maximum number of distinct configurations kept.
+        batch_size (int): Number of configurations a worker expands between two exchanges
+                          with the other workers.
+        visited (Callable | None): Factory of the visited set of each worker. ``None``
+                                   keeps an exact in-memory set.
+    """
+
+    def __init__(
+        self,
+        successors: Callable[[Any], Iterable[Any]],
+        accepting: Callable[[Any], bool],
+        workers: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        max_configurations: Optional[int] = None,
+        batch_size: int = 64,
+        mp_context: Any = None,
+        visited: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initializes the search.
+
+        :param successors: Function returning the successor configurations.
+        :type successors: Callable
+        :param accepting: Function telling whether a configuration is accepting.
+        :type accepting: Callable
+        :param workers: Number of worker processes. Defaults to the number of CPUs.
+        :type workers: int | None
+        :param max_steps: Maximum length of a branch. ``None`` means no limit.
+        :type max_steps: int | None
+        :param max_configurations: Maximum number of visited configurations. ``None`` means
+                                   no limit.
+        :type max_configurations: int | None
+        :param batch_size: Configurations expanded between two exchanges.
+        :type batch_size: int
+        :param mp_context: Multiprocessing context starting the workers. Defaults to the
+                           default context.
+        :type mp_context: multiprocessing.context.BaseContext | None
+        :param visited: Picklable factory, called without arguments by each worker, of the
+                        visited set of its shard. Its keys are pairs of a configuration and,
+                        with ``max_steps``, its depth.
+        :type visited: Callable | None
+        :raises ValueError: If ``workers`` or ``batch_size`` is less than 1.
+        """
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1. Got {workers}.")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1. Got {batch_size}.")
+        self.successors = successors
+        self.accepting = accepting
+        self.workers = workers
+        self.max_steps = max_steps
+        self.max_configurations = max_configurations
+        self.batch_size = batch_size
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self.visited = visited
+
+    def search(self, initial: Any) -> SearchResult:
+        """
+        Search for an accepting configuration reachable from ``initial``.
+
+        :param initial: The initial configuration.
+        :type initial: Any
+        :return: The outcome of the search. ``depth`` is the length of the accepting branch,
+                 or the deepest level expanded.
+        :rtype: SearchResult
+        :raises Exception: The exception raised in a worker by the successor or acceptance
+                           function.
+        """
+        if self.accepting(initial):
+            return SearchResult(True, True, initial, 0, 1)
+        context, count = self.mp_context, self.workers
+        shared = _SharedState(context, count)
+        shared.pending.value = 1
+        shared.inboxes[_shard(initial, count)].put([(initial, 0)])
+        options = (self.max_steps, self.max_configurations, self.batch_size, self.visited)
+        processes = [
+            context.Process(
+                target=_explore,
+                args=(rank, self.successors, self.accepting, shared, options),
+                daemon=True,
+            )
+            for rank in range(count)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            outcome = self._wait(shared, processes)
+        finally:
+            shared.stop.set()
+            for process in processes:
+                process.join(timeout=1)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            shared.close()
+        configurations, depth = shared.visited.value, shared.depth.value
+        rate = shared.false_positive_rate.value
+        if isinstance(outcome, BaseException):
+            raise outcome
+        if outcome is not None:
+            configuration, branch_depth = outcome
+            return SearchResult(True, True, configuration, branch_depth, configurations, rate)
+        complete = not shared.truncated.value
+        return SearchResult(False, complete, None, depth, configurations, rate)
+
+    @staticmethod
+    def _wait(shared: _SharedState, processes: List[Any]) -> Any:
+        """
+        Wait for an accepting configuration, an error, or the end of the work.
+
+        :return: ``(configuration, depth)``, the exception of a worker, or ``None`` if the
+                 work is done or the budget of configurations ran out.
+        """
+        while True:
+            try:
+                return shared.results.get(timeout=0.01)
+            except queue.Empty:
+                pass
+            if shared.stop.is_set():
+                # The worker stopping the search sends its result before exiting.
+                try:
+                    return shared.results.get(timeout=1)
+                except queue.Empty:
+                    return RuntimeError("A search worker stopped without a result.")
+            if shared.pending.value == 0:
+                return None
+            if any(process.exitcode is not None for process in processes):
+                return RuntimeError("A search worker exited unexpectedly.")
+
+
+class _SharedState:
+    """Queues, counters and flags shared by the workers of a :class:`ParallelSearch`."""
+
+    def __init__(self, context: Any, count: int):
+        self.inboxes = [context.Queue() for _ in range(count)]
+        self.pool = context.Queue()
+        self.results = context.Queue()
+        # Configurations sent, queued or pooled, and not expanded or discarded yet.
+        self.pending = context.Value("q", 0)
+        self.visited = context.Value("q", 0)
+        self.depth = context.Value("q", 0)
+        self.idle = context.Value("i", 0)
+        self.truncated = context.Value("b", 0)
+        self.false_positive_rate = context.Value("d", 0.0)
+        self.stop = context.Event()
+
+    def close(self) -> None:
+        """Release the queues without waiting for their unread items."""
+        for channel in self.inboxes + [self.pool, self.results]:
+            channel.cancel_join_thread()
+            channel.close()
+
+
+def _shard(configuration: Any, count: int) -> int:
+    """
+    Return the worker owning ``configuration``.
+
+    The built-in ``hash`` of strings differs from one process to another, so the shard is
+    computed from the pickled configuration instead.
+    """
+    return zlib.crc32(pickle.dumps(configuration, protocol=4)) % count
+
+
+def _add(counter: Any, amount: int) -> int:
+    """Add ``amount`` to a shared counter and return its new value."""
+    with counter.get_lock():
+        counter.value += amount
+        return counter.value
+
+
+def _explore(
+    rank: int,
+    successors: Callable[[Any], Iterable[Any]],
+    accepting: Callable[[Any], bool],
+    shared: _SharedState,
+    options: Tuple[Optional[int], Optional[int], int, Optional[Callable[[], Any]]],
+) -> None:
+    """Worker of a :class:`ParallelSearch`: own one shard, expand local and stolen work."""
+    max_steps, max_configurations, batch_size, factory = options
+    count = len(shared.inboxes)
+    inbox, stop = shared.inboxes[rank], shared.stop
+    # Visited configurations of the shard. With a step budget, a configuration reached
+    # again with more remaining steps (a lower depth) is expanded again.
+    seen = _BestRemaining() if factory is None else _RemainingPairs(factory())
+    local: deque = deque()
+    idle = False
+    deepest = 0
+
+    def admit(items: List[Tuple[Any, int]]) -> bool:
+        """Deduplicate the configurations of the shard; ``True`` if one accepts."""
+        discarded = added = 0
+        for configuration, depth in items:
+            left = 0 if max_steps is None else -depth
+            if seen.pruned(configuration, left):
+                discarded += 1
+                continue
+            added += seen.is_new(configuration)
+            seen.mark(configuration, left)
+            if accepting(configuration):
+                shared.results.put((configuration, depth))
+                stop.set()
+                return True
+            local.append((configuration, depth))
+        if discarded:
+            _add(shared.pending, -discarded)
+        if added and max_configurations is not None:
+            if _add(shared.visited, added) > max_configurations:
+                shared.truncated.value = 1
+                shared.results.put(None)
+                stop.set()
+        elif added:
+            _add(shared.visited, added)
+        rate = seen.false_positive_rate
+        if rate > shared.false_positive_rate.value:
+            with shared.false_positive_rate.get_lock():
+                shared.false_positive_rate.value = max(shared.false_positive_rate.value, rate)
+        return False
+
+    try:
+        while not stop.is_set():
+            try:
+                while True:
+                    items = inbox.get(timeout=0.005) if not local else inbox.get_nowait()
+                    if admit(items):
+                        return
+            except queue.Empty:
+                pass
+            if not local:
+                try:
+                    local.extend(shared.pool.get_nowait())
+                except queue.Empty:
+                    if not idle:
+                        idle = True
+                        _add(shared.idle, 1)
+                    continue
+            if idle:
+                idle = False
+                _add(shared.idle, -1)
+            outgoing: List[List[Tuple[Any, int]]] = [[] for _ in range(count)]
+            expanded = sent = 0
+            while local and expanded < batch_size:
+                configuration, depth = local.popleft()
+                expanded += 1
+                if max_steps is not None and depth >= max_steps:
+                    shared.truncated.value = 1
+                    continue
+                deepest = max(deepest, depth + 1)
+                for successor in successors(configuration):
+                    outgoing[_shard(successor, count)].append((successor, depth + 1))
+                    sent += 1
+            # Count the successors before discounting their parents, so that the pending
+            # count only reaches zero when the whole graph is explored.
+            if sent:
+                _add(shared.pending, sent)
+            for owner, items in enumerate(outgoing):
+                if items and owner != rank:
+                    shared.inboxes[owner].put(items)
+            if outgoing[rank] and admit(outgoing[rank]):
+                return
+            _add(shared.pending, -expanded)
+            if deepest > shared.depth.value:
+                with shared.depth.get_lock():
+                    shared.depth.value = max(shared.depth.value, deepest)
+            if shared.idle.value and len(local) > batch_size:
+                shared.pool.put([local.popleft() for _ in range(len(local) // 2)])
+    except Exception as error:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = RuntimeError(f"Search worker failed: {error!r}")
+        shared.results.put(error)
+        stop.set()
+    finally:
+        _close(seen)
+        for channel in shared.inboxes + [shared.pool]:
+            channel.cancel_join_thread()
@@ -0,0 +1,41 @@
+"""
+Status codes reported by the exception-free execution methods.
+
+:meth:`fsm_tools.TuringMachine.step` and :meth:`fsm_tools.TuringMachine.run` raise when
+the machine has no transition for its current state and symbol, which makes every
+rejected word pay for building and formatting an exception. The ``*_status`` variants
+(:meth:`~fsm_tools.TuringMachine.step_status`, :meth:`~fsm_tools.TuringMachine.run_status`)
+report the same outcomes as a :class:`StepStatus` instead. Exceptions remain for misuse,
+such as an invalid move or an unknown symbol.
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+
+class StepStatus(IntEnum):
+    """
+    Outcome of a step or a run.
+
+    The values are also the status codes stored by
+    :class:`~fsm_tools.batch.BatchTuringMachine` in its ``status`` array.
+    """
+
+    RUNNING = 0
+    """The machine performed its transitions and has not halted."""
+
+    ACCEPTED = 1
+    """The machine is in its accept state."""
+
+    REJECTED = 2
+    """The machine is in its reject state."""
+
+    STUCK = 3
+    """No transition matches the current configuration: the word is rejected."""
+
+    OUT_OF_TAPE = 4
+    """The head left the tape: the word is rejected."""
+
+    NON_HALTING = 5
+    """A decider proved that the machine never halts (see :mod:`fsm_tools.deciders`)."""
@@ -0,0 +1,240 @@
+"""
+Symbol classes: transitions reading a whole range of symbols.
+
+A machine running over Unicode text would need one rule per code point, and an alphabet
+listing every character. A :class:`SymbolClass` stands for a set of symbols given by
+inclusive ranges of ordered symbols and/or a predicate, and can replace the symbol read
+by a rule::
+
+    letters = SymbolClass(("a", "z"), ("A", "Z"), name="letter")
+    tm.add_transition("word", letters, "word", SAME, "R")
+
+Symbols matched by a class used in a rule are valid tape symbols without being in the
+alphabet. A rule reading an exact symbol has precedence over a class rule of the same
+state, and a class rule over the default rule (reading ``ANY``); between class rules, the
+first one added wins.
+
+Indexed execution paths keep the class rules of each state in a :class:`ClassTable`: the
+bounds of the ranges are sorted once, and a symbol is matched by binary search. The table
+holds one entry per range bound, whatever the number of symbols in the ranges.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+class SymbolClass:
+    """
+    A set of ordered symbols, given by ranges and/or a predicate.
+
+    A symbol belongs to the class if it lies in one of its ranges (bounds included) or
+    satisfies its predicate. Ranges compare symbols with their own order: single
+    characters compare by code point. A symbol that cannot be compared with the bounds
+    does not belong to the ranges.
+
+    Attributes:
+        ranges (tuple): Sorted, disjoint ``(low, high)`` ranges.
+        predicate (Callable | None): Additional membership test.
+        name (str | None): Name shown in the representation of the class.
+    """
+
+    __slots__ = ("ranges", "predicate", "name")
+
+    def __init__(
+        self,
+        *ranges: Any,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        name: Optional[str] = None,
+    ):
+        """
+        Initializes the class. Each range is a ``(low, high)`` pair or a single symbol.
+
+        :raises ValueError: If the class has neither a range nor a predicate, or a range
+                            has ``low > high``.
+        """
+        if not ranges and predicate is None:
+            raise ValueError("A symbol class needs at least a range or a predicate.")
+        bounds = []
+        for item in ranges:
+            low, high = item if isinstance(item, tuple) else (item, item)
+            if high < low:
+                raise ValueError(f"Invalid range {item!r}: low > high.")
+            bounds.append((low, high))
+        bounds.sort()
+        merged: List[Tuple[Any, Any]] = []
+        for low, high in bounds:
+            if merged and low <= merged[-1][1]:
+                if high > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], high)
+            else:
+                merged.append((low, high))
+        self.ranges = tuple(merged)
+        self.predicate = predicate
+        self.name = name
+
+    @classmethod
+    def code_points(cls, *ranges: Any, name: Optional[str] = None) -> SymbolClass:
+        """
+        Build a class of characters from ranges of code points.
+
+        :param ranges: ``(low, high)`` pairs or single code points, as integers.
+        :type ranges: Any
+        :param name: Name of the class.
+        :type name: str | None
+        :return: The class of the characters in the ranges.
+        :rtype: SymbolClass
+        """
+        return cls(
+            *(
+                (chr(item[0]), chr(item[1])) if isinstance(item, tuple) else chr(item)
+                for item in ranges
+            ),
+            name=name,
+        )
+
+    def in_ranges(self, symbol: Any) -> bool:
+        """
+        Tell whether ``symbol`` lies in one of the ranges.
+
+        :param symbol: The symbol to test.
+        :type symbol: Any
+        :return: ``True`` if a range contains ``symbol``.
+        :rtype: bool
+        """
+        ranges = self.ranges
+        try:
+            position = bisect_left(ranges, (symbol,))
+            if position < len(ranges) and ranges[position][0] == symbol:
+                return True
+            return position > 0 and symbol <= ranges[position - 1][1]
+        except TypeError:
+            return False
+
+    def __contains__(self, symbol: Any) -> bool:
+        if self.in_ranges(symbol):
+            return True
+        return self.predicate is not None and bool(self.predicate(symbol))
+
+    def __repr__(self) -> str:
+        if self.name is not None:
+            return f"SymbolClass({self.name})"
+        return f"SymbolClass({', '.join(f'{low!r}-{high!r}' for low, high in self.ranges)})"
+
+
+class ClassTable:
+    """
+    Sorted interval table matching a symbol against the class rules of one state.
+
+    The bounds of every range are sorted into ``points``. A symbol equal to a point, or
+    lying strictly between two consecutive points, maps to the first class containing that
+    point or that gap, found by binary search. Classes with a predicate are tested in order
+    afterwards, and only if they were added before the class matched by the ranges.
+    """
+
+    __slots__ = ("points", "point_owner", "gap_owner", "predicates", "values")
+
+    def __init__(self, entries: Iterable[Tuple[SymbolClass, Any]]):
+        """
+        Initializes the table from ``(symbol_class, value)`` pairs, in priority order.
+        """
+        entries = list(entries)
+        self.values = [value for _, value in entries]
+        points = sorted({bound for symbol_class, _ in entries for bound in _bounds(symbol_class)})
+        self.points = points
+        # gap_owner[i] covers the symbols strictly between points[i - 1] and points[i].
+        self.point_owner: List[Optional[int]] = [None] * len(points)
+        self.gap_owner: List[Optional[int]] = [None] * (len(points) + 1)
+        self.predicates = []
+        for order, (symbol_class, _) in enumerate(entries):
+            for low, high in symbol_class.ranges:
+                first, last = bisect_left(points, low), bisect_left(points, high)
+                for position in range(first, last + 1):
+                    if self.point_owner[position] is None:
+                        self.point_owner[position] = order
+                for position in range(first + 1, last + 1):
+                    if self.gap_owner[position] is None:
+                        self.gap_owner[position] = order
+            if symbol_class.predicate is not None:
+                self.predicates.append((order, symbol_class.predicate))
+
+    def get(self, symbol: Any, default: Any = None) -> Any:
+        """
+        Return the value of the first class containing ``symbol``.
+
+        :param symbol: The symbol read.
+        :type symbol: Any
+        :param default: Value returned if no class contains ``symbol``.
+        :type default: Any
+        :return: The value of the matching class, or ``default``.
+        :rtype: Any
+        """
+        points = self.points
+        try:
+            position = bisect_left(points, symbol)
+            if position < len(points) and points[position] == symbol:
+                best = self.point_owner[position]
+            else:
+                best = self.gap_owner[position]
+        except TypeError:
+            best = None
+        for order, predicate in self.predicates:
+            if best is not None and order >= best:
+                break
+            if predicate(symbol):
+                best = order
+                break
+        return default if best is None else self.values[best]
+
+    def map(self, function: Callable[[Any], Any]) -> ClassTable:
+        """
+        Return a copy of the table with ``function`` applied to every value.
+
+        :param function: Conversion of the values.
+        :type function: Callable[[Any], Any]
+        :return: The converted table, sharing the interval arrays of this one.
+        :rtype: ClassTable
+        """
+        table = ClassTable(())
+        table.points, table.point_owner, table.gap_owner = (
+            self.points,
+            self.point_owner,
+            self.gap_owner,
+        )
+        table.predicates = self.predicates
+        table.values = [function(value) for value in self.values]
+        return table
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"ClassTable(classes={len(self.values)}, points={len(self.points)})"
+
+
+def _bounds(symbol_class: SymbolClass) -> Iterable[Any]:
+    """Yield the bounds of the ranges of ``symbol_class``."""
+    for low, high in symbol_class.ranges:
+        yield low
+        yield high
+
+
+def index_classes(index: dict) -> dict:
+    """
+    Group the entries of a transition index keyed by ``(state, SymbolClass instance)``
+    into one :class:`ClassTable` per state, stored under ``(state, SymbolClass)``.
+
+    The entries keep their order of insertion, which is the order of the rules.
+
+    :param index: Mapping ``(state, symbol) -> value``. Modified in place.
+    :type index: dict
+    :return: ``index``.
+    :rtype: dict
+    """
+    per_state: dict = {}
+    for key in [key for key in index if isinstance(key[1], SymbolClass)]:
+        per_state.setdefault(key[0], []).append((key[1], index.pop(key)))
+    for state, entries in per_state.items():
+        index[(state, SymbolClass)] = ClassTable(entries)
+    return index
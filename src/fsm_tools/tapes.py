@@ -0,0 +1,529 @@
+"""
+Alternative tape backends for 1D machines.
+
+By default ``TuringMachine`` stores its tape in a Python list (right-infinite) and
+``ExtendedTuringMachine`` in a dict keyed by coordinate tuples. A *tape backend* replaces
+that storage when given to the machine constructor::
+
+    tm = TuringMachine("TM", register="q0", tape_backend=ZipperTape)
+
+A backend class is instantiated with ``backend(blank, content)``, where ``content`` is
+loaded from position 0, and must provide:
+
+- ``read(position)``: return the symbol at ``position``, blank if never written;
+- ``write(position, symbol)``: write ``symbol`` at ``position``;
+- ``start``: lowest position held by the backend;
+- ``to_list()``: the cells from ``start`` up to the last position held;
+- ``len(tape)``: the number of cells held, checked by :class:`~fsm_tools.limits.Limits`;
+- ``fork()``: an independent copy of the tape, used by
+  :meth:`~fsm_tools.TuringMachine.fork_configuration`.
+
+A backend may also set ``two_way = True`` when it holds negative positions: the
+non-halting :mod:`~fsm_tools.deciders` otherwise assume a tape starting at position 0.
+
+``MmapTape`` is right-infinite: it raises ``IndexError`` on negative positions.
+
+A machine using a backend keeps updating ``self.head`` in :meth:`~fsm_tools.TuringMachine.move`
+and passes the head position to ``read`` and ``write``.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import tempfile
+from typing import Any, Iterable, List, Optional, Sequence
+
+
+class ZipperTape:
+    """
+    Bidirectionally infinite 1D tape stored as two stacks around a cursor.
+
+    ``left`` holds the cells to the left of the cursor (the nearest one last) and ``right``
+    holds the cell under the cursor and the cells to its right (the cell under the cursor
+    last). Moving the cursor by one cell pops one stack and pushes onto the other, which is
+    O(1) in both directions and needs neither coordinate tuples nor dict lookups. Cells are
+    allocated as the cursor visits them, on either side of the origin.
+
+    Attributes:
+        blank (Any): The blank symbol.
+        left (list): Cells to the left of the cursor, nearest last.
+        right (list): Cell under the cursor and cells to its right, cursor cell last.
+        position (int): Position of the cursor.
+    """
+
+    two_way = True
+
+    def __init__(self, blank: Any, content: Iterable[Any] = ()):
+        """
+        Initializes the tape with ``content`` from position 0, cursor on position 0.
+
+        :param blank: The blank symbol.
+        :type blank: Any
+        :param content: Initial symbols, starting at position 0.
+        :type content: Iterable[Any]
+        """
+        self.blank = blank
+        self.left: List[Any] = []
+        self.right: List[Any] = list(content)
+        self.right.reverse()
+        self.position = 0
+
+    def seek(self, position: int) -> None:
+        """
+        Move the cursor to ``position``, one cell at a time.
+
+        :param position: Target position.
+        :type position: int
+        """
+        left, right, blank = self.left, self.right, self.blank
+        while self.position < position:
+            left.append(right.pop() if right else blank)
+            self.position += 1
+        while self.position > position:
+            right.append(left.pop() if left else blank)
+            self.position -= 1
+
+    def read(self, position: int) -> Any:
+        """
+        Read the symbol at ``position``.
+
+        :param position: Position to read, usually the cursor position or a neighbour.
+        :type position: int
+        :return: The symbol, blank if the cell was never written.
+        :rtype: Any
+        """
+        if position != self.position:
+            self.seek(position)
+        return self.right[-1] if self.right else self.blank
+
+    def write(self, position: int, symbol: Any) -> None:
+        """
+        Write ``symbol`` at ``position``.
+
+        :param position: Position to write, usually the cursor position or a neighbour.
+        :type position: int
+        :param symbol: Symbol to write.
+        :type symbol: Any
+        """
+        if position != self.position:
+            self.seek(position)
+        if self.right:
+            self.right[-1] = symbol
+        else:
+            self.right.append(symbol)
+
+    def fork(self) -> ZipperTape:
+        """
+        Return an independent copy of the tape. This is O(tape length).
+
+        :return: The copy.
+        :rtype: ZipperTape
+        """
+        clone = ZipperTape(self.blank)
+        clone.left = list(self.left)
+        clone.right = list(self.right)
+        clone.position = self.position
+        return clone
+
+    @property
+    def start(self) -> int:
+        """Lowest position held by the tape."""
+        return self.position - len(self.left)
+
+    def to_list(self) -> List[Any]:
+        """
+        Return the cells from :attr:`start` to the last allocated position.
+
+        :return: The tape content.
+        :rtype: List[Any]
+        """
+        return self.left + self.right[::-1]
+
+    def __len__(self) -> int:
+        return len(self.left) + len(self.right)
+
+    def __repr__(self) -> str:
+        return f"ZipperTape(start={self.start}, cells={self.to_list()!r})"
+
+
+CHUNK_BITS = 6
+"""Number of position bits addressed inside one chunk of a ``PersistentTape``."""
+
+BRANCH_BITS = 5
+"""Number of position bits addressed by one internal node of a ``PersistentTape``."""
+
+
+class PersistentTape:
+    """
+    Bidirectionally infinite 1D tape with O(1) forking and copy-on-write chunks.
+
+    Cells are grouped in chunks of ``2 ** CHUNK_BITS`` cells, which are the leaves of a
+    radix trie whose internal nodes have ``2 ** BRANCH_BITS`` children. Non-negative
+    positions and negative positions are held by two separate tries.
+
+    Every node records the *edit token* of the tape that created it. A tape mutates in
+    place the nodes carrying its own token, and copies the other ones (path copying).
+    :meth:`fork` gives fresh tokens to both tapes: they keep sharing every node, and the
+    first write of either tape to a chunk copies that chunk and the nodes leading to it,
+    leaving the rest of the structure shared.
+
+    Attributes:
+        blank (Any): The blank symbol.
+    """
+
+    two_way = True
+
+    def __init__(self, blank: Any, content: Iterable[Any] = ()):
+        """
+        Initializes the tape with ``content`` from position 0.
+
+        :param blank: The blank symbol.
+        :type blank: Any
+        :param content: Initial symbols, starting at position 0.
+        :type content: Iterable[Any]
+        """
+        self.blank = blank
+        self._token = object()
+        # One trie per side of the origin: [positions >= 0, positions < 0].
+        self._roots: List[Any] = [None, None]
+        self._depths = [0, 0]
+        self._extents = [0, 0]
+        self._leaf: Any = None
+        self._leaf_key = (0, -1)
+        for position, symbol in enumerate(content):
+            self.write(position, symbol)
+
+    def _new_node(self, leaf: bool) -> list:
+        """Create an empty node owned by this tape."""
+        if leaf:
+            return [self._token] + [self.blank] * (1 << CHUNK_BITS)
+        return [self._token] + [None] * (1 << BRANCH_BITS)
+
+    def _find_leaf(self, side: int, index: int) -> Any:
+        """Return the chunk holding ``index`` on ``side``, or ``None`` if never written."""
+        node = self._roots[side]
+        depth = self._depths[side]
+        if node is None or index >> (CHUNK_BITS + BRANCH_BITS * depth):
+            return None
+        for level in range(depth, 0, -1):
+            node = node[1 + ((index >> (CHUNK_BITS + BRANCH_BITS * (level - 1))) & 31)]
+            if node is None:
+                return None
+        return node
+
+    def _own_leaf(self, side: int, index: int) -> list:
+        """Return the chunk holding ``index`` on ``side``, copying the shared nodes on its path."""
+        token = self._token
+        if self._roots[side] is None:
+            self._roots[side] = self._new_node(leaf=True)
+        while index >> (CHUNK_BITS + BRANCH_BITS * self._depths[side]):
+            root = self._new_node(leaf=False)
+            root[1] = self._roots[side]
+            self._roots[side] = root
+            self._depths[side] += 1
+
+        node = self._roots[side]
+        if node[0] is not token:
+            node = [token] + node[1:]
+            self._roots[side] = node
+        for level in range(self._depths[side], 0, -1):
+            slot = 1 + ((index >> (CHUNK_BITS + BRANCH_BITS * (level - 1))) & 31)
+            child = node[slot]
+            if child is None:
+                child = self._new_node(leaf=level == 1)
+            elif child[0] is not token:
+                child = [token] + child[1:]
+            node[slot] = child
+            node = child
+        return node
+
+    def read(self, position: int) -> Any:
+        """
+        Read the symbol at ``position``.
+
+        :param position: Position to read.
+        :type position: int
+        :return: The symbol, blank if the cell was never written.
+        :rtype: Any
+        """
+        side, index = (0, position) if position >= 0 else (1, -1 - position)
+        key = (side, index >> CHUNK_BITS)
+        if key != self._leaf_key:
+            leaf = self._find_leaf(side, index)
+            if leaf is None:
+                return self.blank
+            self._leaf, self._leaf_key = leaf, key
+        return self._leaf[1 + (index & 63)]
+
+    def write(self, position: int, symbol: Any) -> None:
+        """
+        Write ``symbol`` at ``position``, copying the chunk first if it is shared.
+
+        :param position: Position to write.
+        :type position: int
+        :param symbol: Symbol to write.
+        :type symbol: Any
+        """
+        side, index = (0, position) if position >= 0 else (1, -1 - position)
+        key = (side, index >> CHUNK_BITS)
+        leaf = self._leaf
+        if key != self._leaf_key or leaf[0] is not self._token:
+            leaf = self._own_leaf(side, index)
+            self._leaf, self._leaf_key = leaf, key
+        leaf[1 + (index & 63)] = symbol
+        if index >= self._extents[side]:
+            self._extents[side] = index + 1
+
+    def fork(self) -> PersistentTape:
+        """
+        Return a copy of the tape sharing all its chunks. This is O(1).
+
+        :return: The copy.
+        :rtype: PersistentTape
+        """
+        clone = PersistentTape.__new__(PersistentTape)
+        clone.blank = self.blank
+        clone._token = object()
+        clone._roots = list(self._roots)
+        clone._depths = list(self._depths)
+        clone._extents = list(self._extents)
+        clone._leaf, clone._leaf_key = self._leaf, self._leaf_key
+        # Nodes owned by this tape are now shared: stop mutating them in place.
+        self._token = object()
+        return clone
+
+    @property
+    def start(self) -> int:
+        """Lowest position held by the tape."""
+        return -self._extents[1]
+
+    def to_list(self) -> List[Any]:
+        """
+        Return the cells from :attr:`start` to the last written position.
+
+        :return: The tape content.
+        :rtype: List[Any]
+        """
+        return [self.read(position) for position in range(self.start, self._extents[0])]
+
+    def __len__(self) -> int:
+        return self._extents[0] + self._extents[1]
+
+    def __repr__(self) -> str:
+        return f"PersistentTape(start={self.start}, cells={self.to_list()!r})"
+
+
+MMAP_MIN_CAPACITY = 1 << 20
+"""Initial size in bytes of the file of an empty ``MmapTape``."""
+
+
+class MmapTape:
+    """
+    Right-infinite 1D tape stored one byte per cell in a memory-mapped file.
+
+    Each symbol is encoded by its index in a symbol table of at most 256 entries, the blank
+    being code 0. The file grows by doubling with ``ftruncate``, which creates sparse
+    regions on Linux: blank cells never written take no disk space. The operating system
+    pages cold regions of the tape in and out, so a tape of billions of cells does not
+    need to fit in RAM.
+
+    Without a ``path`` the tape lives in an anonymous temporary file. A ``path`` to a new
+    file (or any file with ``truncate``) holds the tape itself, shrunk to the cells written
+    by :meth:`close`. With a ``path`` to an existing file, the bytes of the file are the
+    initial cells of the tape: they are copied by the operating system into an anonymous
+    file, not read into Python objects, and the source file is never modified.
+    ``symbols`` must then give the meaning of the codes.
+
+    The tape is a context manager closing it on exit.
+
+    The backend is selected with a factory binding its options::
+
+        backend = functools.partial(MmapTape, path="tape.bin", symbols="_ab")
+        tm = TuringMachine("TM", register="q0", tape_backend=backend)
+
+    Attributes:
+        blank (Any): The blank symbol.
+        symbols (List[Any]): The symbol table, indexed by code.
+        path (str | None): Path of the file, ``None`` for an anonymous tape.
+    """
+
+    two_way = False
+
+    def __init__(
+        self,
+        blank: Any,
+        content: Iterable[Any] = (),
+        path: Optional[str] = None,
+        symbols: Optional[Sequence[Any]] = None,
+        truncate: bool = False,
+    ):
+        """
+        Initializes the tape, then writes ``content`` from position 0.
+
+        :param blank: The blank symbol.
+        :type blank: Any
+        :param content: Initial symbols, starting at position 0. They overwrite the first
+                        cells of an existing file.
+        :type content: Iterable[Any]
+        :param path: File holding the tape. ``None`` means an anonymous temporary file.
+        :type path: str | None
+        :param symbols: Symbol table. The blank is moved to code 0. Symbols written later
+                        are added to the table.
+        :type symbols: Sequence[Any] | None
+        :param truncate: Discard the existing content of the file, and use the file as the
+                         tape instead of copying it.
+        :type truncate: bool
+        :raises ValueError: If a byte of an existing file is not the code of a symbol.
+        """
+        self.blank = blank
+        self.symbols: List[Any] = [blank] + [
+            symbol for symbol in (symbols or ()) if symbol != blank
+        ]
+        self._codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        self.path = path
+        if path is not None and (truncate or not os.path.exists(path)):
+            self._file = open(path, "w+b")
+        else:
+            self._file = tempfile.TemporaryFile()
+            if path is not None:
+                with open(path, "rb") as source:
+                    shutil.copyfileobj(source, self._file, MMAP_MIN_CAPACITY)
+                self._file.flush()
+        self._extent = os.fstat(self._file.fileno()).st_size
+        self._map: Optional[mmap.mmap] = None
+        self._capacity = 0
+        self._remap(max(self._extent, MMAP_MIN_CAPACITY))
+        self._check_codes()
+        for position, symbol in enumerate(content):
+            self.write(position, symbol)
+
+    def _remap(self, capacity: int) -> None:
+        """Grow the file to ``capacity`` bytes and map it again."""
+        if self._map is not None:
+            self._map.close()
+        if os.fstat(self._file.fileno()).st_size < capacity:
+            os.ftruncate(self._file.fileno(), capacity)
+        self._map = mmap.mmap(self._file.fileno(), capacity)
+        self._capacity = capacity
+
+    def _check_codes(self) -> None:
+        """Check that every byte of the initial cells is the code of a symbol."""
+        codes = bytes(range(len(self.symbols)))
+        for offset in range(0, self._extent, MMAP_MIN_CAPACITY):
+            chunk = self._map[offset : min(offset + MMAP_MIN_CAPACITY, self._extent)]
+            unknown = chunk.translate(None, codes)
+            if unknown:
+                position = offset + chunk.index(unknown[0])
+                self.close()
+                raise ValueError(
+                    f"Byte {unknown[0]} at position {position} of '{self.path}' is not the code "
+                    f"of a symbol: the symbol table has {len(self.symbols)} entries."
+                )
+
+    def _encode(self, symbol: Any) -> int:
+        """Return the code of ``symbol``, adding it to the symbol table if needed."""
+        code = self._codes.get(symbol)
+        if code is None:
+            if len(self.symbols) == 256:
+                raise ValueError(f"MmapTape holds at most 256 symbols: cannot encode {symbol!r}.")
+            code = len(self.symbols)
+            self.symbols.append(symbol)
+            self._codes[symbol] = code
+        return code
+
+    def read(self, position: int) -> Any:
+        """
+        Read the symbol at ``position``.
+
+        :param position: Position to read.
+        :type position: int
+        :return: The symbol, blank if the cell was never written.
+        :rtype: Any
+        :raises IndexError: If ``position`` is negative.
+        """
+        if position < 0:
+            raise IndexError(f"Head position {position} is out of bounds: MmapTape starts at 0.")
+        if position >= self._capacity:
+            return self.blank
+        return self.symbols[self._map[position]]
+
+    def write(self, position: int, symbol: Any) -> None:
+        """
+        Write ``symbol`` at ``position``, growing the file if needed.
+
+        :param position: Position to write.
+        :type position: int
+        :param symbol: Symbol to write.
+        :type symbol: Any
+        :raises IndexError: If ``position`` is negative.
+        :raises ValueError: If the symbol table is full.
+        """
+        if position < 0:
+            raise IndexError(f"Head position {position} is out of bounds: MmapTape starts at 0.")
+        if position >= self._capacity:
+            capacity = self._capacity
+            while capacity <= position:
+                capacity *= 2
+            self._remap(capacity)
+        self._map[position] = self._encode(symbol)
+        if position >= self._extent:
+            self._extent = position + 1
+
+    def fork(self) -> MmapTape:
+        """
+        Return an independent copy of the tape in an anonymous file. This is O(tape length).
+
+        :return: The copy.
+        :rtype: MmapTape
+        """
+        clone = MmapTape(self.blank, symbols=self.symbols)
+        if self._extent > clone._capacity:
+            clone._remap(self._extent)
+        for offset in range(0, self._extent, MMAP_MIN_CAPACITY):
+            end = min(offset + MMAP_MIN_CAPACITY, self._extent)
+            clone._map[offset:end] = self._map[offset:end]
+        clone._extent = self._extent
+        return clone
+
+    def flush(self) -> None:
+        """Write the modified pages back to the file."""
+        self._map.flush()
+
+    def close(self) -> None:
+        """Flush and unmap the tape, shrinking the file to the cells written."""
+        if self._map is None:
+            return
+        self._map.flush()
+        self._map.close()
+        self._map = None
+        os.ftruncate(self._file.fileno(), self._extent)
+        self._file.close()
+
+    def __enter__(self) -> MmapTape:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def start(self) -> int:
+        """Lowest position held by the tape."""
+        return 0
+
+    def to_list(self) -> List[Any]:
+        """
+        Return the cells from position 0 to the last written position.
+
+        :return: The tape content.
+        :rtype: List[Any]
+        """
+        symbols = self.symbols
+        return [symbols[code] for code in self._map[: self._extent]]
+
+    def __len__(self) -> int:
+        return self._extent
+
+    def __repr__(self) -> str:
+        return f"MmapTape(path={self.path!r}, cells={self._extent})"
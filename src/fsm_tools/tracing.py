@@ -0,0 +1,181 @@
+"""
+Trace-based specialisation of hot loops for long Turing Machine runs.
+
+Compiling a whole machine into Python code does not pay off for machines with thousands
+of states, where only a handful of state cycles execute most of the steps. This module
+profiles a run instead: every executed ``(state, symbol)`` pair is counted, and once a
+pair becomes *hot* the transitions that follow it are recorded until the machine comes
+back to the same pair. The recorded cycle is then compiled into a straight-line closure.
+
+Each step of a compiled trace is protected by a *guard* checking that the head is still
+on the tape and that it reads the symbol seen while recording. When a guard fails, the
+closure returns the position in the trace where it stopped, and the run resumes in the
+generic loop from the corresponding state. A compiled trace therefore executes exactly
+the transitions the generic loop would have executed.
+
+The tracer is used by :meth:`fsm_tools.TuringMachine.run` when ``hot_threshold`` is
+given; it can also be driven directly to inspect the compiled traces::
+
+    tracer = HotLoopTracer(tm, hot_threshold=50)
+    steps = tracer.run(max_steps=1_000_000)
+    print(len(tracer.traces), "hot loops compiled")
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .constants import ANY, SAME
+from .symbols import SymbolClass
+
+MAX_TRACE_LENGTH = 256
+"""
+Maximum number of transitions recorded for one trace. Longer cycles are not compiled:
+their anchor is blacklisted and keeps running in the generic loop.
+"""
+
+
+def compile_trace(trace: List[Tuple[Any, Any, Any, Any, int]]) -> Callable:
+    """
+    Compile a recorded state cycle into a straight-line closure.
+
+    Each entry of ``trace`` is ``(state, symbol, state_to, write_symbol, delta)``: the
+    transition taken in ``state`` when reading ``symbol``, and the head displacement it
+    produced. The last transition of the cycle leads back to the first state.
+
+    The returned closure has the signature ``trace(tape, head, budget)`` and returns
+    ``(head, steps, exit_index)``: the new head position, the number of transitions
+    executed (at most ``budget``), and the position in ``trace`` of the next transition
+    to execute, whose state is the new register.
+
+    :param trace: Recorded transitions of the cycle.
+    :type trace: list
+    :return: The compiled closure.
+    :rtype: Callable
+    """
+    length = len(trace)
+    namespace: Dict[str, Any] = {}
+    lines = [
+        "def trace(tape, head, budget):",
+        "    size = len(tape)",
+        "    steps = 0",
+        f"    while budget - steps >= {length}:",
+    ]
+    for i, (_, symbol, _, write_symbol, delta) in enumerate(trace):
+        namespace[f"r{i}"] = symbol
+        namespace[f"w{i}"] = write_symbol
+        lines.append(
+            f"        if not 0 <= head < size or tape[head] != r{i}: return head, steps + {i}, {i}"
+        )
+        lines.append(f"        tape[head] = w{i}")
+        if delta:
+            lines.append(f"        head += {int(delta)}")
+    lines.append(f"        steps += {length}")
+    lines.append("    return head, steps, 0")
+
+    # The generated source only contains integer literals and names bound in
+    # ``namespace``: no symbol or state is ever formatted into the code.
+    exec(compile("\n".join(lines), "<trace>", "exec"), namespace)  # nosec B102
+    return namespace["trace"]
+
+
+class HotLoopTracer:
+    """
+    Profiling run loop that compiles hot state cycles of a 1D Turing Machine.
+
+    Attributes:
+        machine (TuringMachine): The machine being run. It must support trace
+                                 compilation (see ``TuringMachine._traceable``).
+        hot_threshold (int): Number of hits after which a ``(state, symbol)`` pair is hot.
+        hits (dict): Number of executions of each ``(state, symbol)`` pair in the generic loop.
+        traces (dict): Compiled closures and their recorded cycle, keyed by anchor pair.
+    """
+
+    def __init__(self, machine, hot_threshold: int):
+        """
+        Initializes the tracer for a given machine.
+
+        :param machine: The Turing Machine to run.
+        :type machine: TuringMachine
+        :param hot_threshold: Number of hits after which a transition is considered hot.
+        :type hot_threshold: int
+        :raises ValueError: If ``hot_threshold`` is lower than 1.
+        """
+        if hot_threshold < 1:
+            raise ValueError(f"hot_threshold must be at least 1. Got {hot_threshold}.")
+        self.machine = machine
+        self.hot_threshold = hot_threshold
+        self.hits: Dict[Tuple[Any, Any], int] = {}
+        self.traces: Dict[Tuple[Any, Any], Tuple[Callable, List[Any]]] = {}
+        self._rejected: Set[Tuple[Any, Any]] = set()
+
+    def run(self, max_steps: Optional[int] = None) -> int:
+        """
+        Run the machine until it halts, compiling hot cycles along the way.
+
+        :param max_steps: Maximum number of steps to execute. ``None`` means no limit.
+        :type max_steps: int | None
+        :return: The number of steps executed.
+        :rtype: int
+        :raises Exception: If no transition matches the current state and symbol.
+        """
+        machine = self.machine
+        index = machine._transition_index()
+        deltas = {direction: machine._move_delta(direction) for direction in machine.moves}
+        halting = (machine.validation["accept"], machine.validation["reject"])
+        hits = self.hits
+        traces = self.traces
+        anchor = None
+        recording: List[Any] = []
+        steps = 0
+
+        while machine.register not in halting and (max_steps is None or steps < max_steps):
+            key = (machine.register, machine.read())
+
+            if anchor is not None:
+                if key == anchor:
+                    traces[anchor] = (compile_trace(recording), recording)
+                    anchor, recording = None, []
+                elif len(recording) >= MAX_TRACE_LENGTH:
+                    self._rejected.add(anchor)
+                    anchor, recording = None, []
+
+            compiled = traces.get(key)
+            if compiled is not None and anchor is None:
+                budget = max_steps - steps if max_steps is not None else sys.maxsize
+                head, done, exit_index = compiled[0](machine.tape, machine.head[0], budget)
+                if done:
+                    machine.head[0] = head
+                    machine.register = compiled[1][exit_index][0]
+                    steps += done
+                    continue
+
+            rule = index.get(key)
+            if rule is None and (key[0], SymbolClass) in index:
+                rule = index[(key[0], SymbolClass)].get(key[1])
+                if rule is not None and rule[1] is SAME:
+                    rule = (rule[0], key[1], rule[2])
+            if rule is None and (key[0], ANY) in index:
+                # Expand the default rule of the state for this symbol.
+                state_to, write_symbol, move_direction = index[(key[0], ANY)]
+                rule = (state_to, key[1] if write_symbol is SAME else write_symbol, move_direction)
+                index[key] = rule
+            if rule is None:
+                raise Exception(f"No valid transition for state '{key[0]}' and symbol '{key[1]}'.")
+            state_to, write_symbol, move_direction = rule
+
+            count = hits.get(key, 0) + 1
+            hits[key] = count
+            if anchor is not None:
+                recording.append((key[0], key[1], state_to, write_symbol, deltas[move_direction]))
+            elif count >= self.hot_threshold and key not in traces and key not in self._rejected:
+                anchor = key
+                recording = [(key[0], key[1], state_to, write_symbol, deltas[move_direction])]
+
+            machine.write(write_symbol)
+            machine.move(move_direction)
+            machine.register = state_to
+            steps += 1
+
+        return steps
@@ -0,0 +1,254 @@
+"""
+Visited-set backends of the configuration-space searches.
+
+Searches (:class:`~fsm_tools.search.ConfigurationSearch`,
+:class:`~fsm_tools.search.ParallelSearch`, ``run_nondeterministic()``) remember every
+configuration they visited, and an exact ``set`` of configurations holding whole tapes
+exhausts the memory long before the time budget. The ``visited`` argument of a search
+takes a factory, called without arguments, building the set of the search (one per
+worker process for a parallel search). The backend needs ``add(key)``, ``key in
+backend`` and ``len(backend)``; ``close()`` is called at the end of the search if
+present. Three backends are available:
+
+- ``set``, the default: exact, in memory;
+- :class:`BloomFilter`: a scalable Bloom filter, holding a few bytes per configuration
+  whatever its size. A configuration never visited may be reported as visited, and
+  pruned: the search may then miss an accepting branch. The filter reports its
+  false-positive rate, copied to the result of the search;
+- :class:`DiskSet`: a hash store in a local SQLite file, for searches larger than the
+  memory, exact up to collisions of 128-bit digests.
+
+The probabilistic and disk backends identify a configuration by the digest of its pickle,
+so configurations must be picklable, and equal configurations must have equal pickles
+(as tuples of strings and integers do)::
+
+    tm.run_nondeterministic(visited=partial(BloomFilter, capacity=10**7, error_rate=1e-9))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import pickle
+import sqlite3
+import tempfile
+from typing import Any, List, Optional
+
+
+def _digest(key: Any) -> bytes:
+    """Return the 128-bit digest identifying ``key``."""
+    return hashlib.blake2b(pickle.dumps(key, protocol=4), digest_size=16).digest()
+
+
+class _Slice:
+    """One fixed-size Bloom filter of a :class:`BloomFilter`."""
+
+    __slots__ = ("bits", "size", "hashes", "capacity", "count")
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, math.ceil(-math.log2(error_rate)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, first: int, second: int) -> List[int]:
+        size = self.size
+        return [(first + index * second) % size for index in range(self.hashes)]
+
+    def contains(self, positions: List[int]) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in positions)
+
+    def add(self, positions: List[int]) -> None:
+        bits = self.bits
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+class BloomFilter:
+    """
+    Scalable Bloom filter: a probabilistic set of bounded error rate, whose memory grows
+    with the number of keys added.
+
+    Keys are added to the last of a series of fixed-size filters. When it holds its
+    capacity, a new filter is created, ``growth`` times larger, with an error rate
+    multiplied by ``tightening``, so that the error rate of the whole series stays below
+    ``error_rate``. A key added is always found; a key never added is found with a
+    probability of at most ``error_rate``.
+
+    Attributes:
+        capacity (int): Number of keys of the first filter.
+        error_rate (float): Bound of the false-positive rate.
+        growth (int): Capacity ratio between two consecutive filters.
+        tightening (float): Error-rate ratio between two consecutive filters.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 1e-6,
+        growth: int = 2,
+        tightening: float = 0.5,
+    ):
+        """
+        Initializes an empty filter.
+
+        :raises ValueError: If ``capacity`` or ``growth`` is less than 1, or
+                            ``error_rate`` or ``tightening`` is not in ``]0, 1[``.
+        """
+        if capacity < 1 or growth < 1:
+            raise ValueError(f"capacity and growth must be at least 1. Got {capacity}, {growth}.")
+        if not 0 < error_rate < 1 or not 0 < tightening < 1:
+            raise ValueError(
+                f"error_rate and tightening must be in ]0, 1[. Got {error_rate}, {tightening}."
+            )
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self._slices = [_Slice(capacity, error_rate * (1 - tightening))]
+        self._count = 0
+
+    @staticmethod
+    def _hashes(key: Any):
+        digest = _digest(key)
+        # Double hashing: the k positions of a slice derive from two 64-bit hashes.
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def __contains__(self, key: Any) -> bool:
+        first, second = self._hashes(key)
+        return any(part.contains(part.positions(first, second)) for part in self._slices)
+
+    def add(self, key: Any) -> None:
+        """
+        Add ``key`` to the filter. A key already found in the filter is not counted again.
+
+        :param key: A picklable key.
+        :type key: Any
+        """
+        first, second = self._hashes(key)
+        slices = self._slices
+        if any(part.contains(part.positions(first, second)) for part in slices):
+            return
+        last = slices[-1]
+        if last.count >= last.capacity:
+            depth = len(slices)
+            last = _Slice(
+                self.capacity * self.growth**depth,
+                self.error_rate * (1 - self.tightening) * self.tightening**depth,
+            )
+            slices.append(last)
+        last.add(last.positions(first, second))
+        self._count += 1
+
+    @property
+    def false_positive_rate(self) -> float:
+        """
+        Estimated probability that a key never added is found, given the keys added so far.
+        """
+        return -math.expm1(sum(math.log1p(-part.false_positive_rate()) for part in self._slices))
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes of the bit arrays."""
+        return sum(len(part.bits) for part in self._slices)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return (
+            f"BloomFilter(keys={self._count}, slices={len(self._slices)}, "
+            f"false_positive_rate={self.false_positive_rate:.2e})"
+        )
+
+
+class DiskSet:
+    """
+    Set of keys stored as 128-bit digests in a SQLite file.
+
+    Writes are committed in batches; the pages of the file are cached in memory by SQLite
+    up to ``cache_kib``. Without ``path``, the set lives in a temporary file deleted by
+    :meth:`close`; an existing ``path`` is reopened with its keys.
+
+    Attributes:
+        path (str): Path of the SQLite file.
+    """
+
+    def __init__(self, path: Optional[str] = None, cache_kib: int = 65536, batch: int = 10_000):
+        """
+        Opens or creates the store.
+
+        :param path: Path of the SQLite file. ``None`` creates a temporary file.
+        :type path: str | None
+        :param cache_kib: Size of the page cache, in KiB.
+        :type cache_kib: int
+        :param batch: Number of keys added between two commits.
+        :type batch: int
+        """
+        self._temporary = path is None
+        if path is None:
+            descriptor, path = tempfile.mkstemp(prefix="fsm-visited-", suffix=".sqlite")
+            os.close(descriptor)
+        self.path = path
+        self._batch = batch
+        self._uncommitted = 0
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS visited (digest BLOB PRIMARY KEY) WITHOUT ROWID"
+        )
+        (self._count,) = self._connection.execute("SELECT COUNT(*) FROM visited").fetchone()
+
+    def __contains__(self, key: Any) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM visited WHERE digest = ?", (_digest(key),)
+        ).fetchone()
+        return row is not None
+
+    def add(self, key: Any) -> None:
+        """
+        Add ``key`` to the store.
+
+        :param key: A picklable key.
+        :type key: Any
+        """
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO visited (digest) VALUES (?)", (_digest(key),)
+        )
+        if cursor.rowcount:
+            self._count += 1
+            self._uncommitted += 1
+            if self._uncommitted >= self._batch:
+                self._connection.commit()
+                self._uncommitted = 0
+
+    def close(self) -> None:
+        """Commit and close the store; delete its file if it is temporary."""
+        if self._connection is None:
+            return
+        self._connection.commit()
+        self._connection.close()
+        self._connection = None
+        if self._temporary:
+            os.remove(self.path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> DiskSet:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"DiskSet(path={self.path!r}, keys={self._count})"
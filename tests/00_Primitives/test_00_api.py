@@ -21,7 +21,7 @@ class TestPublicAPIClasses:
 
     def test_extended_hierarchy_exported(self, fsm_module):
         """Extended hierarchy classes are accessible from fsm_tools."""
-        for name in ("ExtendedTuringMachine", "ExtendedLBA"):
+        for name in ("ExtendedTuringMachine", "ExtendedLBA", "MultiTapeTuringMachine"):
             assert hasattr(fsm_module, name), f"Missing: {name}"
 
     def test_exception_hierarchy_exported(self, fsm_module):
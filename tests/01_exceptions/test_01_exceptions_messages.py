@@ -485,3 +485,16 @@ class TestSpecialisedExceptions:
         exc1 = ReadError("Regular", "alphabet")
         exc2 = ReadError("Regular", "alphabet", locale="de-DE")
         assert exc1.message == exc2.message
+
+    def test_event_is_per_instance(self):
+        with_event = ValidationError("Regular", "validation", reason="first")
+        without_event = ValidationError("Regular", "validation")
+        assert with_event.event["format"] == {"reason": "first"}
+        assert without_event.event == {}
+        assert "first" not in without_event.message
+
+    def test_event_class_is_per_subclass(self):
+        read = ReadError("Regular", "alphabet", symbol="X")
+        add = AddError("Regular", "alphabet", symbol="X")
+        assert read.event["cls"] is AttributeError
+        assert add.event["cls"] is ValueError
@@ -241,3 +241,194 @@ class TestStep:
         assert tm.tape[1] == "b"
         assert tm.tape[2] == "b"
         assert tm.register == "qOK"
+
+
+class TestRun:
+
+    @pytest.fixture
+    def replace_tm(self, fsm_module):
+        """Replace all 'a' with 'b' until blank, then accept."""
+        tm = fsm_module.TuringMachine(
+            "Replace", blank_symbol="_", movement={"R": [1]}, register="q0"
+        )
+        tm.add_terminals("a", "b")
+        tm.add_transition("q0", "a", "q0", "b", "R")
+        tm.add_transition("q0", "_", "OK", "_", "R")
+        tm.set_tape(["a", "a", "a"])
+        tm.set_register("q0")
+        return tm
+
+    def test_run_until_accept(self, replace_tm):
+        assert replace_tm.run() == 4
+        assert replace_tm.tape[:3] == ["b", "b", "b"]
+        assert replace_tm.register == "OK"
+
+    def test_run_respects_max_steps(self, replace_tm):
+        assert replace_tm.run(max_steps=2) == 2
+        assert replace_tm.register == "q0"
+        assert replace_tm.head == [2]
+
+    def test_run_on_halting_state_does_nothing(self, replace_tm):
+        replace_tm.set_register("OK")
+        assert replace_tm.run() == 0
+
+    def test_run_no_transition_raises(self, tm_instance):
+        tm_instance.add_terminals("x")
+        tm_instance.set_tape(["x"])
+        with pytest.raises(Exception, match="No valid transition"):
+            tm_instance.run()
+
+    def test_run_first_rule_wins(self, replace_tm):
+        """Like step(), run() applies the first rule matching (state, symbol)."""
+        replace_tm.add_transition("q0", "a", "nOK", "a", "R")
+        replace_tm.run()
+        assert replace_tm.register == "OK"
+
+    def test_run_matches_step(self, replace_tm, fsm_module):
+        other = fsm_module.TuringMachine("Other", movement={"R": [1]}, register="q0")
+        other.add_terminals("a", "b")
+        for rule in replace_tm.get_rules():
+            other.add_transition(*rule)
+        other.set_tape(["a", "a", "a"])
+        while other.register != "OK":
+            other.step()
+        replace_tm.run()
+        assert replace_tm.tape == other.tape
+        assert replace_tm.head == other.head
+
+
+class TestFreeze:
+
+    @pytest.fixture
+    def replace_tm(self, fsm_module):
+        """Replace all 'a' with 'b' until blank, then accept."""
+        tm = fsm_module.TuringMachine(
+            "Replace", blank_symbol="_", movement={"R": [1]}, register="q0"
+        )
+        tm.add_terminals("a", "b")
+        tm.add_transition("q0", "a", "q0", "b", "R")
+        tm.add_transition("q0", "_", "OK", "_", "R")
+        tm.set_tape(["a", "a", "a"])
+        return tm
+
+    def test_frozen_flag(self, replace_tm):
+        assert replace_tm.frozen is False
+        replace_tm.freeze()
+        assert replace_tm.frozen is True
+
+    def test_frozen_run_matches_unfrozen(self, replace_tm):
+        replace_tm.freeze()
+        assert replace_tm.run() == 4
+        assert replace_tm.tape == ["b", "b", "b", "_"]
+        assert replace_tm.head == [4]
+        assert replace_tm.register == "OK"
+
+    def test_frozen_step(self, replace_tm):
+        replace_tm.freeze()
+        replace_tm.step()
+        assert replace_tm.tape[0] == "b"
+        assert replace_tm.head == [1]
+
+    def test_frozen_run_respects_max_steps(self, replace_tm):
+        replace_tm.freeze()
+        assert replace_tm.run(max_steps=2) == 2
+        assert replace_tm.head == [2]
+        assert replace_tm.register == "q0"
+
+    def test_frozen_no_transition_raises(self, tm_instance):
+        tm_instance.add_terminals("x")
+        tm_instance.set_tape(["x"])
+        tm_instance.freeze()
+        with pytest.raises(Exception, match="No valid transition"):
+            tm_instance.step()
+        with pytest.raises(Exception, match="No valid transition"):
+            tm_instance.run()
+        assert tm_instance.register == "S"
+
+    def test_frozen_negative_head_raises(self, fsm_module):
+        tm = fsm_module.TuringMachine("TM", movement={"L": [-1]}, register="q0")
+        tm.add_transition("q0", "_", "q0", "_", "L")
+        tm.freeze()
+        with pytest.raises(IndexError):
+            tm.run()
+
+    @pytest.mark.parametrize(
+        "mutation",
+        [
+            lambda tm: tm.add_terminals("c"),
+            lambda tm: tm.add_non_terminals("q9"),
+            lambda tm: tm.add_transition("q0", "b", "OK", "b", "R"),
+            lambda tm: tm.remove_rules(tm.get_rules()[0]),
+            lambda tm: tm.withdraw_grammar(),
+            lambda tm: tm.set_moves(R=[1]),
+            lambda tm: tm.write("c"),
+        ],
+    )
+    def test_mutation_after_freeze_raises(self, replace_tm, mutation, fsm_module):
+        replace_tm.freeze()
+        with pytest.raises(fsm_module.ModifyError, match="frozen"):
+            mutation(replace_tm)
+
+    def test_unknown_write_symbol_rejected(self, replace_tm, fsm_module):
+        replace_tm.add_rules(("q0", "b", "q0", "c", "R"))
+        with pytest.raises(fsm_module.ValidationError):
+            replace_tm.freeze()
+        assert replace_tm.frozen is False
+
+    def test_unknown_move_rejected(self, replace_tm, fsm_module):
+        replace_tm.add_rules(("q0", "b", "q0", "b", "L"))
+        with pytest.raises(fsm_module.ValidationError):
+            replace_tm.freeze()
+
+
+class TestStepStatus:
+
+    @pytest.fixture
+    def replace_tm(self, fsm_module):
+        """Replace all 'a' with 'b' until blank, then accept; reject on 'c'."""
+        tm = fsm_module.TuringMachine(
+            "Replace", blank_symbol="_", movement={"R": [1], "L": [-1]}, register="q0"
+        )
+        tm.add_terminals("a", "b", "c")
+        tm.add_transition("q0", "a", "q0", "b", "R")
+        tm.add_transition("q0", "c", "nOK", "c", "R")
+        tm.add_transition("q0", "_", "OK", "_", "R")
+        return tm
+
+    def test_step_status_running_then_accepted(self, replace_tm, fsm_module):
+        replace_tm.set_tape(["a"])
+        assert replace_tm.step_status() is fsm_module.StepStatus.RUNNING
+        assert replace_tm.step_status() is fsm_module.StepStatus.ACCEPTED
+        assert replace_tm.step_status() is fsm_module.StepStatus.ACCEPTED
+        assert replace_tm.head == [2]
+
+    def test_step_status_stuck(self, replace_tm, fsm_module):
+        replace_tm.set_tape(["b"])
+        assert replace_tm.step_status() is fsm_module.StepStatus.STUCK
+        assert replace_tm.register == "q0"
+
+    def test_step_status_out_of_tape(self, replace_tm, fsm_module):
+        replace_tm.add_transition("q0", "b", "q0", "b", "L")
+        replace_tm.set_tape(["b"])
+        assert replace_tm.step_status() is fsm_module.StepStatus.RUNNING
+        assert replace_tm.step_status() is fsm_module.StepStatus.OUT_OF_TAPE
+
+    @pytest.mark.parametrize("frozen", [False, True])
+    @pytest.mark.parametrize(
+        "word, status",
+        [(["a", "a"], "ACCEPTED"), (["a", "c"], "REJECTED"), (["a", "b"], "STUCK")],
+    )
+    def test_run_status(self, replace_tm, fsm_module, word, status, frozen):
+        replace_tm.set_tape(list(word))
+        if frozen:
+            replace_tm.freeze()
+        assert replace_tm.run_status() is fsm_module.StepStatus[status]
+
+    def test_run_status_budget(self, replace_tm, fsm_module):
+        replace_tm.set_tape(["a", "a"])
+        assert replace_tm.run_status(max_steps=1) is fsm_module.StepStatus.RUNNING
+
+    def test_step_still_raises(self, replace_tm):
+        replace_tm.set_tape(["b"])
+        with pytest.raises(Exception, match="No valid transition for state 'q0' and symbol 'b'"):
+            replace_tm.step()
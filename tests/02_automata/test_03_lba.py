@@ -141,3 +141,165 @@ class TestStep:
         lba.step()
         assert lba.tape[0] == "x"
         assert lba.register == "OK"
+
+
+class TestFreeze:
+
+    @pytest.fixture
+    def sweep_lba(self, fsm_module):
+        """Replace 'a' with 'b' moving right, on a tape of 3 cells."""
+        lba = fsm_module.LinearBoundedAutomaton(
+            "LBA", tape_size=[3], axes=1, movement={"F": [1], "B": [-1]}, register="S"
+        )
+        lba.add_terminals("a", "b")
+        lba.add_transition("S", "a", "S", "b", "F")
+        lba.add_transition("S", "_", "OK", "_", "F")
+        return lba
+
+    def test_frozen_run_within_limit(self, sweep_lba):
+        sweep_lba.set_tape(["a", "a"])
+        sweep_lba.freeze()
+        assert sweep_lba.run() == 3
+        assert sweep_lba.tape == ["b", "b", "_"]
+
+    def test_frozen_run_hits_limit(self, sweep_lba):
+        sweep_lba.set_tape(["a", "a", "a"])
+        sweep_lba.freeze()
+        with pytest.raises(IndexError, match="out of bounds"):
+            sweep_lba.run()
+        assert sweep_lba.head == [3]
+
+    def test_frozen_step_negative_position(self, sweep_lba):
+        sweep_lba.set_tape(["a"], location=[-1])
+        sweep_lba.freeze()
+        with pytest.raises(IndexError):
+            sweep_lba.step()
+
+
+class TestDecide:
+
+    @pytest.fixture
+    def make_lba(self, fsm_module):
+        def make(rules, size=4):
+            lba = fsm_module.LinearBoundedAutomaton(
+                "LBA", tape_size=[size], axes=1, movement={"F": [1], "B": [-1]}, register="S"
+            )
+            lba.add_terminals("a", "b", "c")
+            for rule in rules:
+                lba.add_transition(*rule)
+            return lba
+
+        return make
+
+    @pytest.fixture
+    def sweep_lba(self, make_lba):
+        """Accept the words of 'a' shorter than the tape, replacing them with 'b'."""
+        return make_lba([("S", "a", "S", "b", "F"), ("S", "_", "OK", "_", "F")])
+
+    @pytest.fixture
+    def guess_lba(self, make_lba):
+        """Nondeterministically accept the words containing 'ab'."""
+        return make_lba(
+            [
+                ("S", "a", "S", "a", "F"),
+                ("S", "b", "S", "b", "F"),
+                ("S", "a", "G", "a", "F"),
+                ("G", "b", "OK", "b", "F"),
+            ]
+        )
+
+    def test_deterministic(self, sweep_lba):
+        assert sweep_lba.decide(["a", "a"]) is True
+        assert sweep_lba.decide([]) is True
+        assert sweep_lba.decide(["a", "b"]) is False
+
+    def test_head_leaves_tape(self, sweep_lba):
+        assert sweep_lba.decide(["a"] * 4) is False
+
+    def test_loop_rejected(self, make_lba):
+        # Bounces between the first two cells, rewriting them forever.
+        lba = make_lba(
+            [
+                ("S", "a", "T", "b", "F"),
+                ("S", "b", "T", "a", "F"),
+                ("T", "a", "S", "a", "B"),
+                ("T", "b", "S", "b", "B"),
+                ("T", "_", "S", "_", "B"),
+            ]
+        )
+        assert lba.decide(["a", "b"]) is False
+        assert lba.decide(["a", "b"], nondeterministic=True) is False
+
+    def test_sweep_loop_rejected(self, make_lba):
+        # Sweeps back and forth between the end markers 'c' and 'b', toggling the cells.
+        lba = make_lba(
+            [
+                ("S", "c", "S", "c", "F"),
+                ("S", "_", "S", "a", "F"),
+                ("S", "a", "S", "_", "F"),
+                ("S", "b", "T", "b", "B"),
+                ("T", "_", "T", "a", "B"),
+                ("T", "a", "T", "_", "B"),
+                ("T", "c", "S", "c", "F"),
+            ],
+            size=6,
+        )
+        assert lba.decide(["c", "a", "_", "a", "_", "b"]) is False
+        assert lba.decide(["c", "a", "_", "a", "_", "b"], nondeterministic=True) is False
+
+    def test_nondeterministic(self, guess_lba):
+        assert guess_lba.decide(["b", "a", "b"]) is True
+        assert guess_lba.decide(["b", "b", "a"]) is False
+        assert guess_lba.decide(["b", "a", "b"], nondeterministic=False) is False
+
+    def test_nondeterministic_loop(self, make_lba):
+        lba = make_lba(
+            [
+                ("S", "a", "S", "a", "F"),
+                ("S", "a", "T", "a", "F"),
+                ("S", "b", "S", "b", "B"),
+                ("T", "b", "S", "b", "B"),
+                ("T", "a", "OK", "a", "F"),
+            ]
+        )
+        assert lba.decide(["a", "b"]) is False
+        assert lba.decide(["a", "a"]) is True
+
+    def test_bloom_filter(self, guess_lba):
+        from fsm_tools.visited import BloomFilter
+
+        assert guess_lba.decide(["a", "a", "b"], visited=BloomFilter) is True
+        assert guess_lba.decide(["a", "a", "a"], visited=BloomFilter) is False
+
+    def test_machine_not_modified(self, sweep_lba):
+        sweep_lba.set_tape(["a"])
+        sweep_lba.decide(["a", "a", "a"])
+        assert sweep_lba.register == "S"
+        assert sweep_lba.tape[:1] == ["a"] and sweep_lba.head == [0]
+
+    def test_accept_state_register(self, sweep_lba):
+        sweep_lba.register = "OK"
+        assert sweep_lba.decide(["b"]) is True
+
+    def test_word_too_long(self, sweep_lba):
+        with pytest.raises(ValueError, match="exceeds the tape limit"):
+            sweep_lba.decide(["a"] * 5)
+
+    def test_unknown_symbol(self, sweep_lba, fsm_module):
+        with pytest.raises(fsm_module.ReadError):
+            sweep_lba.decide(["z"])
+
+    def test_symbol_class(self, make_lba, fsm_module):
+        # Digits are not in the alphabet: only the class rule reads them.
+        digits = fsm_module.SymbolClass(("0", "9"))
+        lba = make_lba(
+            [("S", digits, "S", fsm_module.SAME, "F"), ("S", "_", "OK", "_", "F")], size=6
+        )
+        assert lba.decide(["1", "2", "3"]) is True
+        assert lba.decide(["1", "a"]) is False
+        with pytest.raises(fsm_module.ReadError):
+            lba.decide(["1", "z"])
+
+    def test_pushdown_automaton(self, fsm_module):
+        with pytest.raises(NotImplementedError):
+            fsm_module.PushdownAutomaton("PDA").decide(["a"])
@@ -20,9 +20,10 @@ Transitions:
 
 import pytest
 
-from fsm_tools import PushdownAutomaton
+from fsm_tools import PushdownAutomaton, StepStatus
 from fsm_tools.exception import (
     AddError,
+    ModifyError,
     ReadError,
     RemoveComponentError,
     ValidationError,
@@ -357,3 +358,98 @@ class TestTapeOverrides:
     def test_move_raises(self, empty_pda):
         with pytest.raises(NotImplementedError):
             empty_pda.move("F1")
+
+    def test_run_nondeterministic_raises(self, pda_anbn):
+        with pytest.raises(NotImplementedError, match="validate"):
+            pda_anbn.run_nondeterministic()
+        with pytest.raises(NotImplementedError):
+            pda_anbn.run_nondeterministic(workers=2)
+
+
+# ---------------------------------------------------------------------------
+# Frozen (trusted) execution tests
+# ---------------------------------------------------------------------------
+
+
+class TestFreeze:
+    @pytest.mark.parametrize(
+        "word, expected",
+        [
+            (["a", "b"], True),
+            (["a", "a", "a", "b", "b", "b"], True),
+            (["a", "a", "b"], False),
+            (["b", "a"], False),
+        ],
+    )
+    def test_frozen_validate_matches(self, pda_anbn, word, expected):
+        pda_anbn.freeze()
+        assert pda_anbn.validate(word) is expected
+
+    def test_frozen_step_pushes_in_order(self, pda_anbn):
+        pda_anbn.freeze()
+        pda_anbn.set_input(["a", "b"])
+        pda_anbn.step()
+        assert pda_anbn.stack == ["Z", "A"]
+
+    def test_frozen_rejects_new_transition(self, pda_anbn):
+        pda_anbn.freeze()
+        with pytest.raises(ModifyError, match="frozen"):
+            pda_anbn.add_transition("q0", "b", "Z", "q1", [])
+
+    def test_freeze_rejects_unknown_stack_symbol(self, pda_anbn):
+        pda_anbn.add_rules(("q0", "b", "Z", "q1", ["X"]))
+        with pytest.raises(ValidationError):
+            pda_anbn.freeze()
+
+
+class TestStepStatus:
+    def test_step_status_stuck(self, pda_anbn):
+        pda_anbn.set_input(["b"])
+        assert pda_anbn.step_status() is StepStatus.STUCK
+        assert pda_anbn.stack == ["Z"]
+
+    def test_step_status_empty_stack(self, pda_anbn):
+        pda_anbn.set_input(["a"])
+        pda_anbn.stack = []
+        assert pda_anbn.step_status() is StepStatus.STUCK
+
+    def test_validate_does_not_raise_on_rejection(self, pda_anbn, monkeypatch):
+        def fail():
+            raise AssertionError("validate() must not go through step()")
+
+        monkeypatch.setattr(pda_anbn, "step", fail)
+        assert pda_anbn.validate(["b", "a"]) is False
+        assert pda_anbn.validate(["a", "b"]) is True
+
+    @pytest.fixture
+    def pda_through_ok(self):
+        """Goes through a state named 'OK' before the end of its input."""
+        pda = PushdownAutomaton(name="through")
+        pda.add_terminals("a", "b")
+        pda.set_register("q")
+        pda.add_transition("q", "a", "Z", "OK", ["Z"])
+        pda.add_transition("OK", "b", "Z", "q", ["Z"])
+        return pda
+
+    def test_accept_state_name_does_not_halt(self, pda_through_ok):
+        pda_through_ok.set_input(["a", "b"])
+        assert pda_through_ok.step_status() is StepStatus.RUNNING
+        assert pda_through_ok.register == "OK"
+        assert pda_through_ok.step_status() is StepStatus.ACCEPTED
+        assert pda_through_ok.input_pos == 2
+
+    def test_run_status_by_empty_stack(self, pda_through_ok):
+        pda_through_ok.set_input(["a", "b"])
+        assert pda_through_ok.run_status() is StepStatus.ACCEPTED
+        assert pda_through_ok.validate(["a", "b"]) is True
+
+    def test_empty_input_rejected(self, pda_through_ok):
+        pda_through_ok.set_input([])
+        assert pda_through_ok.step_status() is StepStatus.REJECTED
+
+    def test_definition_by_empty_stack(self, pda_through_ok):
+        definition = pda_through_ok.definition()
+        configuration = definition.configuration(["a", "b"])
+        assert definition.run(configuration, max_steps=1) is StepStatus.RUNNING
+        assert definition.run(configuration) is StepStatus.ACCEPTED
+        assert definition.validate(["a", "b"]) is True
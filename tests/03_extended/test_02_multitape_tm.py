@@ -0,0 +1,127 @@
+"""
+Tests for MultiTapeTuringMachine (extended.py).
+Uses fixtures from conftest.py (importlib-based).
+"""
+
+import pytest
+
+
+def palindrome(fsm_module):
+    """
+    Two-tape palindrome checker on ``#w``: copy ``w`` on tape 2, rewind tape 1, then
+    compare tape 1 forward with tape 2 backward. It runs in 3|w| + 3 steps.
+    """
+    tm = fsm_module.MultiTapeTuringMachine("PAL", register="copy")
+    tm.add_terminals("a", "b", "#")
+    for x in ("a", "b"):
+        tm.add_transition("copy", (x, "_"), "copy", (x, x), ("F1", "F1"))
+    tm.add_transition("copy", ("_", "_"), "rewind", ("_", "_"), ("B1", "B1"))
+    for y in ("a", "b", "_"):
+        for x in ("a", "b"):
+            tm.add_transition("rewind", (x, y), "rewind", (x, y), ("B1", "S"))
+        tm.add_transition("rewind", ("#", y), "compare", ("#", y), ("F1", "S"))
+    for x in ("a", "b"):
+        tm.add_transition("compare", (x, x), "compare", (x, x), ("F1", "B1"))
+    tm.add_transition("compare", ("a", "b"), "nOK", ("a", "b"), ("S", "S"))
+    tm.add_transition("compare", ("b", "a"), "nOK", ("b", "a"), ("S", "S"))
+    tm.add_transition("compare", ("_", "_"), "OK", ("_", "_"), ("S", "S"))
+    return tm
+
+
+class TestInitialization:
+
+    def test_is_turing_machine(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", n_tapes=3, register="q0")
+        assert isinstance(tm, fsm_module.TuringMachine)
+        assert tm.GRAMMAR == "Recursively Enumerable"
+        assert tm.tape == [[], [], []]
+        assert tm.head == [0, 0, 0]
+
+    def test_default_moves_include_stay(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        assert tm.moves == {"F1": [1], "B1": [-1], "S": [0]}
+
+    def test_zero_tapes_raises_value_error(self, fsm_module):
+        with pytest.raises(ValueError, match="at least 1 tape"):
+            fsm_module.MultiTapeTuringMachine("MT", n_tapes=0)
+
+
+class TestTransitions:
+
+    def test_rule_stored_with_tuples(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        tm.add_terminals("a")
+        tm.add_transition("q0", ["a", "_"], "q1", ["a", "a"], ["F1", "S"])
+        assert tm.get_rules() == [("q0", ("a", "_"), "q1", ("a", "a"), ("F1", "S"))]
+        assert "q1" in tm.get_states()
+
+    def test_wrong_arity_raises_value_error(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        with pytest.raises(ValueError, match="one per tape"):
+            tm.add_transition("q0", ("_",), "q1", ("_", "_"), ("S", "S"))
+
+    def test_unknown_symbol_raises_read_error(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        with pytest.raises(fsm_module.ReadError):
+            tm.add_transition("q0", ("x", "_"), "q1", ("_", "_"), ("S", "S"))
+
+    def test_invalid_move_raises_value_error(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        with pytest.raises(ValueError, match="Invalid move"):
+            tm.add_transition("q0", ("_", "_"), "q1", ("_", "_"), ("S", "X"))
+
+
+class TestExecution:
+
+    def test_set_tape_loads_first_tape(self, fsm_module):
+        tm = palindrome(fsm_module)
+        tm.set_tape(["#", "a"], location=[1, 1])
+        assert tm.read() == ("a", "_")
+        assert tm.tape == [["#", "a"], ["_", "_"]]
+
+    def test_step_applies_every_tape(self, fsm_module):
+        tm = palindrome(fsm_module)
+        tm.set_tape(["#", "a"], location=[1, 1])
+        tm.step()
+        assert tm.head == [2, 2]
+        assert tm.tape[1] == ["_", "a"]
+
+    @pytest.mark.parametrize("word", ["", "a", "abba", "abaabaaba"])
+    def test_palindrome_linear_steps(self, fsm_module, word):
+        tm = palindrome(fsm_module)
+        tm.set_tape(["#"] + list(word), location=[1, 1])
+        assert tm.run() == 3 * len(word) + 3
+        assert tm.register == "OK"
+
+    def test_not_palindrome(self, fsm_module):
+        tm = palindrome(fsm_module)
+        tm.set_tape(["#", "a", "b"], location=[1, 1])
+        tm.run()
+        assert tm.register == "nOK"
+
+    def test_head_off_tape_raises_index_error(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        tm.add_transition("q0", ("_", "_"), "q0", ("_", "_"), ("S", "B1"))
+        tm.set_tape([])
+        with pytest.raises(IndexError, match="tape 1"):
+            tm.run()
+
+    def test_fork_configuration_copies_every_tape(self, fsm_module):
+        tm = palindrome(fsm_module)
+        tm.set_tape(["#", "a"], location=[1, 1])
+        saved = tm.fork_configuration()
+        tm.run()
+        tm.restore_configuration(saved)
+        assert tm.tape[1] == ["_", "_"]
+        assert tm.run() == 6
+
+    def test_run_nondeterministic(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        tm.add_terminals("a")
+        tm.add_transition("q0", ("a", "_"), "q0", ("a", "a"), ("F1", "F1"))
+        tm.add_transition("q0", ("a", "_"), "nOK", ("a", "_"), ("S", "S"))
+        tm.add_transition("q0", ("_", "_"), "OK", ("_", "_"), ("S", "S"))
+        tm.set_tape(["a", "a"])
+        result = tm.run_nondeterministic()
+        assert result.verdict is True
+        assert result.configuration == ("OK", (2, 2), (("a", "a"), ("a", "a")))
@@ -0,0 +1,112 @@
+"""
+Tests for hot-loop trace compilation (tracing.py).
+"""
+
+import pytest
+
+from fsm_tools.tracing import MAX_TRACE_LENGTH, HotLoopTracer, compile_trace
+
+
+def sweep_machine(tm_class, length, **kwargs):
+    """Sweep right over a word turning 'a' into 'b', then sweep back turning 'b' into 'a'."""
+    tm = tm_class("Sweep", movement={"R": [1], "L": [-1]}, register="q0", **kwargs)
+    tm.add_terminals("a", "b", "#")
+    tm.add_transition("q0", "#", "q0", "#", "R")
+    tm.add_transition("q0", "a", "q0", "b", "R")
+    tm.add_transition("q0", "_", "q1", "_", "L")
+    tm.add_transition("q1", "b", "q1", "a", "L")
+    tm.add_transition("q1", "#", "OK", "#", "R")
+    tm.set_tape(["#"] + ["a"] * length)
+    tm.set_register("q0")
+    return tm
+
+
+class TestCompileTrace:
+
+    def test_executes_whole_cycles(self):
+        trace = compile_trace([("q", "a", "q", "b", 1)])
+        tape = ["a", "a", "a", "c"]
+        assert trace(tape, 0, 100) == (3, 3, 0)
+        assert tape == ["b", "b", "b", "c"]
+
+    def test_guard_reports_exit_index(self):
+        trace = compile_trace([("p", "a", "q", "x", 1), ("q", "b", "p", "y", 1)])
+        tape = ["a", "b", "a", "a"]
+        head, steps, exit_index = trace(tape, 0, 100)
+        assert (head, steps, exit_index) == (3, 3, 1)
+        assert tape == ["x", "y", "x", "a"]
+
+    def test_guard_on_tape_bounds(self):
+        trace = compile_trace([("q", "a", "q", "a", -1)])
+        assert trace(["a", "a"], 1, 100) == (-1, 2, 0)
+
+    def test_budget_is_respected(self):
+        trace = compile_trace([("q", "a", "q", "a", 1)])
+        assert trace(["a"] * 10, 0, 4) == (4, 4, 0)
+
+
+class TestHotLoopTracer:
+
+    def test_invalid_threshold(self, fsm_module):
+        with pytest.raises(ValueError, match="hot_threshold"):
+            HotLoopTracer(fsm_module.TuringMachine("TM", register="S"), 0)
+
+    def test_hot_cycles_compiled(self, fsm_module):
+        tm = sweep_machine(fsm_module.TuringMachine, 50)
+        tracer = HotLoopTracer(tm, hot_threshold=3)
+        assert tracer.run() == 103
+        assert set(tracer.traces) == {("q0", "a"), ("q1", "b")}
+        assert tm.register == "OK"
+
+    def test_same_result_as_generic_loop(self, fsm_module):
+        traced = sweep_machine(fsm_module.TuringMachine, 200)
+        generic = sweep_machine(fsm_module.TuringMachine, 200)
+        assert traced.run(hot_threshold=2) == generic.run()
+        assert traced.tape == generic.tape
+        assert traced.head == generic.head
+
+    def test_max_steps_inside_a_trace(self, fsm_module):
+        traced = sweep_machine(fsm_module.TuringMachine, 200)
+        generic = sweep_machine(fsm_module.TuringMachine, 200)
+        assert traced.run(max_steps=150, hot_threshold=2) == 150
+        generic.run(max_steps=150)
+        assert traced.tape == generic.tape
+        assert (traced.head, traced.register) == (generic.head, generic.register)
+
+    def test_lba_bounds_enforced(self, fsm_module):
+        lba = fsm_module.LinearBoundedAutomaton(
+            "Loop", tape_size=[6], movement={"R": [1]}, register="q0"
+        )
+        lba.add_terminals("a")
+        lba.add_transition("q0", "a", "q0", "a", "R")
+        lba.add_transition("q0", "_", "q0", "_", "R")
+        lba.set_tape(["a", "a", "a"])
+        with pytest.raises(IndexError):
+            lba.run(hot_threshold=1)
+
+    def test_long_cycles_not_compiled(self, fsm_module):
+        tm = fsm_module.TuringMachine("Long", movement={"R": [1], "L": [-1]}, register="s0")
+        tm.add_terminals("a")
+        size = MAX_TRACE_LENGTH + 2
+        for i in range(size):
+            tm.add_transition(f"s{i}", "a", f"s{(i + 1) % size}", "a", "L" if i % 2 else "R")
+        tm.set_tape(["a", "a"])
+        tracer = HotLoopTracer(tm, hot_threshold=1)
+        tracer.run(max_steps=3 * size)
+        assert tracer.traces == {}
+
+    def test_extended_machine_uses_generic_loop(self, fsm_module):
+        etm = sweep_machine(fsm_module.ExtendedTuringMachine, 20)
+        assert not etm._traceable()
+        assert etm.run(hot_threshold=1) == 43
+        assert etm.register == "OK"
+
+    def test_pushdown_automaton_uses_generic_loop(self, fsm_module):
+        pda = fsm_module.PushdownAutomaton("Count")
+        pda.add_terminals("a")
+        pda.set_register("q0")
+        pda.add_transition("q0", "a", "Z", "q0", ["Z"])
+        pda.set_input(["a"] * 10)
+        assert not pda._traceable()
+        assert pda.run(hot_threshold=2) == 10
+        assert pda.input_pos == 10
@@ -0,0 +1,214 @@
+"""
+Tests for integer-coded transition tables (compiled.py) and NumPy lockstep
+simulation (batch.py).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from fsm_tools.compiled import UNDEFINED, CompiledTable
+
+
+def lookup_in_worker(name, state, symbol):
+    """Attach to a shared table in a worker process and look up one transition."""
+    table = CompiledTable.attach(name)
+    try:
+        return table.lookup(state, symbol)
+    finally:
+        table.close()
+
+
+@pytest.fixture
+def increment_tm(fsm_module):
+    """Binary increment, most significant bit first, head starting on a leading '0'."""
+    tm = fsm_module.TuringMachine("Inc", movement={"R": [1], "L": [-1]}, register="q0")
+    tm.add_terminals("0", "1", "#")
+    tm.add_transition("q0", "0", "q0", "0", "R")
+    tm.add_transition("q0", "1", "q0", "1", "R")
+    tm.add_transition("q0", "#", "q0", "#", "R")
+    tm.add_transition("q0", "_", "q1", "_", "L")
+    tm.add_transition("q1", "1", "q1", "0", "L")
+    tm.add_transition("q1", "0", "q2", "1", "L")
+    tm.add_transition("q2", "0", "q2", "0", "L")
+    tm.add_transition("q2", "1", "q2", "1", "L")
+    tm.add_transition("q2", "#", "OK", "#", "R")
+    return tm
+
+
+class TestCompiledTable:
+
+    def test_blank_is_code_zero(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        assert table.symbols[0] == "_"
+
+    def test_start_is_register(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        assert table.states[table.start] == "q0"
+        assert table.states[table.accept] == "OK"
+        assert table.states[table.reject] == "nOK"
+
+    def test_lookup(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        codes = table.state_codes
+        next_state, write, move = table.lookup(codes["q1"], table.symbol_codes["1"])
+        assert table.states[next_state] == "q1"
+        assert table.symbols[write] == "0"
+        assert move == -1
+
+    def test_undefined_lookup(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        assert table.lookup(table.state_codes["q1"], table.symbol_codes["#"]) is None
+        assert UNDEFINED in table.next_state
+
+    def test_first_rule_wins(self, increment_tm):
+        increment_tm.add_transition("q0", "0", "nOK", "0", "R")
+        table = CompiledTable.from_machine(increment_tm)
+        next_state, _, _ = table.lookup(table.start, table.symbol_codes["0"])
+        assert table.states[next_state] == "q0"
+
+    def test_encode_decode(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        assert table.decode(table.encode(["#", "1", "_"])) == ["#", "1", "_"]
+
+    def test_encode_unknown_symbol(self, increment_tm, fsm_module):
+        table = CompiledTable.from_machine(increment_tm)
+        with pytest.raises(fsm_module.ReadError):
+            table.encode(["x"])
+
+    def test_only_1d_machines(self, fsm_module):
+        etm = fsm_module.ExtendedTuringMachine("ETM", axes=2, register="S")
+        with pytest.raises(ValueError, match="axes=2"):
+            CompiledTable.from_machine(etm)
+
+    def test_array_sizes_checked(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        with pytest.raises(ValueError, match="next_state"):
+            CompiledTable(
+                table.states, table.symbols, table.next_state[1:], table.write, table.move, 0, 1, 2
+            )
+
+
+class TestSharedTable:
+
+    def test_attach_same_table(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        segment = table.share()
+        try:
+            shared = CompiledTable.attach(segment.name)
+            assert shared.states == table.states
+            assert shared.symbols == table.symbols
+            assert (shared.start, shared.accept, shared.reject) == (
+                table.start,
+                table.accept,
+                table.reject,
+            )
+            assert list(shared.next_state) == list(table.next_state)
+            assert list(shared.write) == list(table.write)
+            assert list(shared.move) == list(table.move)
+            shared.close()
+            shared.close()
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_arrays_are_views(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        segment = table.share()
+        try:
+            shared = CompiledTable.attach(segment.name)
+            assert isinstance(shared.next_state, memoryview)
+            shared.close()
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_worker_process(self, increment_tm):
+        table = CompiledTable.from_machine(increment_tm)
+        state, symbol = table.state_codes["q1"], table.symbol_codes["1"]
+        segment = table.share()
+        try:
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                results = list(
+                    pool.map(lookup_in_worker, [segment.name] * 2, [state] * 2, [symbol] * 2)
+                )
+        finally:
+            segment.close()
+            segment.unlink()
+        assert results == [table.lookup(state, symbol)] * 2
+
+    def test_not_a_table(self):
+        from multiprocessing import shared_memory
+
+        segment = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(ValueError):
+                CompiledTable.attach(segment.name)
+        finally:
+            segment.close()
+            segment.unlink()
+
+
+class TestBatchTuringMachine:
+
+    @pytest.fixture
+    def batch_module(self):
+        pytest.importorskip("numpy")
+        import fsm_tools.batch as batch
+
+        return batch
+
+    def test_matches_single_runs(self, batch_module, increment_tm, fsm_module):
+        words = [list("#0111"), list("#01"), list("#010"), list("#011011")]
+        batch = batch_module.BatchTuringMachine(increment_tm)
+        batch.load(words)
+        batch.run()
+        for row, word in enumerate(words):
+            tm = fsm_module.TuringMachine("Inc", movement={"R": [1], "L": [-1]}, register="q0")
+            tm.add_terminals("0", "1", "#")
+            for rule in increment_tm.get_rules():
+                tm.add_transition(*rule)
+            tm.set_tape(list(word))
+            steps = tm.run()
+            assert batch.steps[row] == steps
+            assert batch.register(row) == tm.register
+            assert batch.tape(row) == [s for s in tm.tape if s != "_"]
+        assert batch.accepted.all()
+
+    def test_tapes_grow_to_the_right(self, batch_module, increment_tm):
+        batch = batch_module.BatchTuringMachine(increment_tm)
+        batch.load([list("#01")], width=1)
+        batch.run()
+        assert batch.tapes.shape[1] >= 4
+        assert batch.tape(0) == ["#", "1", "0"]
+        assert batch.status[0] == batch_module.ACCEPTED
+
+    def test_halted_rows_are_masked(self, batch_module, increment_tm):
+        batch = batch_module.BatchTuringMachine(increment_tm)
+        batch.load([list("#0"), list("#0000000000")])
+        batch.run(max_steps=5)
+        assert batch.status[0] == batch_module.ACCEPTED
+        assert batch.status[1] == batch_module.RUNNING
+        assert batch.steps[0] == 5 and batch.steps[1] == 5
+        batch.run()
+        assert batch.steps[0] == 5
+
+    def test_stuck_rows(self, batch_module, increment_tm):
+        batch = batch_module.BatchTuringMachine(increment_tm)
+        batch.load([list("#1"), list("#01")])
+        batch.run()
+        assert batch.status[0] == batch_module.STUCK
+        assert batch.register(0) == "q1"
+        assert batch.status[1] == batch_module.ACCEPTED
+
+    def test_out_of_tape_rows(self, batch_module, increment_tm):
+        batch = batch_module.BatchTuringMachine(increment_tm)
+        batch.load([list("01")])
+        batch.run()
+        assert batch.status[0] == batch_module.OUT_OF_TAPE
+        assert batch.heads[0] == -1
+
+    def test_unknown_symbol(self, batch_module, increment_tm, fsm_module):
+        batch = batch_module.BatchTuringMachine(increment_tm)
+        with pytest.raises(fsm_module.ReadError):
+            batch.load([["x"]])
@@ -0,0 +1,195 @@
+"""
+Tests for configuration-space search (search.py) and nondeterministic runs.
+"""
+
+import pytest
+
+from fsm_tools.search import ConfigurationSearch, ParallelSearch, SearchResult
+
+
+@pytest.fixture(params=["bfs", "iddfs"])
+def strategy(request):
+    return request.param
+
+
+def increment_mod_5(n):
+    return [(n + 1) % 5]
+
+
+def is_4321(n):
+    return n == 4321
+
+
+def failing_successors(n):
+    raise ZeroDivisionError("no successors")
+
+
+class TestConfigurationSearch:
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError, match="Unknown search strategy"):
+            ConfigurationSearch(lambda c: [], lambda c: False, strategy="dfs")
+
+    def test_initial_accepting(self, strategy):
+        result = ConfigurationSearch(lambda c: [], lambda c: c == 0, strategy).search(0)
+        assert result.verdict is True
+        assert result.depth == 0
+
+    def test_finds_accepting_branch(self, strategy):
+        search = ConfigurationSearch(lambda n: [n + 1, n * 2], lambda n: n == 12, strategy)
+        result = search.search(1)
+        assert result.accepted
+        assert result.configuration == 12
+
+    def test_bfs_finds_shortest_branch(self):
+        search = ConfigurationSearch(lambda n: [n + 1, n * 2], lambda n: n == 12)
+        assert search.search(1).depth == 4
+
+    def test_exhausted_space_rejects(self, strategy):
+        search = ConfigurationSearch(lambda n: [(n + 1) % 5], lambda n: n == 7, strategy)
+        result = search.search(0)
+        assert result.verdict is False
+        assert result.configurations == 5
+
+    def test_step_budget(self, strategy):
+        search = ConfigurationSearch(lambda n: [n + 1], lambda n: n == 100, strategy, max_steps=10)
+        assert search.search(0).verdict is None
+
+    def test_configuration_budget(self, strategy):
+        search = ConfigurationSearch(
+            lambda n: [n + 1], lambda n: n == 100, strategy, max_configurations=10
+        )
+        result = search.search(0)
+        assert result.verdict is None
+        assert result.configurations <= 10
+
+    def test_result_repr_and_bool(self):
+        result = SearchResult(True, True, "c", 3, 4)
+        assert result
+        assert "verdict=True" in repr(result)
+
+
+class TestParallelSearch:
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_finds_accepting_branch(self, workers, double_or_increment):
+        result = ParallelSearch(double_or_increment, is_4321, workers=workers).search(1)
+        assert result.verdict is True
+        assert result.configuration == 4321
+
+    def test_exhausted_space_rejects(self, double_or_increment, never):
+        result = ParallelSearch(double_or_increment, never, workers=3, batch_size=8).search(1)
+        assert result.verdict is False
+        sequential = ConfigurationSearch(double_or_increment, never).search(1)
+        assert result.configurations == sequential.configurations
+
+    def test_small_space(self, never):
+        result = ParallelSearch(increment_mod_5, never, workers=2).search(0)
+        assert result.verdict is False
+        assert result.configurations == 5
+
+    def test_step_budget(self, double_or_increment):
+        search = ParallelSearch(double_or_increment, is_4321, workers=2, max_steps=5)
+        assert search.search(1).verdict is None
+
+    def test_configuration_budget(self, double_or_increment, never):
+        search = ParallelSearch(double_or_increment, never, workers=2, max_configurations=100)
+        assert search.search(1).verdict is None
+
+    def test_initial_accepting(self, double_or_increment):
+        result = ParallelSearch(double_or_increment, is_4321, workers=2).search(4321)
+        assert result.accepted and result.depth == 0
+
+    def test_worker_error(self, never):
+        with pytest.raises(ZeroDivisionError):
+            ParallelSearch(failing_successors, never, workers=2).search(0)
+
+    @pytest.mark.parametrize("kwargs", [{"workers": 0}, {"batch_size": 0}])
+    def test_invalid(self, kwargs, double_or_increment, never):
+        with pytest.raises(ValueError):
+            ParallelSearch(double_or_increment, never, **kwargs)
+
+
+class TestRunNondeterministic:
+
+    def test_deterministic_run_misses_branch(self, guess_ab):
+        guess_ab.set_tape(["b", "a", "b"])
+        with pytest.raises(Exception, match="No valid transition"):
+            guess_ab.run()
+
+    def test_accepts(self, guess_ab, strategy):
+        guess_ab.set_tape(["b", "a", "b"])
+        result = guess_ab.run_nondeterministic(strategy=strategy)
+        assert result.verdict is True
+        state, head, tape = result.configuration
+        assert (state, head, tape) == ("OK", 3, ("b", "a", "b"))
+
+    def test_rejects(self, guess_ab, strategy):
+        guess_ab.set_tape(["b", "b", "a"])
+        assert guess_ab.run_nondeterministic(strategy=strategy).verdict is False
+
+    def test_parallel(self, guess_ab):
+        guess_ab.set_tape(["b", "a", "b"])
+        result = guess_ab.run_nondeterministic(workers=2)
+        assert result.configuration == ("OK", 3, ("b", "a", "b"))
+        guess_ab.set_tape(["b", "b", "a"])
+        assert guess_ab.run_nondeterministic(workers=2).verdict is False
+
+    def test_machine_not_modified(self, guess_ab):
+        guess_ab.set_tape(["a", "b"])
+        guess_ab.run_nondeterministic()
+        assert guess_ab.register == "q0"
+        assert guess_ab.head == [0]
+
+    def test_looping_machine_rejected(self, fsm_module, strategy):
+        tm = fsm_module.TuringMachine("Loop", movement={"R": [1], "L": [-1]}, register="q0")
+        tm.add_terminals("a")
+        tm.add_transition("q0", "a", "q1", "a", "R")
+        tm.add_transition("q1", "_", "q0", "_", "L")
+        tm.set_tape(["a"])
+        assert tm.run_nondeterministic(strategy=strategy).verdict is False
+
+    def test_growing_machine_hits_budget(self, fsm_module, strategy):
+        tm = fsm_module.TuringMachine("Grow", movement={"R": [1]}, register="q0")
+        tm.add_terminals("a")
+        tm.add_transition("q0", "_", "q0", "a", "R")
+        tm.set_tape([])
+        result = tm.run_nondeterministic(max_configurations=50, strategy=strategy)
+        assert result.verdict is None
+
+    def test_lba_bounds_kill_branches(self, fsm_module):
+        lba = fsm_module.LinearBoundedAutomaton(
+            "Bounded", tape_size=[3], movement={"R": [1]}, register="q0"
+        )
+        lba.add_terminals("a")
+        lba.add_transition("q0", "a", "q0", "a", "R")
+        lba.add_transition("q0", "_", "q0", "_", "R")
+        lba.set_tape(["a"])
+        result = lba.run_nondeterministic()
+        assert result.verdict is False
+        assert result.configurations == 3
+
+    def test_extended_machine(self, fsm_module, strategy):
+        etm = fsm_module.ExtendedTuringMachine(
+            "Left", movement={"R": [1], "L": [-1]}, register="q0"
+        )
+        etm.add_terminals("a")
+        etm.add_transition("q0", "_", "q0", "a", "L")
+        etm.add_transition("q0", "_", "q1", "_", "L")
+        etm.add_transition("q1", "_", "OK", "a", "R")
+        etm.set_tape([])
+        result = etm.run_nondeterministic(strategy=strategy)
+        assert result.accepted
+        state, head, cells = result.configuration
+        assert state == "OK"
+        assert ((head[0] - 1,), "a") in cells
+
+    def test_extended_lba_bounds(self, fsm_module):
+        elba = fsm_module.ExtendedLBA(
+            "Bounded", tape_size=[2], movement={"R": [1], "L": [-1]}, register="q0"
+        )
+        elba.add_terminals("a")
+        elba.add_transition("q0", "_", "q0", "a", "L")
+        elba.add_transition("q0", "a", "q0", "a", "L")
+        elba.set_tape([])
+        assert elba.run_nondeterministic().verdict is False
@@ -0,0 +1,305 @@
+"""
+Tests for the alternative tape backends (tapes.py).
+"""
+
+import functools
+
+import pytest
+
+from fsm_tools import LinearBoundedAutomaton, StepStatus, TuringMachine
+from fsm_tools.tapes import MmapTape, PersistentTape, ZipperTape
+
+
+def sweep(tm):
+    """Turn a word of 'a' into 'b' going left from its last cell, then accept."""
+    tm.add_terminals("a", "b")
+    tm.add_transition("q0", "a", "q0", "b", "L")
+    tm.add_transition("q0", "_", "OK", "_", "R")
+    return tm
+
+
+class TestZipperTape:
+
+    def test_initial_content(self):
+        tape = ZipperTape("_", ["a", "b"])
+        assert tape.read(0) == "a"
+        assert tape.read(1) == "b"
+        assert tape.read(2) == "_"
+
+    def test_negative_positions(self):
+        tape = ZipperTape("_", ["a"])
+        assert tape.read(-3) == "_"
+        tape.write(-2, "b")
+        assert tape.start == -3
+        assert tape.to_list() == ["_", "b", "_", "a"]
+
+    def test_write_beyond_content(self):
+        tape = ZipperTape("_")
+        tape.write(2, "a")
+        assert tape.read(2) == "a"
+        assert tape.to_list() == ["_", "_", "a"]
+
+    def test_cursor_follows_accesses(self):
+        tape = ZipperTape("_", ["a", "b", "c"])
+        tape.read(2)
+        assert tape.position == 2
+        assert len(tape.left) == 2
+        tape.read(1)
+        assert tape.position == 1
+        assert tape.right[-1] == "b"
+
+    def test_repr(self):
+        assert "start=0" in repr(ZipperTape("_", ["a"]))
+
+
+class TestZipperBackend:
+
+    @pytest.fixture(params=["TuringMachine", "ExtendedTuringMachine"])
+    def machine_class(self, request, fsm_module):
+        return getattr(fsm_module, request.param)
+
+    def test_tape_is_zipper(self, machine_class):
+        tm = machine_class("TM", register="q0", tape_backend=ZipperTape)
+        assert isinstance(tm.tape, ZipperTape)
+        assert tm.tape_backend is ZipperTape
+
+    def test_set_tape(self, machine_class):
+        tm = machine_class("TM", register="q0", tape_backend=ZipperTape)
+        tm.add_terminals("a")
+        tm.set_tape(["a", "a"], location=[1])
+        assert tm.head == [1]
+        assert tm.read() == "a"
+        assert tm.tape.to_list() == ["a", "a"]
+
+    def test_set_tape_unknown_symbol(self, machine_class, fsm_module):
+        tm = machine_class("TM", register="q0", tape_backend=ZipperTape)
+        with pytest.raises(fsm_module.ReadError):
+            tm.set_tape(["x"])
+
+    def test_run_moves_left_of_origin(self, machine_class):
+        tm = sweep(
+            machine_class(
+                "TM", movement={"L": [-1], "R": [1]}, register="q0", tape_backend=ZipperTape
+            )
+        )
+        tm.set_tape(["a", "a", "a"], location=[2])
+        assert tm.run() == 4
+        assert tm.register == "OK"
+        assert tm.head == [0]
+        assert tm.tape.to_list() == ["_", "b", "b", "b"]
+
+    def test_list_tape_still_right_infinite(self, fsm_module):
+        tm = sweep(fsm_module.TuringMachine("TM", movement={"L": [-1], "R": [1]}, register="q0"))
+        tm.set_tape(["a", "a", "a"], location=[2])
+        with pytest.raises(IndexError):
+            tm.run()
+
+    def test_backend_requires_1d(self, fsm_module):
+        with pytest.raises(ValueError, match="1D"):
+            fsm_module.ExtendedTuringMachine("ETM", axes=2, tape_backend=ZipperTape)
+
+    def test_nondeterministic_run_rejected(self, fsm_module):
+        tm = fsm_module.TuringMachine("TM", register="q0", tape_backend=ZipperTape)
+        with pytest.raises(ValueError, match="tape backend"):
+            tm.run_nondeterministic()
+
+
+class TestPersistentTape:
+
+    def test_initial_content(self):
+        tape = PersistentTape("_", ["a", "b"])
+        assert tape.read(0) == "a"
+        assert tape.read(1) == "b"
+        assert tape.read(1000) == "_"
+
+    def test_negative_positions(self):
+        tape = PersistentTape("_", ["a"])
+        tape.write(-2, "b")
+        assert tape.read(-2) == "b"
+        assert tape.start == -2
+        assert tape.to_list() == ["b", "_", "a"]
+
+    def test_far_writes_grow_the_trie(self):
+        tape = PersistentTape("_")
+        tape.write(100000, "a")
+        tape.write(-70000, "b")
+        assert tape.read(100000) == "a"
+        assert tape.read(-70000) == "b"
+        assert tape.read(99999) == "_"
+
+    def test_fork_is_independent(self):
+        tape = PersistentTape("_", ["a"] * 200)
+        clone = tape.fork()
+        clone.write(5, "b")
+        tape.write(150, "c")
+        assert tape.read(5) == "a"
+        assert clone.read(5) == "b"
+        assert clone.read(150) == "a"
+        assert tape.read(150) == "c"
+
+    def test_write_after_fork_copies_one_chunk(self):
+        # 32 chunks of 64 cells: a root node whose children are the chunks.
+        tape = PersistentTape("_", ["a"] * (64 * 32))
+        clone = tape.fork()
+        clone.write(70, "b")
+        original, copied = tape._roots[0], clone._roots[0]
+        assert original is not copied
+        shared = [slot for slot in range(1, 33) if copied[slot] is original[slot]]
+        assert shared == [slot for slot in range(1, 33) if slot != 2]
+
+    def test_repeated_forks(self):
+        tapes = [PersistentTape("_", ["a", "a", "a"])]
+        for position in range(3):
+            tapes.append(tapes[-1].fork())
+            tapes[-1].write(position, "b")
+        assert [tape.to_list() for tape in tapes] == [
+            ["a", "a", "a"],
+            ["b", "a", "a"],
+            ["b", "b", "a"],
+            ["b", "b", "b"],
+        ]
+
+    def test_repr(self):
+        assert "start=0" in repr(PersistentTape("_", ["a"]))
+
+
+class TestForkConfiguration:
+
+    @pytest.fixture(params=[None, ZipperTape, PersistentTape])
+    def backend(self, request):
+        return request.param
+
+    def test_restore_after_run(self, fsm_module, backend):
+        tm = sweep(
+            fsm_module.TuringMachine(
+                "TM", movement={"L": [-1], "R": [1]}, register="q0", tape_backend=backend
+            )
+        )
+        tm.set_tape(["_", "a", "a"], location=[2])
+        saved = tm.fork_configuration()
+        tm.run()
+        assert tm.register == "OK"
+        tm.restore_configuration(saved)
+        assert tm.register == "q0"
+        assert tm.head == [2]
+        assert tm.read() == "a"
+        assert tm.run() == 3
+        tm.restore_configuration(saved)
+        assert tm.read() == "a"
+
+    def test_extended_machine_dict_tape(self, fsm_module):
+        etm = fsm_module.ExtendedTuringMachine("ETM", axes=2, register="q0")
+        etm.add_terminals("a")
+        etm.set_tape([["a"]])
+        saved = etm.fork_configuration()
+        etm.write("_")
+        etm.restore_configuration(saved)
+        assert etm.read() == "a"
+
+    def test_lba_backend_enforces_limits(self, fsm_module):
+        lba = fsm_module.LinearBoundedAutomaton(
+            "LBA", tape_size=[3], register="q0", tape_backend=PersistentTape
+        )
+        lba.add_terminals("a")
+        lba.set_tape(["a", "a"])
+        lba.head = [2]
+        assert lba.read() == "_"
+        lba.head = [3]
+        with pytest.raises(IndexError, match="out of bounds"):
+            lba.read()
+        lba.head = [-1]
+        with pytest.raises(IndexError, match="out of bounds"):
+            lba.write("a")
+
+
+class TestMmapTape:
+
+    def test_initial_content(self):
+        tape = MmapTape("_", ["a", "b"])
+        assert tape.read(0) == "a"
+        assert tape.read(1) == "b"
+        assert tape.read(2) == "_"
+        assert tape.to_list() == ["a", "b"]
+        assert len(tape) == 2
+
+    def test_grows_far_away(self):
+        tape = MmapTape("_")
+        tape.write(5_000_000, "a")
+        assert tape.read(5_000_000) == "a"
+        assert tape.read(4_999_999) == "_"
+        assert len(tape) == 5_000_001
+
+    def test_negative_position(self):
+        tape = MmapTape("_")
+        with pytest.raises(IndexError):
+            tape.read(-1)
+        with pytest.raises(IndexError):
+            tape.write(-1, "a")
+
+    def test_symbol_table_is_bounded(self):
+        tape = MmapTape("_", range(255))
+        with pytest.raises(ValueError):
+            tape.write(0, "overflow")
+
+    def test_fork_is_independent(self):
+        tape = MmapTape("_", ["a", "b"])
+        clone = tape.fork()
+        clone.write(0, "b")
+        assert tape.read(0) == "a"
+        assert clone.to_list() == ["b", "b"]
+
+    def test_file_backed(self, tmp_path):
+        path = str(tmp_path / "tape.bin")
+        tape = MmapTape("_", ["a", "b", "a"], path=path, symbols="_ab")
+        tape.close()
+        with open(path, "rb") as handle:
+            assert handle.read() == bytes([1, 2, 1])
+
+    def test_load_existing_file(self, tmp_path):
+        path = tmp_path / "tape.bin"
+        path.write_bytes(bytes([1, 1, 0, 2]))
+        tape = MmapTape("_", path=str(path), symbols="_ab")
+        assert tape.to_list() == ["a", "a", "_", "b"]
+        truncated = MmapTape("_", path=str(path), symbols="_ab", truncate=True)
+        assert truncated.to_list() == []
+
+    def test_source_file_not_modified(self, tmp_path):
+        path = tmp_path / "tape.bin"
+        path.write_bytes(bytes([1, 2, 1]))
+        with MmapTape("_", ["b"], path=str(path), symbols="_ab") as tape:
+            tape.write(10, "a")
+            assert tape.to_list()[:3] == ["b", "b", "a"]
+            tape.flush()
+            assert path.read_bytes() == bytes([1, 2, 1])
+        assert path.read_bytes() == bytes([1, 2, 1])
+
+    def test_unknown_code(self, tmp_path):
+        path = tmp_path / "tape.bin"
+        path.write_bytes(bytes([1, 0, 7]))
+        with pytest.raises(ValueError, match="position 2"):
+            MmapTape("_", path=str(path), symbols="_ab")
+        assert path.read_bytes() == bytes([1, 0, 7])
+
+    def test_context_manager_closes(self):
+        with MmapTape("_", ["a"]) as tape:
+            assert tape.read(0) == "a"
+        assert tape._map is None
+
+    def test_turing_machine(self, tmp_path):
+        backend = functools.partial(MmapTape, path=str(tmp_path / "tape.bin"), symbols="_ab")
+        tm = TuringMachine("TM", movement={"R": [1]}, register="q0", tape_backend=backend)
+        tm.add_terminals("a", "b")
+        tm.add_transition("q0", "a", "q0", "b", "R")
+        tm.add_transition("q0", "_", "OK", "_", "R")
+        tm.set_tape(["a"] * 100)
+        assert tm.run() == 101
+        assert tm.tape.to_list()[:100] == ["b"] * 100
+
+    def test_lba_out_of_tape(self):
+        lba = LinearBoundedAutomaton(
+            "LBA", tape_size=[3], movement={"L": [-1]}, register="q0", tape_backend=MmapTape
+        )
+        lba.add_terminals("a")
+        lba.add_transition("q0", "a", "q0", "a", "L")
+        lba.set_tape(["a"])
+        assert lba.run_status() is StepStatus.OUT_OF_TAPE
@@ -0,0 +1,135 @@
+"""
+Tests for the step delta stream (iter_steps, deltas.py).
+"""
+
+from fsm_tools import PushdownAutomaton, StepDelta, StepStatus
+
+
+def drain(iterator):
+    """Collect the deltas of ``iterator`` and its return value."""
+    deltas = []
+    while True:
+        try:
+            deltas.append(next(iterator))
+        except StopIteration as stop:
+            return deltas, stop.value
+
+
+def bounce(tm):
+    """Write 'b' on 'a' moving right, turn back on the blank, accept on '#'."""
+    tm.add_terminals("a", "b", "#")
+    tm.add_transition("q0", "#", "q0", "#", "R")
+    tm.add_transition("q0", "a", "q0", "b", "R")
+    tm.add_transition("q0", "_", "q1", "_", "L")
+    tm.add_transition("q1", "b", "q1", "b", "L")
+    tm.add_transition("q1", "#", "OK", "#", "R")
+    return tm
+
+
+class TestTuringMachine:
+
+    def test_deltas_replay_the_run(self, fsm_module):
+        tm = bounce(fsm_module.TuringMachine("TM", movement={"L": [-1], "R": [1]}, register="q0"))
+        tm.set_tape(["#", "a", "a"])
+        deltas, status = drain(tm.iter_steps())
+        assert status is StepStatus.ACCEPTED
+        assert len(deltas) == 7
+
+        tape, head, register = {0: "#", 1: "a", 2: "a"}, 0, "q0"
+        for delta in deltas:
+            assert delta.position == head
+            tape[delta.position] = delta.written
+            head += delta.move
+            register = delta.state
+        assert [tape[i] for i in range(3)] == tm.tape[:3]
+        assert [head] == tm.head
+        assert register == tm.register
+
+    def test_delta_fields(self, fsm_module):
+        tm = bounce(fsm_module.TuringMachine("TM", movement={"L": [-1], "R": [1]}, register="q0"))
+        tm.set_tape(["#", "a"])
+        steps = tm.iter_steps()
+        next(steps)
+        assert next(steps) == StepDelta(2, 1, "q0", 1, "a", "b", 1)
+
+    def test_rule_id_is_first_matching_rule(self, fsm_module):
+        tm = bounce(fsm_module.TuringMachine("TM", movement={"L": [-1], "R": [1]}, register="q0"))
+        tm.add_transition("q0", "#", "nOK", "#", "R")
+        tm.set_tape(["#"])
+        assert next(tm.iter_steps()).rule == 0
+
+    def test_max_steps(self, fsm_module):
+        tm = bounce(fsm_module.TuringMachine("TM", movement={"L": [-1], "R": [1]}, register="q0"))
+        tm.set_tape(["#", "a", "a"])
+        deltas, status = drain(tm.iter_steps(max_steps=2))
+        assert len(deltas) == 2
+        assert status is StepStatus.RUNNING
+
+    def test_stuck(self, fsm_module):
+        tm = bounce(fsm_module.TuringMachine("TM", movement={"L": [-1], "R": [1]}, register="q0"))
+        tm.set_tape(["b"])
+        assert drain(tm.iter_steps()) == ([], StepStatus.STUCK)
+
+    def test_lba_out_of_tape(self, fsm_module):
+        lba = fsm_module.LinearBoundedAutomaton(
+            "LBA", tape_size=[2], movement={"L": [-1], "R": [1]}, register="q0"
+        )
+        lba.add_terminals("a")
+        lba.add_transition("q0", "a", "q0", "a", "R")
+        lba.set_tape(["a", "a"])
+        deltas, status = drain(lba.iter_steps())
+        assert len(deltas) == 2
+        assert status is StepStatus.OUT_OF_TAPE
+
+
+class TestExtendedMachines:
+
+    def test_extended_positions_are_tuples(self, fsm_module):
+        etm = fsm_module.ExtendedTuringMachine("ETM", axes=2, register="q0")
+        etm.add_terminals("a")
+        etm.add_transition("q0", "a", "q0", "_", "F2")
+        etm.add_transition("q0", "_", "OK", "_", "B1")
+        etm.set_tape([["a", "a"]])
+        deltas, status = drain(etm.iter_steps())
+        assert status is StepStatus.ACCEPTED
+        assert [delta.position for delta in deltas] == [(0, 0), (0, 1), (0, 2)]
+        assert deltas[0].move == (0, 1)
+        assert deltas[-1].move == (-1, 0)
+
+    def test_multitape_deltas(self, fsm_module):
+        tm = fsm_module.MultiTapeTuringMachine("MT", register="q0")
+        tm.add_terminals("a")
+        tm.add_transition("q0", ("a", "_"), "q0", ("a", "a"), ("F1", "S"))
+        tm.add_transition("q0", ("_", "a"), "OK", ("_", "a"), ("S", "S"))
+        tm.set_tape(["a"])
+        deltas, status = drain(tm.iter_steps())
+        assert status is StepStatus.ACCEPTED
+        assert deltas[0] == StepDelta(1, 0, "q0", (0, 0), ("a", "_"), ("a", "a"), (1, 0))
+
+
+class TestPushdownAutomaton:
+
+    def test_stack_deltas(self):
+        pda = PushdownAutomaton(name="anbn", stack_alphabet={"A"})
+        pda.add_terminals("a", "b")
+        pda.set_register("q0")
+        pda.add_transition("q0", "a", "Z", "q0", ["A", "Z"])
+        pda.add_transition("q0", "b", "A", "q1", [])
+        pda.set_input(["a", "b"])
+        deltas, status = drain(pda.iter_steps())
+        assert status is StepStatus.ACCEPTED
+        assert deltas == [
+            StepDelta(1, 0, "q0", 0, "a", None, 1, "Z", ("Z", "A")),
+            StepDelta(2, 1, "q1", 1, "b", None, 1, "A", ()),
+        ]
+        assert pda.stack == ["Z"]
+
+    def test_stuck(self):
+        pda = PushdownAutomaton(name="p")
+        pda.add_terminals("a")
+        pda.set_register("q0")
+        pda.add_transition("q0", "a", "Z", "q0", [])
+        pda.set_input(["a", "a"])
+        deltas, status = drain(pda.iter_steps())
+        assert len(deltas) == 1
+        assert status is StepStatus.STUCK
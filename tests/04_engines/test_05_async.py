@@ -0,0 +1,92 @@
+"""
+Tests for the asyncio-cooperative runner (TuringMachine.arun).
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from fsm_tools import PushdownAutomaton, TuringMachine
+
+
+class TestArun:
+
+    def test_same_result_as_run(self, make_replace_tm):
+        tm = make_replace_tm(250)
+        assert asyncio.run(tm.arun(slice_steps=16)) == 251
+        assert tm.register == "OK"
+        assert tm.tape[:250] == ["b"] * 250
+
+    def test_max_steps(self, make_replace_tm):
+        tm = make_replace_tm(250)
+        assert asyncio.run(tm.arun(max_steps=40, slice_steps=16)) == 40
+        assert tm.head == [40]
+
+    def test_yields_between_slices(self, make_replace_tm):
+        ticks = []
+
+        async def ticker():
+            for tick in range(5):
+                ticks.append(tick)
+                await asyncio.sleep(0)
+
+        async def main():
+            tm = make_replace_tm(100)
+            task = asyncio.create_task(ticker())
+            await tm.arun(slice_steps=10)
+            await task
+            return len(ticks)
+
+        assert asyncio.run(main()) == 5
+
+    def test_cancellation(self, make_forever_tm):
+        tm = make_forever_tm()
+
+        async def main():
+            task = asyncio.create_task(tm.arun(slice_steps=100))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert tm.register == "q0"
+        assert tm.head[0] > 0
+        assert tm.head[0] % 100 == 0
+
+    def test_stuck_raises(self, make_replace_tm):
+        tm = make_replace_tm(0)
+        tm.set_tape(["b"])
+        with pytest.raises(Exception, match="No valid transition"):
+            asyncio.run(tm.arun())
+
+    def test_invalid_slice(self, make_replace_tm):
+        with pytest.raises(ValueError, match="slice_steps"):
+            asyncio.run(make_replace_tm(1).arun(slice_steps=0))
+
+    def test_thread_executor(self, make_replace_tm):
+        tm = make_replace_tm(100)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert asyncio.run(tm.arun(slice_steps=30, executor=executor)) == 101
+        assert tm.register == "OK"
+
+    def test_process_executor(self, make_replace_tm):
+        tm = make_replace_tm(100)
+        tm.freeze()
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert asyncio.run(tm.arun(slice_steps=30, executor=executor)) == 101
+        assert tm.register == "OK"
+        assert tm.tape[:100] == ["b"] * 100
+
+    def test_pushdown_automaton(self):
+        pda = PushdownAutomaton(name="anbn", stack_alphabet={"A"})
+        pda.add_terminals("a", "b")
+        pda.set_register("q0")
+        pda.add_transition("q0", "a", "Z", "q0", ["A", "Z"])
+        pda.add_transition("q0", "a", "A", "q0", ["A", "A"])
+        pda.add_transition("q0", "b", "A", "q1", [])
+        pda.add_transition("q1", "b", "A", "q1", [])
+        pda.set_input(["a"] * 10 + ["b"] * 10)
+        assert asyncio.run(pda.arun(slice_steps=3)) == 20
+        assert pda.stack == ["Z"]
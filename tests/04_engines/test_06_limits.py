@@ -0,0 +1,159 @@
+"""
+Tests for the resource governor (fsm_tools.limits).
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from fsm_tools import LimitExceeded, Limits, PushdownAutomaton, TuringMachine
+from fsm_tools import limits as limits_module
+from fsm_tools.exception import AutomatonError
+from fsm_tools.tapes import PersistentTape, ZipperTape
+
+
+def stacking_pda():
+    """Push one symbol per 'a'."""
+    pda = PushdownAutomaton(name="stack", stack_alphabet={"A"})
+    pda.add_terminals("a")
+    pda.set_register("q0")
+    pda.add_transition("q0", "a", "Z", "q0", ["A", "Z"])
+    pda.add_transition("q0", "a", "A", "q0", ["A", "A"])
+    return pda
+
+
+class TestLimits:
+
+    def test_invalid_check_every(self):
+        with pytest.raises(ValueError):
+            Limits(check_every=0)
+
+    def test_deadline_from(self):
+        assert Limits().deadline_from(10.0) is None
+        assert Limits(timeout=5).deadline_from(10.0) == 15.0
+        assert Limits(timeout=5, deadline=12.0).deadline_from(10.0) == 12.0
+
+    def test_step_budget(self, make_replace_tm):
+        limits = Limits(max_steps=10)
+        tm = make_replace_tm(1)
+        assert limits.step_budget(tm, 0, 4) == 4
+        assert limits.step_budget(tm, 8, 4) == 2
+        with pytest.raises(LimitExceeded) as error:
+            limits.step_budget(tm, 10, 4)
+        assert error.value.limit == "steps"
+        assert error.value.steps == 10
+        assert error.value.value == 1620
+        assert "Run stopped after 10 steps: steps limit exceeded." in str(error.value)
+
+    def test_automaton_error(self):
+        assert issubclass(LimitExceeded, AutomatonError)
+        assert LimitExceeded is limits_module.LimitExceeded
+
+
+class TestRunLimits:
+
+    def test_within_limits(self, make_replace_tm):
+        tm = make_replace_tm(100)
+        assert tm.run(limits=Limits(max_steps=101, max_cells=200, check_every=7)) == 101
+        assert tm.register == "OK"
+
+    def test_max_steps_exact(self, make_forever_tm):
+        tm = make_forever_tm()
+        with pytest.raises(LimitExceeded) as error:
+            tm.run(limits=Limits(max_steps=50, check_every=16))
+        assert error.value.limit == "steps"
+        assert error.value.steps == 50
+        assert tm.head == [50]
+
+    def test_run_max_steps_still_returns(self, make_forever_tm):
+        tm = make_forever_tm()
+        assert tm.run(max_steps=30, limits=Limits(max_steps=50)) == 30
+
+    def test_max_cells_amortized(self, make_forever_tm):
+        tm = make_forever_tm()
+        with pytest.raises(LimitExceeded) as error:
+            tm.run(limits=Limits(max_cells=100, check_every=32))
+        assert error.value.limit == "cells"
+        assert 100 < len(tm.tape) <= 100 + 32
+
+    @pytest.mark.parametrize("backend", [ZipperTape, PersistentTape])
+    def test_max_cells_with_backend(self, backend, make_forever_tm):
+        tm = make_forever_tm(tape_backend=backend)
+        with pytest.raises(LimitExceeded) as error:
+            tm.run(limits=Limits(max_cells=64, check_every=8))
+        assert error.value.limit == "cells"
+
+    def test_cancel_token(self, make_forever_tm):
+        cancel = threading.Event()
+        cancel.set()
+        tm = make_forever_tm()
+        with pytest.raises(LimitExceeded) as error:
+            tm.run(limits=Limits(cancel=cancel, check_every=10))
+        assert error.value.limit == "cancel"
+        assert error.value.steps == 10
+
+    def test_deadline(self, make_forever_tm):
+        tm = make_forever_tm()
+        with pytest.raises(LimitExceeded) as error:
+            tm.run(limits=Limits(deadline=time.monotonic(), check_every=10))
+        assert error.value.limit == "deadline"
+
+    def test_frozen_machine(self, make_forever_tm):
+        tm = make_forever_tm()
+        tm.freeze()
+        with pytest.raises(LimitExceeded):
+            tm.run(limits=Limits(max_steps=1000))
+        assert tm.head == [1000]
+
+    def test_run_status(self, make_replace_tm, make_forever_tm):
+        tm = make_replace_tm(10)
+        assert tm.run_status(limits=Limits(max_steps=11)).name == "ACCEPTED"
+        with pytest.raises(LimitExceeded):
+            make_forever_tm().run_status(limits=Limits(max_steps=5))
+
+    def test_arun(self, make_replace_tm, make_forever_tm):
+        with pytest.raises(LimitExceeded) as error:
+            asyncio.run(make_forever_tm().arun(limits=Limits(max_steps=25, check_every=10)))
+        assert error.value.steps == 25
+        assert asyncio.run(make_replace_tm(30).arun(limits=Limits(max_steps=31))) == 31
+
+
+class TestPushdownLimits:
+
+    def test_max_stack(self):
+        pda = stacking_pda()
+        with pytest.raises(LimitExceeded) as error:
+            pda.validate(["a"] * 100, limits=Limits(max_stack=20, check_every=4))
+        assert error.value.limit == "stack"
+        assert error.value.value == 3620
+        assert 20 < len(pda.stack) <= 24
+
+    def test_within_limits(self):
+        pda = stacking_pda()
+        assert not pda.validate(["a"] * 10, limits=Limits(max_stack=20))
+
+
+class TestBatchLimits:
+
+    def test_max_steps(self, make_forever_tm):
+        pytest.importorskip("numpy")
+        from fsm_tools.batch import BatchTuringMachine
+
+        batch = BatchTuringMachine(make_forever_tm())
+        batch.load([[], []])
+        with pytest.raises(LimitExceeded) as error:
+            batch.run(limits=Limits(max_steps=20))
+        assert error.value.steps == 20
+        assert batch.steps.tolist() == [20, 20]
+
+    def test_max_cells(self, make_forever_tm):
+        pytest.importorskip("numpy")
+        from fsm_tools.batch import BatchTuringMachine
+
+        batch = BatchTuringMachine(make_forever_tm())
+        batch.load([[]])
+        with pytest.raises(LimitExceeded) as error:
+            batch.run(limits=Limits(max_cells=50, check_every=8))
+        assert error.value.limit == "cells"
@@ -0,0 +1,123 @@
+"""
+Tests for checkpointing and resuming runs (fsm_tools.checkpoint).
+"""
+
+import os
+
+import pytest
+
+from fsm_tools import LimitExceeded, Limits, LinearBoundedAutomaton, TuringMachine
+from fsm_tools.checkpoint import Checkpointer, load_checkpoint, save_checkpoint
+from fsm_tools.extended import MultiTapeTuringMachine
+from fsm_tools.tapes import ZipperTape
+
+
+def replace_lba():
+    """The machine of make_replace_tm on 20 'a', on a bounded tape."""
+    lba = LinearBoundedAutomaton("LBA", tape_size=[30], register="q0", movement={"R": [1]})
+    lba.add_terminals("a", "b")
+    lba.add_transition("q0", "a", "q0", "b", "R")
+    lba.add_transition("q0", "_", "OK", "_", "R")
+    lba.set_tape(["a"] * 20)
+    return lba
+
+
+class TestCheckpointFile:
+
+    def test_round_trip(self, tmp_path, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        tm = make_replace_tm(300)
+        tm.run(max_steps=120)
+        save_checkpoint(tm, path, steps=120)
+
+        fresh = make_replace_tm(0)
+        header = load_checkpoint(fresh, path)
+        assert header["steps"] == 120
+        assert fresh.register == tm.register
+        assert fresh.head == tm.head
+        assert fresh.tape == tm.tape
+
+    def test_compressed(self, tmp_path, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        tm = make_replace_tm(100_000)
+        save_checkpoint(tm, path)
+        assert os.path.getsize(path) < 2_000
+
+    def test_backend_with_negative_positions(self, tmp_path, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        tm = make_replace_tm(3, tape_backend=ZipperTape)
+        tm.tape.write(-2, "b")
+        save_checkpoint(tm, path)
+        fresh = make_replace_tm(0, tape_backend=ZipperTape)
+        load_checkpoint(fresh, path)
+        assert fresh.tape.start == -2
+        assert fresh.tape.to_list() == tm.tape.to_list()
+
+    def test_no_temporary_file_left(self, tmp_path, make_replace_tm):
+        save_checkpoint(make_replace_tm(5), str(tmp_path / "run.ckpt"))
+        assert os.listdir(tmp_path) == ["run.ckpt"]
+
+    def test_not_a_checkpoint(self, tmp_path, make_replace_tm):
+        path = tmp_path / "run.ckpt"
+        path.write_bytes(b"garbage")
+        with pytest.raises(ValueError):
+            load_checkpoint(make_replace_tm(0), str(path))
+
+    def test_other_machine(self, tmp_path, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        save_checkpoint(make_replace_tm(5), path)
+        other = TuringMachine("Other", register="q0")
+        with pytest.raises(ValueError):
+            load_checkpoint(other, path)
+
+    def test_multitape_not_supported(self, tmp_path):
+        mtm = MultiTapeTuringMachine("M", n_tapes=2, register="q0")
+        with pytest.raises(NotImplementedError):
+            save_checkpoint(mtm, str(tmp_path / "run.ckpt"))
+
+    def test_invalid_cadence(self, tmp_path):
+        with pytest.raises(ValueError):
+            Checkpointer(str(tmp_path / "run.ckpt"), every_steps=0)
+
+
+class TestResume:
+
+    def test_every_steps(self, tmp_path, monkeypatch, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        saved = []
+        original = Checkpointer.save
+
+        def spy(self, machine, steps):
+            saved.append(steps)
+            original(self, machine, steps)
+
+        monkeypatch.setattr(Checkpointer, "save", spy)
+        tm = make_replace_tm(100)
+        assert tm.run(checkpoint=Checkpointer(path, every_steps=25)) == 101
+        assert saved == [25, 50, 75, 100, 101]
+
+    def test_resume_after_interruption(self, tmp_path, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        tm = make_replace_tm(500)
+        with pytest.raises(LimitExceeded):
+            tm.run(limits=Limits(max_steps=230), checkpoint=Checkpointer(path, every_steps=100))
+
+        fresh = make_replace_tm(0)
+        assert fresh.resume(path) == 501
+        assert fresh.register == "OK"
+        assert fresh.tape[:500] == ["b"] * 500
+        assert load_checkpoint(make_replace_tm(0), path)["steps"] == 501
+
+    def test_resume_max_steps_counts_whole_run(self, tmp_path, make_replace_tm):
+        path = str(tmp_path / "run.ckpt")
+        make_replace_tm(500).run(max_steps=100, checkpoint=Checkpointer(path))
+        fresh = make_replace_tm(0)
+        assert fresh.resume(path, max_steps=150) == 150
+        assert fresh.head == [150]
+
+    def test_resume_lba(self, tmp_path):
+        path = str(tmp_path / "run.ckpt")
+        replace_lba().run(max_steps=5, checkpoint=Checkpointer(path))
+        fresh = replace_lba()
+        assert fresh.resume(path) == 21
+        assert fresh.register == "OK"
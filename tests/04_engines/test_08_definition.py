@@ -0,0 +1,124 @@
+"""
+Tests for immutable definitions and per-run configurations (fsm_tools.definition).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fsm_tools import LinearBoundedAutomaton, PushdownAutomaton, StepStatus, TuringMachine
+from fsm_tools.definition import Configuration, MachineDefinition, PushdownDefinition
+from fsm_tools.extended import ExtendedTuringMachine, MultiTapeTuringMachine
+
+
+class TestMachineDefinition:
+
+    def test_snapshot(self, even_a_tm):
+        definition = even_a_tm.definition()
+        assert isinstance(definition, MachineDefinition)
+        assert definition.start == "even"
+        assert definition.transitions[("even", "a")] == ("odd", "a", 1)
+        assert definition.bound is None
+
+    def test_immutable(self, even_a_tm):
+        definition = even_a_tm.definition()
+        with pytest.raises(AttributeError):
+            definition.start = "odd"
+        with pytest.raises(TypeError):
+            definition.transitions[("even", "a")] = None
+
+    def test_machine_changes_do_not_leak(self, even_a_tm):
+        tm = even_a_tm
+        definition = tm.definition()
+        tm.add_terminals("b")
+        tm.add_transition("even", "b", "OK", "b", "R")
+        assert ("even", "b") not in definition.transitions
+
+    def test_run_does_not_touch_machine(self, even_a_tm):
+        tm = even_a_tm
+        definition = tm.definition()
+        configuration = definition.configuration(["a"] * 4)
+        assert definition.run(configuration) is StepStatus.ACCEPTED
+        assert configuration.steps == 5
+        assert configuration.head == 5
+        assert tm.register == "even"
+        assert tm.head == [0]
+
+    @pytest.mark.parametrize("length", range(6))
+    def test_same_verdict_as_machine(self, length, even_a_tm):
+        tm = even_a_tm
+        definition = tm.definition()
+        tm.set_tape(["a"] * length)
+        assert tm.run_status() is definition.run(definition.configuration(["a"] * length))
+
+    def test_max_steps_and_step(self, even_a_tm):
+        definition = even_a_tm.definition()
+        configuration = definition.configuration(["a"] * 4)
+        assert definition.run(configuration, max_steps=2) is StepStatus.RUNNING
+        assert configuration.register == "even"
+        assert definition.step(configuration) is StepStatus.RUNNING
+        assert configuration.steps == 3
+
+    def test_stuck(self):
+        tm = TuringMachine("TM", register="q0")
+        tm.add_terminals("a")
+        definition = tm.definition()
+        assert definition.run(definition.configuration(["a"])) is StepStatus.STUCK
+
+    def test_configuration_has_slots(self):
+        configuration = Configuration("q0", [])
+        with pytest.raises(AttributeError):
+            configuration.extra = 1
+
+    def test_lba_bound(self):
+        lba = LinearBoundedAutomaton("LBA", tape_size=[3], movement={"R": [1]}, register="q0")
+        lba.add_terminals("a")
+        lba.add_transition("q0", "a", "q0", "a", "R")
+        definition = lba.definition()
+        assert definition.bound == 3
+        with pytest.raises(ValueError):
+            definition.configuration(["a"] * 4)
+        assert definition.run(definition.configuration(["a"] * 3)) is StepStatus.OUT_OF_TAPE
+
+    def test_concurrent_runs(self, even_a_tm):
+        definition = even_a_tm.definition()
+        words = [["a"] * length for length in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            verdicts = list(pool.map(definition.accepts, words))
+        assert verdicts == [length % 2 == 0 for length in range(200)]
+
+    @pytest.mark.parametrize("machine", [ExtendedTuringMachine, MultiTapeTuringMachine])
+    def test_other_tapes_not_supported(self, machine):
+        with pytest.raises(NotImplementedError):
+            machine("M", register="q0").definition()
+
+
+class TestPushdownDefinition:
+
+    def test_snapshot(self, anbn_pda):
+        definition = anbn_pda.definition()
+        assert isinstance(definition, PushdownDefinition)
+        assert definition.transitions[("q0", "a", "Z")] == ("q0", ("Z", "A"))
+
+    @pytest.mark.parametrize(
+        "word", [["a", "b"], ["a", "a", "b", "b"], ["a", "b", "b"], ["b"], [], ["a"]]
+    )
+    def test_same_verdict_as_validate(self, word, anbn_pda):
+        pda = anbn_pda
+        assert pda.definition().validate(word) == pda.validate(word)
+
+    def test_unknown_symbol(self, fsm_module, anbn_pda):
+        with pytest.raises(fsm_module.ReadError):
+            anbn_pda.definition().configuration(["c"])
+
+    def test_no_start_state(self, fsm_module):
+        pda = PushdownAutomaton(name="empty")
+        with pytest.raises(fsm_module.ValidationError):
+            pda.definition()
+
+    def test_concurrent_runs(self, anbn_pda):
+        definition = anbn_pda.definition()
+        words = [["a"] * n + ["b"] * m for n in range(1, 12) for m in range(1, 12)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            verdicts = list(pool.map(definition.validate, words))
+        assert verdicts == [word.count("a") == word.count("b") for word in words]
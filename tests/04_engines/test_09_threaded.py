@@ -0,0 +1,51 @@
+"""
+Tests for thread-pool batch runs (fsm_tools.threaded).
+"""
+
+import pytest
+
+from fsm_tools import PushdownAutomaton, StepStatus, TuringMachine
+from fsm_tools.threaded import accept_batch, benchmark, free_threaded, run_batch
+
+
+class TestThreadedBatch:
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_run_batch(self, workers, even_a_tm):
+        words = [["a"] * length for length in range(100)]
+        statuses = run_batch(even_a_tm, words, max_workers=workers, chunk_size=7)
+        assert statuses == [
+            StepStatus.ACCEPTED if length % 2 == 0 else StepStatus.REJECTED for length in range(100)
+        ]
+
+    def test_run_batch_max_steps(self, even_a_tm):
+        assert run_batch(even_a_tm, [["a"] * 10], max_steps=3) == [StepStatus.RUNNING]
+
+    def test_accept_batch_tm(self, even_a_tm):
+        tm = even_a_tm
+        words = [["a"] * length for length in range(20)]
+        assert accept_batch(tm, words, max_workers=4) == [length % 2 == 0 for length in range(20)]
+        assert tm.register == "even"
+
+    def test_accept_batch_pda(self, anbn_pda):
+        pda = anbn_pda
+        words = [["a"] * n + ["b"] * m for n in range(6) for m in range(6)]
+        assert accept_batch(pda, words, max_workers=4, chunk_size=5) == [
+            pda.validate(word) for word in words
+        ]
+
+    def test_accepts_definition(self, even_a_tm):
+        definition = even_a_tm.definition()
+        assert accept_batch(definition, [["a", "a"]]) == [True]
+
+    def test_invalid_chunk_size(self, even_a_tm):
+        with pytest.raises(ValueError):
+            run_batch(even_a_tm, [[]], chunk_size=0)
+
+    def test_benchmark(self, even_a_tm):
+        throughput = benchmark(even_a_tm, [["a"] * 10] * 20, thread_counts=(1, 2))
+        assert set(throughput) == {1, 2}
+        assert all(runs > 0 for runs in throughput.values())
+
+    def test_free_threaded(self):
+        assert isinstance(free_threaded(), bool)
@@ -0,0 +1,176 @@
+"""
+Tests for wildcard and default transitions (ANY, SAME) across the execution paths.
+"""
+
+import pickle
+
+import pytest
+
+from fsm_tools import (
+    ANY,
+    SAME,
+    LinearBoundedAutomaton,
+    PushdownAutomaton,
+    StepStatus,
+    TuringMachine,
+)
+from fsm_tools.compiled import CompiledTable
+from fsm_tools.exception import AddError, ReadError
+
+
+def flip_tm(tm_class=TuringMachine, default_first=True, **kwargs):
+    """Turn every 'a' into 'b', keep the other symbols with a default rule, accept on blank."""
+    tm = tm_class("Flip", movement={"R": [1]}, register="q0", **kwargs)
+    tm.add_terminals("a", "b", "c")
+    rules = [("q0", "a", "q0", "b", "R"), ("q0", "_", "OK", "_", "R")]
+    default = ("q0", ANY, "q0", SAME, "R")
+    for rule in [default] + rules if default_first else rules + [default]:
+        tm.add_transition(*rule)
+    return tm
+
+
+def stack_copy_pda():
+    """Push every input symbol over any stack top, then pop one of them per 'x'."""
+    pda = PushdownAutomaton(name="Copy", stack_alphabet={"A", "B"})
+    pda.add_terminals("a", "b", "x")
+    pda.set_register("q0")
+    pda.add_transition("q0", "a", ANY, "q0", ["A", SAME])
+    pda.add_transition("q0", "b", ANY, "q0", ["B", SAME])
+    pda.add_transition("q0", "x", "A", "q0", [])
+    pda.add_transition("q0", "x", "B", "q0", [])
+    return pda
+
+
+WORD = ["a", "c", "b", "a", "c"]
+FLIPPED = ["b", "c", "b", "b", "c"]
+
+
+class TestMarkers:
+
+    def test_repr(self):
+        assert repr(ANY) == "ANY"
+        assert repr(SAME) == "SAME"
+
+    def test_pickle_keeps_singletons(self):
+        assert pickle.loads(pickle.dumps(ANY)) is ANY
+        assert pickle.loads(pickle.dumps(SAME)) is SAME
+
+    def test_same_must_be_written(self):
+        tm = flip_tm()
+        with pytest.raises(ReadError):
+            tm.add_transition("q0", SAME, "q0", "a", "R")
+
+
+class TestTuringMachineDefaults:
+
+    @pytest.mark.parametrize("default_first", [True, False])
+    def test_exact_rule_has_precedence(self, default_first):
+        tm = flip_tm(default_first=default_first)
+        tm.set_tape(list(WORD))
+        assert tm.run_status() is StepStatus.ACCEPTED
+        assert tm.tape[: len(WORD)] == FLIPPED
+
+    @pytest.mark.parametrize("default_first", [True, False])
+    def test_frozen(self, default_first):
+        tm = flip_tm(default_first=default_first)
+        tm.freeze()
+        tm.set_tape(list(WORD))
+        assert tm.run_status() is StepStatus.ACCEPTED
+        assert tm.tape[: len(WORD)] == FLIPPED
+
+    def test_step(self):
+        tm = flip_tm()
+        tm.set_tape(["c"])
+        tm.step()
+        assert tm.tape[0] == "c"
+        assert tm.head == [1]
+
+    def test_hot_loop_trace(self):
+        tm = flip_tm()
+        tm.set_tape(["a", "c"] * 200)
+        tm.run(hot_threshold=2)
+        assert tm.register == "OK"
+        assert tm.tape[:400] == ["b", "c"] * 200
+
+    def test_iter_steps(self):
+        tm = flip_tm(default_first=False)
+        tm.set_tape(list(WORD))
+        deltas = list(tm.iter_steps())
+        assert [delta.written for delta in deltas][: len(WORD)] == FLIPPED
+        assert deltas[1].rule == 2
+
+    def test_lba(self):
+        lba = flip_tm(LinearBoundedAutomaton, tape_size=[10])
+        lba.set_tape(list(WORD))
+        assert lba.run_status() is StepStatus.ACCEPTED
+        assert lba.tape[: len(WORD)] == FLIPPED
+
+    def test_definition(self):
+        definition = flip_tm().definition()
+        assert definition.transitions[("q0", ANY)] == ("q0", SAME, 1)
+        configuration = definition.configuration(WORD)
+        assert definition.run(configuration) is StepStatus.ACCEPTED
+        assert configuration.tape[: len(WORD)] == FLIPPED
+
+    def test_compiled_table(self):
+        table = CompiledTable.from_machine(flip_tm())
+        q0, codes = table.state_codes["q0"], table.symbol_codes
+        assert ANY not in codes and SAME not in codes
+        assert table.lookup(q0, codes["c"]) == (q0, codes["c"], 1)
+        assert table.lookup(q0, codes["a"]) == (q0, codes["b"], 1)
+        assert table.states[table.lookup(q0, codes["_"])[0]] == "OK"
+
+    def test_nondeterministic_search(self):
+        tm = flip_tm()
+        tm.set_tape(list(WORD))
+        assert tm.run_nondeterministic(max_steps=20)
+
+
+class TestPushdownStackWildcard:
+
+    def test_add_transition(self):
+        pda = stack_copy_pda()
+        with pytest.raises(AddError):
+            pda.add_transition("q0", "a", "C", "q0", [])
+
+    @pytest.mark.parametrize(
+        "word,accepted",
+        [(["a", "x"], True), (["a", "b", "x", "x"], True), (["a", "x", "x"], False)],
+    )
+    def test_validate(self, word, accepted):
+        assert stack_copy_pda().validate(word) is accepted
+
+    def test_same_pushes_popped_top(self):
+        pda = stack_copy_pda()
+        pda.reset_stack()
+        pda.set_input(["a", "b"])
+        pda.step()
+        pda.step()
+        assert pda.stack == ["Z", "A", "B"]
+
+    def test_frozen(self):
+        pda = stack_copy_pda()
+        pda.freeze()
+        assert pda.validate(["b", "a", "x", "x"])
+        assert not pda.validate(["b", "x", "x"])
+
+    def test_exact_top_has_precedence(self):
+        pda = stack_copy_pda()
+        pda.add_transition("q0", "x", ANY, "q0", ["A"])
+        assert pda.validate(["a", "x"])
+        assert not pda.validate(["x"])
+
+    def test_iter_steps(self):
+        pda = stack_copy_pda()
+        pda.reset_stack()
+        pda.set_input(["a", "x"])
+        deltas = list(pda.iter_steps())
+        assert deltas[0].pushed == ("Z", "A")
+        assert deltas[1].popped == "A"
+
+    def test_definition(self):
+        definition = stack_copy_pda().definition()
+        configuration = definition.configuration(["a", "b"])
+        definition.run(configuration)
+        assert configuration.stack == ["Z", "A", "B"]
+        assert definition.validate(["a", "b", "x", "x"])
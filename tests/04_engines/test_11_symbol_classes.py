@@ -0,0 +1,187 @@
+"""
+Tests for symbol-class transitions (fsm_tools.symbols).
+"""
+
+import pytest
+
+from fsm_tools import ANY, SAME, StepStatus, SymbolClass, TuringMachine
+from fsm_tools.compiled import CompiledTable
+from fsm_tools.exception import ReadError
+from fsm_tools.symbols import ClassTable, index_classes
+from fsm_tools.tapes import ZipperTape
+
+LETTERS = SymbolClass(("a", "z"), ("A", "Z"), name="letter")
+DIGITS = SymbolClass.code_points((0x30, 0x39), name="digit")
+
+
+def tokenizer_tm(**kwargs):
+    """Replace letters by 'w' and digits by 'd', keep 'x' and every other character."""
+    tm = TuringMachine("Tokens", movement={"R": [1]}, register="q0", **kwargs)
+    tm.add_terminals("w", "d", "x")
+    tm.add_transition("q0", "_", "OK", "_", "R")
+    tm.add_transition("q0", "x", "q0", SAME, "R")
+    tm.add_transition("q0", LETTERS, "q0", "w", "R")
+    tm.add_transition("q0", DIGITS, "q0", "d", "R")
+    tm.add_transition("q0", ANY, "q0", SAME, "R")
+    return tm
+
+
+def copy_tm(**kwargs):
+    """Keep the lowercase letters, through a class rule writing SAME."""
+    tm = TuringMachine("Copy", movement={"R": [1]}, register="q0", **kwargs)
+    tm.add_transition("q0", SymbolClass(("a", "z")), "q0", SAME, "R")
+    tm.add_transition("q0", "_", "OK", "_", "R")
+    return tm
+
+
+TEXT = list("ab1x-Z9é")
+TOKENS = list("wwdx-wdé")
+
+
+class TestSymbolClass:
+
+    @pytest.mark.parametrize("symbol,expected", [("a", True), ("m", True), ("Z", True)])
+    def test_in_ranges(self, symbol, expected):
+        assert (symbol in LETTERS) is expected
+
+    @pytest.mark.parametrize("symbol", ["@", "[", "é", 3, None])
+    def test_not_in_ranges(self, symbol):
+        assert symbol not in LETTERS
+
+    def test_ranges_are_merged(self):
+        symbol_class = SymbolClass(("d", "k"), ("a", "e"), "z")
+        assert symbol_class.ranges == (("a", "k"), ("z", "z"))
+
+    def test_code_points(self):
+        assert "5" in DIGITS and "a" not in DIGITS
+
+    def test_predicate(self):
+        upper = SymbolClass(predicate=str.isupper)
+        assert "É" in upper and "é" not in upper
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            SymbolClass()
+        with pytest.raises(ValueError):
+            SymbolClass(("z", "a"))
+
+
+class TestClassTable:
+
+    def test_first_class_wins(self):
+        table = ClassTable([(SymbolClass(("c", "f")), 1), (SymbolClass(("a", "z")), 2)])
+        assert [table.get(symbol) for symbol in "abcdfgz{"] == [2, 2, 1, 1, 1, 2, 2, None]
+
+    def test_size_scales_with_classes(self):
+        table = ClassTable([(SymbolClass.code_points((0, 0x10FFFF)), 1)])
+        assert len(table.points) == 2
+        assert table.get("\U0001f600") == 1
+
+    def test_predicate_priority(self):
+        vowels = SymbolClass(predicate=lambda symbol: symbol in "aeiou")
+        table = ClassTable([(vowels, "vowel"), (LETTERS, "letter")])
+        assert table.get("e") == "vowel"
+        assert table.get("k") == "letter"
+        table = ClassTable([(LETTERS, "letter"), (vowels, "vowel")])
+        assert table.get("e") == "letter"
+
+    def test_index_classes(self):
+        index = index_classes({("q", "a"): 1, ("q", LETTERS): 2, ("p", DIGITS): 3})
+        assert index[("q", "a")] == 1
+        assert index[("q", SymbolClass)].get("b") == 2
+        assert index[("p", SymbolClass)].get("7") == 3
+        assert ("q", LETTERS) not in index
+
+
+class TestClassTransitions:
+
+    def test_alphabet_not_enumerated(self):
+        tm = tokenizer_tm()
+        assert "b" not in tm.get_terminals()
+        tm.set_tape(list("ab1"))
+        with pytest.raises(ReadError):
+            tm.set_tape(list("a?"))
+
+    def test_step_and_run(self):
+        tm = tokenizer_tm()
+        tm.set_tape(list("ab1x"))
+        tm.step()
+        assert tm.tape[0] == "w"
+        assert tm.run_status() is StepStatus.ACCEPTED
+        assert tm.tape[:4] == list("wwdx")
+
+    def test_default_for_other_symbols(self):
+        tm = tokenizer_tm()
+        tm.add_terminals("-", "é")
+        tm.set_tape(list(TEXT))
+        assert tm.run_status() is StepStatus.ACCEPTED
+        assert tm.tape[: len(TEXT)] == TOKENS
+
+    def test_frozen(self):
+        tm = tokenizer_tm()
+        tm.add_terminals("-", "é")
+        tm.freeze()
+        tm.set_tape(list(TEXT))
+        assert tm.run_status() is StepStatus.ACCEPTED
+        assert tm.tape[: len(TEXT)] == TOKENS
+
+    @pytest.mark.parametrize("backend", [None, ZipperTape])
+    def test_alphabet_unchanged_by_same(self, backend):
+        tm = copy_tm(tape_backend=backend)
+        alphabet = set(tm.grammar.alphabet)
+        tm.set_tape(list("hello"))
+        tm.step()
+        assert tm.run_status() is StepStatus.ACCEPTED
+        tm.set_tape(list("world"))
+        tm.run()
+        assert tm.grammar.alphabet == alphabet
+
+    @pytest.mark.parametrize("backend", [None, ZipperTape])
+    def test_frozen_same(self, backend):
+        tm = copy_tm(tape_backend=backend)
+        tm.freeze()
+        tm.set_tape(list("hello"))
+        assert tm.run_status() is StepStatus.ACCEPTED
+        tm.set_tape(list("world"))
+        tm.run()
+        assert tm.register == "OK"
+        assert tm.grammar.alphabet == {"_"}
+
+    def test_frozen_with_backend(self):
+        tm = tokenizer_tm(tape_backend=ZipperTape)
+        tm.add_terminals("-", "é")
+        tm.freeze()
+        tm.set_tape(list(TEXT))
+        assert tm.run_status() is StepStatus.ACCEPTED
+        assert [tm.tape.read(position) for position in range(len(TEXT))] == TOKENS
+
+    def test_hot_loop_trace(self):
+        tm = tokenizer_tm()
+        tm.set_tape(list("a1") * 200)
+        tm.run(hot_threshold=2)
+        assert tm.register == "OK"
+        assert tm.tape[:400] == list("wd") * 200
+
+    def test_iter_steps(self):
+        tm = tokenizer_tm()
+        tm.set_tape(list("b7x"))
+        assert [delta.rule for delta in tm.iter_steps()] == [2, 3, 1, 0]
+
+    def test_definition(self):
+        definition = tokenizer_tm().definition()
+        configuration = definition.configuration(list("q5x"))
+        assert definition.run(configuration) is StepStatus.ACCEPTED
+        assert configuration.tape[:3] == list("wdx")
+
+    def test_compiled_table(self):
+        tm = tokenizer_tm()
+        tm.add_terminals("b")
+        table = CompiledTable.from_machine(tm)
+        q0, codes = table.state_codes["q0"], table.symbol_codes
+        assert table.lookup(q0, codes["b"]) == (q0, codes["w"], 1)
+        assert table.lookup(q0, codes["x"]) == (q0, codes["x"], 1)
+
+    def test_nondeterministic_search(self):
+        tm = tokenizer_tm()
+        tm.set_tape(list("ab12"))
+        assert tm.run_nondeterministic(max_steps=10)
@@ -0,0 +1,212 @@
+"""
+Tests for the non-halting deciders (fsm_tools.deciders).
+"""
+
+import pytest
+
+from fsm_tools import (
+    ANY,
+    SAME,
+    AutomatonError,
+    Deciders,
+    LinearBoundedAutomaton,
+    NonHalting,
+    StepStatus,
+    SymbolClass,
+    TuringMachine,
+)
+from fsm_tools.deciders import (
+    BACKWARD,
+    BOUNCER,
+    TRANSLATED_CYCLER,
+    backward_depth,
+    decide_backward,
+)
+from fsm_tools.tapes import ZipperTape
+
+CYCLER_RULES = [
+    ("A", "_", "B", "1", "R"),
+    ("B", "_", "C", "1", "L"),
+    ("C", "1", "A", "0", "R"),
+    ("A", "1", "B", "1", "R"),
+]
+
+BOUNCER_RULES = [
+    ("A", "#", "A", "#", "R"),
+    ("A", "1", "A", "1", "R"),
+    ("A", "_", "B", "1", "L"),
+    ("B", "1", "B", "1", "L"),
+    ("B", "#", "A", "#", "R"),
+]
+
+# Halting runs are at most 4 steps long, from any tape: the machine never halts once past
+# them, but its runs show neither a translated cycle nor a bouncer.
+UNREACHABLE_HALT_RULES = [
+    ("A", "_", "B", "1", "R"),
+    ("A", "1", "A", "_", "L"),
+    ("B", "_", "C", "_", "L"),
+    ("B", "1", "OK", "1", "L"),
+    ("C", "_", "A", "1", "R"),
+    ("C", "1", "B", "1", "R"),
+]
+
+
+def mirrored(rules):
+    return [rule[:4] + ("L" if rule[4] == "R" else "R",) for rule in rules]
+
+
+def build_tm(rules, tm_class=TuringMachine, terminals=("0", "1", "#"), **kwargs):
+    tm = tm_class("Loop", movement={"R": [1], "L": [-1]}, register="A", **kwargs)
+    tm.add_terminals(*terminals)
+    for rule in rules:
+        tm.add_transition(*rule)
+    return tm
+
+
+class TestDecidersOptions:
+
+    @pytest.mark.parametrize("kwargs", [{"history": 1}, {"window": 0}])
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            Deciders(**kwargs)
+
+    def test_halting_machine(self):
+        tm = build_tm([("A", "_", "B", "1", "R"), ("B", "_", "OK", "1", "R")])
+        deciders = Deciders()
+        assert tm.run_status(100, deciders=deciders) is StepStatus.ACCEPTED
+        assert deciders.certificate is None
+
+
+class TestTranslatedCycler:
+
+    def test_right(self):
+        tm = build_tm(CYCLER_RULES)
+        deciders = Deciders()
+        assert tm.run_status(1000, deciders=deciders) is StepStatus.NON_HALTING
+        certificate = deciders.certificate
+        assert certificate.kind == TRANSLATED_CYCLER
+        assert certificate.side == 1 and certificate.shift > 0
+        assert certificate.end < 1000 and certificate.period > 0
+
+    def test_left_two_way(self):
+        tm = build_tm(mirrored(CYCLER_RULES), tape_backend=ZipperTape)
+        deciders = Deciders()
+        assert tm.run_status(1000, deciders=deciders) is StepStatus.NON_HALTING
+        assert deciders.certificate.side == -1
+
+    def test_left_list_tape(self):
+        tm = build_tm(mirrored(CYCLER_RULES))
+        deciders = Deciders()
+        assert tm.run_status(1000, deciders=deciders) is StepStatus.OUT_OF_TAPE
+        assert deciders.certificate is None
+
+    def test_disabled(self):
+        tm = build_tm(CYCLER_RULES)
+        deciders = Deciders(translated_cyclers=False, bouncers=False)
+        assert tm.run_status(200, deciders=deciders) is StepStatus.RUNNING
+
+    def test_run_raises(self):
+        tm = build_tm(CYCLER_RULES)
+        with pytest.raises(NonHalting) as error:
+            tm.run(max_steps=1000, deciders=Deciders())
+        assert error.value.certificate.kind == TRANSLATED_CYCLER
+        assert isinstance(error.value, AutomatonError)
+        assert error.value.value == 1905
+        assert f"{TRANSLATED_CYCLER} detected at step" in str(error.value)
+
+    def test_wildcard_rules(self):
+        tm = build_tm(
+            [
+                ("A", ANY, "A", SAME, "R"),
+                ("A", SymbolClass("0", "1"), "A", "1", "R"),
+            ]
+        )
+        assert tm.run_status(1000, deciders=Deciders()) is StepStatus.NON_HALTING
+
+    def test_bounded_tape(self):
+        lba = build_tm(CYCLER_RULES, LinearBoundedAutomaton, tape_size=[50])
+        deciders = Deciders()
+        assert lba.run_status(1000, deciders=deciders) is not StepStatus.NON_HALTING
+        assert deciders.certificate is None
+
+
+class TestBouncer:
+
+    def test_right(self):
+        tm = build_tm(BOUNCER_RULES)
+        tm.set_tape(["#"])
+        deciders = Deciders(translated_cyclers=False)
+        assert tm.run_status(10_000, deciders=deciders) is StepStatus.NON_HALTING
+        certificate = deciders.certificate
+        assert certificate.kind == BOUNCER and certificate.side == 1
+        prefix, repeater, suffix = certificate.tape
+        assert repeater == ("1",)
+
+    def test_left_two_way(self):
+        tm = build_tm(mirrored(BOUNCER_RULES), tape_backend=ZipperTape)
+        tm.set_tape(["#"])
+        deciders = Deciders(translated_cyclers=False)
+        assert tm.run_status(10_000, deciders=deciders) is StepStatus.NON_HALTING
+        assert deciders.certificate.side == -1
+
+    def test_not_a_translated_cycler(self):
+        tm = build_tm(BOUNCER_RULES)
+        tm.set_tape(["#"])
+        deciders = Deciders(bouncers=False)
+        assert tm.run_status(3000, deciders=deciders) is StepStatus.RUNNING
+
+
+class TestBackwardReasoning:
+
+    def test_depth(self):
+        assert backward_depth(build_tm(UNREACHABLE_HALT_RULES, terminals=["1"])) == 5
+        assert (
+            backward_depth(build_tm(UNREACHABLE_HALT_RULES, terminals=["1"]), max_depth=4) is None
+        )
+        assert (
+            backward_depth(build_tm(UNREACHABLE_HALT_RULES, terminals=["1"]), max_configurations=1)
+            is None
+        )
+
+    def test_reachable_halt(self):
+        tm = build_tm([("A", "_", "A", "1", "R"), ("A", "1", "OK", "1", "R")], terminals=["1"])
+        assert backward_depth(tm, max_depth=50) is None
+
+    def test_decide(self):
+        tm = build_tm(UNREACHABLE_HALT_RULES, terminals=["1"], tape_backend=ZipperTape)
+        certificate = decide_backward(tm)
+        assert certificate.kind == BACKWARD and certificate.end == 5
+        assert ("OK", ANY) in certificate.tape
+        assert tm.register == "A" and tm.head == [0]
+        assert tm.run_status(1000) is StepStatus.RUNNING
+
+    def test_halts_before_depth(self):
+        # Every halting run is short, and the run on a blank tape is one of them: it gets
+        # stuck on 'A' reading '1' after two steps.
+        tm = build_tm(
+            [("A", "_", "B", "1", "R"), ("B", "_", "A", "1", "L")],
+            terminals=["1"],
+            tape_backend=ZipperTape,
+        )
+        assert backward_depth(tm) is not None
+        assert decide_backward(tm) is None
+        assert tm.run_status(10) is StepStatus.STUCK
+
+    def test_one_way_tape(self):
+        assert decide_backward(build_tm(UNREACHABLE_HALT_RULES, terminals=["1"])) is None
+
+
+class TestDefinitionLookup:
+
+    def test_lookup_order(self):
+        definition = build_tm(
+            [
+                ("A", "0", "B", "1", "R"),
+                ("A", SymbolClass("0", "1"), "C", SAME, "L"),
+                ("A", ANY, "D", SAME, "R"),
+            ]
+        ).definition()
+        assert definition.lookup("A", "0") == ("B", "1", 1)
+        assert definition.lookup("A", "1") == ("C", "1", -1)
+        assert definition.lookup("A", "#") == ("D", "#", 1)
+        assert definition.lookup("B", "0") is None
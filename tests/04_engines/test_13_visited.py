@@ -0,0 +1,144 @@
+"""
+Tests for the visited-set backends of the searches (fsm_tools.visited).
+"""
+
+import os
+from functools import partial
+
+import pytest
+
+from fsm_tools.search import ConfigurationSearch, ParallelSearch
+from fsm_tools.visited import BloomFilter, DiskSet
+
+BACKENDS = [set, BloomFilter, DiskSet]
+
+
+def is_96(n):
+    return n == 96
+
+
+class TestBloomFilter:
+
+    def test_added_keys_are_found(self):
+        bloom = BloomFilter(capacity=100)
+        keys = [("q", index, ("a",) * (index % 7)) for index in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        assert all(key in bloom for key in keys)
+        assert len(bloom) <= 1000
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(capacity=1000, error_rate=1e-3)
+        for index in range(1000):
+            bloom.add(index)
+        assert 0 < bloom.false_positive_rate < 1e-3
+        false_positives = sum(index in bloom for index in range(10_000, 30_000))
+        assert false_positives < 20
+
+    def test_scales(self):
+        bloom = BloomFilter(capacity=100, error_rate=1e-4)
+        size = bloom.nbytes
+        for index in range(1000):
+            bloom.add(index)
+        assert bloom.nbytes > 4 * size
+        assert bloom.false_positive_rate < 1e-4
+        assert "slices=" in repr(bloom)
+
+    def test_duplicates_not_counted(self):
+        bloom = BloomFilter()
+        bloom.add("x")
+        bloom.add("x")
+        assert len(bloom) == 1
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"capacity": 0}, {"error_rate": 0}, {"error_rate": 1.5}, {"tightening": 1}]
+    )
+    def test_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            BloomFilter(**kwargs)
+
+
+class TestDiskSet:
+
+    def test_add_and_contains(self):
+        with DiskSet(batch=3) as disk:
+            for index in range(10):
+                disk.add(("q", index))
+            disk.add(("q", 0))
+            assert len(disk) == 10
+            assert ("q", 3) in disk
+            assert ("q", 10) not in disk
+
+    def test_temporary_file_removed(self):
+        disk = DiskSet()
+        path = disk.path
+        disk.add(1)
+        assert os.path.exists(path)
+        disk.close()
+        disk.close()
+        assert not os.path.exists(path)
+
+    def test_reopen(self, tmp_path):
+        path = str(tmp_path / "visited.sqlite")
+        with DiskSet(path) as disk:
+            disk.add("a")
+            disk.add("b")
+        with DiskSet(path) as disk:
+            assert len(disk) == 2
+            assert "a" in disk
+
+
+class TestSearchBackends:
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    @pytest.mark.parametrize("strategy", ["bfs", "iddfs"])
+    def test_accepts(self, backend, strategy, double_or_increment):
+        search = ConfigurationSearch(double_or_increment, is_96, strategy, visited=backend)
+        result = search.search(1)
+        assert result.verdict is True
+        assert result.configuration == 96
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_exhausted_space(self, backend, double_or_increment, never):
+        exact = ConfigurationSearch(double_or_increment, never).search(1)
+        result = ConfigurationSearch(double_or_increment, never, visited=backend).search(1)
+        assert result.verdict is False
+        if backend is BloomFilter:
+            assert 0 < result.false_positive_rate < 1e-6
+            assert result.configurations <= exact.configurations
+        else:
+            assert result.false_positive_rate == 0.0
+            assert result.configurations == exact.configurations
+
+    def test_configuration_budget(self, double_or_increment, never):
+        search = ConfigurationSearch(
+            double_or_increment, never, max_configurations=50, visited=DiskSet
+        )
+        assert search.search(1).verdict is None
+
+    def test_iddfs_step_budget(self, double_or_increment):
+        search = ConfigurationSearch(
+            double_or_increment, is_96, "iddfs", max_steps=4, visited=BloomFilter
+        )
+        assert search.search(1).verdict is None
+
+    def test_parallel(self, double_or_increment, never):
+        search = ParallelSearch(
+            double_or_increment, never, workers=2, visited=partial(BloomFilter, capacity=1000)
+        )
+        result = search.search(1)
+        assert result.verdict is False
+        assert result.false_positive_rate > 0
+
+    def test_parallel_step_budget(self, double_or_increment):
+        search = ParallelSearch(
+            double_or_increment, is_96, workers=2, max_steps=10, visited=DiskSet
+        )
+        assert search.search(1).verdict is True
+
+    @pytest.mark.parametrize("backend", [BloomFilter, DiskSet])
+    def test_run_nondeterministic(self, backend, guess_ab):
+        guess_ab.set_tape(["b", "a", "b"])
+        assert guess_ab.run_nondeterministic(visited=backend).verdict is True
+        guess_ab.set_tape(["b", "b", "a"])
+        assert guess_ab.run_nondeterministic(strategy="iddfs", visited=backend).verdict is False
@@ -0,0 +1,160 @@
+"""
+Tests for the standard busy-beaver notation (fsm_tools.notation).
+"""
+
+import io
+import multiprocessing
+
+import pytest
+
+from fsm_tools import StepStatus, TuringMachine
+from fsm_tools.compiled import UNDEFINED, CompiledTable
+from fsm_tools.notation import (
+    format_standard,
+    parse_standard,
+    run_file,
+    run_many,
+    run_table,
+    to_machine,
+)
+from fsm_tools.tapes import ZipperTape
+
+BB2 = "1RB1LB_1LA1RZ"
+BB3 = "1RB1RZ_1LB0RC_1LC1LA"
+BB4 = "1RB1LB_1LA0LC_1RZ1LD_1RD0RA"
+BB2_3 = "1RB2LB1RZ_2LA2RB1LB"
+LOOP = "1RB0LA_1LA1RB"
+STUCK = "1RB---_0LA1LB"
+
+
+def build_tm(text):
+    """The same machine built rule by rule."""
+    tm = TuringMachine(
+        "BB",
+        movement={"R": [1], "L": [-1]},
+        register="A",
+        blank_symbol="0",
+        tape_backend=ZipperTape,
+    )
+    groups = text.split("_")
+    tm.add_terminals(*[str(code) for code in range(1, len(groups[0]) // 3)])
+    for state, group in zip("ABCDE", groups):
+        for code in range(len(group) // 3):
+            write, direction, target = group[3 * code : 3 * code + 3]
+            if write != "-":
+                target = target if target in "ABCDE"[: len(groups)] else "OK"
+                tm.add_transition(state, str(code), target, write, direction)
+    return tm
+
+
+class TestParse:
+
+    def test_table(self):
+        table = parse_standard(BB2)
+        assert isinstance(table, CompiledTable)
+        assert table.states == ["A", "B", "OK", "nOK"]
+        assert table.symbols == ["0", "1"]
+        assert table.start == 0 and table.accept == 2
+        assert table.lookup(0, 0) == (1, 1, 1)
+        assert table.lookup(1, 1) == (2, 1, 1)
+
+    def test_undefined(self):
+        table = parse_standard(STUCK)
+        assert table.next_state[1] == UNDEFINED
+
+    def test_three_symbols(self):
+        table = parse_standard(BB2_3)
+        assert table.symbols == ["0", "1", "2"]
+        assert table.lookup(1, 2) == (1, 1, -1)
+
+    @pytest.mark.parametrize("text", [BB2, BB3, BB4, BB2_3, STUCK])
+    def test_round_trip(self, text):
+        assert format_standard(parse_standard(text)) == text
+
+    def test_format_compiled_machine(self):
+        table = CompiledTable.from_machine(build_tm(BB2))
+        assert table.symbols == ["0", "1"]
+        assert format_standard(table) == BB2
+
+    @pytest.mark.parametrize(
+        "text", ["", "1RB1LB_1LA1R", "1RB1LB_1LA", "1RB1XB_1LA1RZ", "1RB2LB_1LA1RZ", "1RB"]
+    )
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_standard(text)
+
+
+class TestRunTable:
+
+    @pytest.mark.parametrize("text, steps", [(BB2, 6), (BB3, 21), (BB4, 107), (BB2_3, 38)])
+    def test_champions(self, text, steps):
+        assert run_table(parse_standard(text), 1000) == (StepStatus.ACCEPTED, steps)
+
+    def test_matches_turing_machine(self):
+        tm = build_tm(BB4)
+        assert tm.run_status(1000) is StepStatus.ACCEPTED
+        assert run_table(CompiledTable.from_machine(build_tm(BB4)), 1000)[0] is StepStatus.ACCEPTED
+
+    def test_budget(self):
+        assert run_table(parse_standard(LOOP), 5000) == (StepStatus.RUNNING, 5000)
+        assert run_table(parse_standard(BB4), 50) == (StepStatus.RUNNING, 50)
+
+    def test_stuck(self):
+        # A0 -> 1RB, B0 -> 0LA, A1 is undefined.
+        assert run_table(parse_standard(STUCK), 100) == (StepStatus.STUCK, 2)
+
+
+class TestRunFile:
+
+    def test_run_many(self):
+        results = list(run_many([BB2, LOOP, STUCK] * 5, 500, chunk_size=2))
+        assert [machine for machine, _, _ in results] == [BB2, LOOP, STUCK] * 5
+        assert results[:3] == [
+            (BB2, StepStatus.ACCEPTED, 6),
+            (LOOP, StepStatus.RUNNING, 500),
+            (STUCK, StepStatus.STUCK, 2),
+        ]
+
+    def test_run_many_workers(self):
+        machines = [BB2, BB3, BB4, LOOP] * 10
+        expected = list(run_many(machines, 300))
+        context = multiprocessing.get_context("fork")
+        assert list(run_many(iter(machines), 300, 2, 3, context)) == expected
+
+    def test_streams(self):
+        source = io.StringIO(f"# corpus\n{BB2} 4\n\n{BB4}\n{LOOP}\n")
+        destination = io.StringIO()
+        assert run_file(source, destination, 1000) == 3
+        assert destination.getvalue().splitlines() == [
+            f"{BB2}\tACCEPTED\t6",
+            f"{BB4}\tACCEPTED\t107",
+            f"{LOOP}\tRUNNING\t1000",
+        ]
+
+    def test_paths(self, tmp_path):
+        source, destination = tmp_path / "machines.txt", tmp_path / "verdicts.tsv"
+        source.write_text("\n".join([BB3, STUCK] * 50))
+        assert run_file(str(source), str(destination), 100, workers=2, chunk_size=7) == 100
+        lines = destination.read_text().splitlines()
+        assert lines[:2] == [f"{BB3}\tACCEPTED\t21", f"{STUCK}\tSTUCK\t2"]
+        assert len(lines) == 100
+
+    def test_invalid_line(self):
+        with pytest.raises(ValueError):
+            run_file(io.StringIO(f"{BB2}\nnonsense\n"), io.StringIO(), 100)
+
+    @pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"workers": 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            list(run_many([BB2], 10, **kwargs))
+
+
+class TestToMachine:
+
+    def test_runs_alike(self):
+        tm = to_machine(BB4)
+        assert tm.run_status(1000) is StepStatus.ACCEPTED
+        assert tm.register == "OK" and tm.blank == "0"
+
+    def test_stuck(self):
+        assert to_machine(STUCK).run_status(100) is StepStatus.STUCK
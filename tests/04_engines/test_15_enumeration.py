@@ -0,0 +1,82 @@
+"""
+Tests for the tree-normal-form enumeration (fsm_tools.enumeration).
+"""
+
+import itertools
+import multiprocessing
+
+import pytest
+
+from fsm_tools import StepStatus
+from fsm_tools.enumeration import enumerate_tnf, sweep
+from fsm_tools.notation import parse_standard, run_table
+
+
+def halting_steps(results):
+    return {steps for _, status, steps in results if status is StepStatus.ACCEPTED}
+
+
+def brute_force_halting_steps(n_states, n_symbols, max_steps):
+    """Step counts of every halting table, halting transition included."""
+    options = ["---", "1RZ"] + [
+        f"{write}{move}{state}"
+        for write in range(n_symbols)
+        for move in "LR"
+        for state in "ABCDE"[:n_states]
+    ]
+    counts = set()
+    for cells in itertools.product(options, repeat=n_states * n_symbols):
+        groups = [cells[start : start + n_symbols] for start in range(0, len(cells), n_symbols)]
+        status, steps = run_table(parse_standard("_".join(map("".join, groups))), max_steps)
+        if status is StepStatus.ACCEPTED:
+            counts.add(steps)
+        elif status is StepStatus.STUCK:
+            counts.add(steps + 1)
+    return counts
+
+
+class TestEnumerateTNF:
+
+    @pytest.mark.parametrize("n_states, n_symbols", [(1, 2), (2, 2), (1, 3)])
+    def test_same_step_counts_as_brute_force(self, n_states, n_symbols):
+        leaves = sweep(n_states, n_symbols, 100)
+        assert halting_steps(leaves) == brute_force_halting_steps(n_states, n_symbols, 100)
+
+    @pytest.mark.parametrize("n_states, n_symbols, champion", [(2, 2, 6), (3, 2, 21), (2, 3, 38)])
+    def test_busy_beaver(self, n_states, n_symbols, champion):
+        assert max(halting_steps(sweep(n_states, n_symbols, 100))) == champion
+
+    def test_canonical(self):
+        machines = list(enumerate_tnf(3, 2, 50))
+        assert len(machines) == len(set(machines))
+        for machine in machines:
+            assert machine[1:3] in ("RB", "RZ")
+            assert "C" not in machine or "B" in machine.split("C")[0]
+            assert "2" not in machine
+
+    def test_leaves_run_alike(self):
+        for machine, status, steps in sweep(3, 2, 60):
+            assert run_table(parse_standard(machine), 60) == (status, steps)
+            assert (status is StepStatus.RUNNING) == ("Z" not in machine)
+
+    def test_two_states(self):
+        assert "1RB1LB_1LA1RZ" in enumerate_tnf(2)
+
+    @pytest.mark.parametrize("n_states, n_symbols", [(0, 2), (27, 2), (2, 1), (2, 11)])
+    def test_invalid(self, n_states, n_symbols):
+        with pytest.raises(ValueError):
+            enumerate_tnf(n_states, n_symbols)
+
+
+class TestSweep:
+
+    def test_workers(self):
+        expected = list(sweep(3, 2, 50))
+        context = multiprocessing.get_context("fork")
+        results = sweep(3, 2, 50, workers=2, split=3, chunk_size=5, mp_context=context)
+        assert list(results) == expected
+        assert [machine for machine, _, _ in expected] == list(enumerate_tnf(3, 2, 50))
+
+    @pytest.mark.parametrize("split", [1, 2, 10])
+    def test_split(self, split):
+        assert list(sweep(2, 3, 50, split=split)) == list(sweep(2, 3, 50))
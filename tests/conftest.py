@@ -169,3 +169,105 @@ def elba_2d_instance(fsm_module):
         accept="OK",
         reject="nOK",
     )
+
+
+# ---------------------------------------------------------------------------
+# Configuration searches (function-scoped)
+# ---------------------------------------------------------------------------
+
+
+def _double_or_increment(n):
+    # Module-level, so that ParallelSearch workers can unpickle it.
+    return [n + 1, n * 2] if n < 5000 else []
+
+
+def _never(n):
+    return False
+
+
+@pytest.fixture
+def double_or_increment():
+    """Successors n + 1 and 2n of the integers below 5000; picklable."""
+    return _double_or_increment
+
+
+@pytest.fixture
+def never():
+    """Goal predicate that accepts no configuration; picklable."""
+    return _never
+
+
+@pytest.fixture
+def guess_ab(fsm_module):
+    """Nondeterministic TM accepting the words over {a, b} that contain 'ab'."""
+    tm = fsm_module.TuringMachine("GuessAB", movement={"R": [1], "L": [-1]}, register="q0")
+    tm.add_terminals("a", "b")
+    tm.add_transition("q0", "a", "q0", "a", "R")
+    tm.add_transition("q0", "b", "q0", "b", "R")
+    tm.add_transition("q0", "a", "q1", "a", "R")
+    tm.add_transition("q1", "b", "OK", "b", "R")
+    return tm
+
+
+# ---------------------------------------------------------------------------
+# Reference acceptors (function-scoped)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def even_a_tm(fsm_module):
+    """TuringMachine accepting the words of 'a' of even length."""
+    tm = fsm_module.TuringMachine("Even", movement={"R": [1]}, register="even")
+    tm.add_terminals("a")
+    tm.add_non_terminals("odd")
+    tm.add_transition("even", "a", "odd", "a", "R")
+    tm.add_transition("odd", "a", "even", "a", "R")
+    tm.add_transition("even", "_", "OK", "_", "R")
+    tm.add_transition("odd", "_", "nOK", "_", "R")
+    return tm
+
+
+@pytest.fixture
+def anbn_pda(fsm_module):
+    """PushdownAutomaton accepting aⁿbⁿ, n ≥ 1, by empty stack."""
+    pda = fsm_module.PushdownAutomaton(name="anbn", stack_alphabet={"A"})
+    pda.add_terminals("a", "b")
+    pda.set_register("q0")
+    pda.add_non_terminals("q1")
+    pda.add_transition("q0", "a", "Z", "q0", ["A", "Z"])
+    pda.add_transition("q0", "a", "A", "q0", ["A", "A"])
+    pda.add_transition("q0", "b", "A", "q1", [])
+    pda.add_transition("q1", "b", "A", "q1", [])
+    return pda
+
+
+# ---------------------------------------------------------------------------
+# Run engines (function-scoped factories)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def make_replace_tm(fsm_module):
+    """Factory of TuringMachines replacing ``length`` 'a' with 'b', then accepting."""
+
+    def make(length, **kwargs):
+        tm = fsm_module.TuringMachine("Replace", movement={"R": [1]}, register="q0", **kwargs)
+        tm.add_terminals("a", "b")
+        tm.add_transition("q0", "a", "q0", "b", "R")
+        tm.add_transition("q0", "_", "OK", "_", "R")
+        tm.set_tape(["a"] * length)
+        return tm
+
+    return make
+
+
+@pytest.fixture
+def make_forever_tm(fsm_module):
+    """Factory of TuringMachines moving right forever."""
+
+    def make(**kwargs):
+        tm = fsm_module.TuringMachine("Forever", movement={"R": [1]}, register="q0", **kwargs)
+        tm.add_transition("q0", "_", "q0", "_", "R")
+        return tm
+
+    return make